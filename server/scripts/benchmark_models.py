@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List
+
+# Add the project root directory to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from pydantic import TypeAdapter
+
+from src.api.responses import typed_response
+from src.models.tmdb_movie import TMDBMovieResponse, movie_list_adapter
+
+
+def make_page(size: int) -> List[Dict[str, Any]]:
+    """Build a TMDB-like list page with ids and genres already converted"""
+    return [
+        {
+            "id": str(100000 + index),
+            "title": f"Movie {index}",
+            "original_title": f"Movie {index}",
+            "overview": "An overview of the movie " * 8,
+            "poster_path": f"/poster{index}.jpg",
+            "backdrop_path": f"/backdrop{index}.jpg",
+            "release_date": f"20{random.randint(10, 24)}-0{random.randint(1, 9)}-1{random.randint(0, 9)}",
+            "genre_ids": [28, 12],
+            "genres": [{"id": 28, "name": "Action"}, {"id": 12, "name": "Adventure"}],
+            "adult": False,
+            "video": False,
+            "vote_average": round(random.uniform(0, 10), 1),
+            "vote_count": random.randint(0, 20000),
+            "popularity": round(random.uniform(0, 500), 3),
+            "original_language": "en"
+        }
+        for index in range(size)
+    ]
+
+
+def build_per_model(page: List[Dict[str, Any]]) -> List[TMDBMovieResponse]:
+    return [TMDBMovieResponse(**movie) for movie in page]
+
+
+def build_page(page: List[Dict[str, Any]]) -> List[TMDBMovieResponse]:
+    return movie_list_adapter.validate_python(page)
+
+
+def build_constructed(page: List[Dict[str, Any]]) -> List[TMDBMovieResponse]:
+    return [TMDBMovieResponse.model_construct(**movie) for movie in page]
+
+
+def respond_with_response_model(movies: List[TMDBMovieResponse]) -> bytes:
+    """What FastAPI does with a value returned for ``response_model``"""
+    content = [movie.model_dump(by_alias=True) for movie in movies]
+    validated = response_adapter.validate_python(content)
+    return json.dumps(
+        response_adapter.dump_python(validated, mode="json"),
+        ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def respond_typed(movies: List[TMDBMovieResponse]) -> bytes:
+    return typed_response(List[TMDBMovieResponse], movies).body
+
+
+def check_date_strptime(value: str):
+    datetime.strptime(value, "%Y-%m-%d")
+
+
+def check_date_fromisoformat(value: str):
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise ValueError
+    date.fromisoformat(value)
+
+
+response_adapter = TypeAdapter(List[TMDBMovieResponse])
+
+
+def run(name: str, call: Callable[[], Any], number: int, baseline: float = 0.0) -> float:
+    seconds = min(timeit.repeat(call, number=number, repeat=5)) / number
+    speedup = f"{baseline / seconds:5.2f}x" if baseline else "     "
+    print(f"  {name:<34} {seconds * 1e6:9.2f} us  {speedup}")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare CPU cost of building and serving TMDB movie list pages")
+    parser.add_argument("--page-size", type=int, default=20, help="Movies per page")
+    parser.add_argument("--number", type=int, default=500, help="Calls per timing run")
+    args = parser.parse_args()
+
+    page = make_page(args.page_size)
+    movies = build_page(page)
+    # Every path must produce the same JSON
+    assert respond_typed(movies) == respond_typed(build_per_model(page))
+    assert respond_typed(movies) == respond_typed(build_constructed(page))
+    assert json.loads(respond_typed(movies)) == json.loads(respond_with_response_model(movies))
+
+    print(f"Build a page of {args.page_size} movies")
+    baseline = run("one model per movie", lambda: build_per_model(page), args.number)
+    run("TypeAdapter over the page", lambda: build_page(page), args.number, baseline)
+    run("model_construct (no validation)", lambda: build_constructed(page), args.number, baseline)
+
+    print("Serve the page")
+    baseline = run("response_model round trip", lambda: respond_with_response_model(movies),
+                   args.number)
+    run("typed_response", lambda: respond_typed(movies), args.number, baseline)
+
+    print("Check one release date")
+    baseline = run("datetime.strptime", lambda: check_date_strptime("2024-05-17"),
+                   args.number * 100)
+    run("shape check + date.fromisoformat", lambda: check_date_fromisoformat("2024-05-17"),
+        args.number * 100, baseline)
+
+    print("Whole list request")
+    baseline = run("before", lambda: respond_with_response_model(build_per_model(page)),
+                   args.number)
+    run("after", lambda: respond_typed(build_page(page)), args.number, baseline)
+
+
+if __name__ == "__main__":
+    main()
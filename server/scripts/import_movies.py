@@ -1,45 +1,113 @@
 #!/usr/bin/env python3
+import argparse
 import asyncio
+import json
+import logging
 import os
 import sys
-from pathlib import Path
+from typing import Iterator, List, TextIO
 
-# Add src directory to Python path
-src_path = str(Path(__file__).parent.parent / "src")
-sys.path.append(src_path)
+# Add the project root directory to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
 
-from config.settings import get_settings
-from services import MovieService
+from src.database.connection import mongo
+from src.database.repositories.movie import MovieRepository
+from src.services.movie_import_service import MovieImportService
+from src.services.tmdb_client import tmdb_client
+from src.services.tmdb_rate_limiter import TMDBRateLimiter
+from src.services.tmdb_service import TMDBService
 
 
-async def import_movies(tmdb_ids: list[str]):
+def read_ids(lines: TextIO) -> Iterator[str]:
+    """Read one TMDB ID per line; TMDB export rows ({"id": ...}) are accepted too"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                yield str(json.loads(line)["id"])
+            except (ValueError, KeyError):
+                continue
+        elif line.isdigit():
+            yield line
+
+
+def collect_ids(args: argparse.Namespace) -> List[str]:
+    """Collect IDs from the arguments, the --file option and stdin"""
+    tmdb_ids = list(args.tmdb_ids)
+    if args.file:
+        with open(args.file) as f:
+            tmdb_ids.extend(read_ids(f))
+    if args.stdin or (not tmdb_ids and not sys.stdin.isatty()):
+        tmdb_ids.extend(read_ids(sys.stdin))
+    return tmdb_ids
+
+
+async def import_movies(args: argparse.Namespace, tmdb_ids: List[str]):
     """Import movies from TMDB API"""
-    settings = get_settings()
-    movie_service = MovieService()
-    
-    print(f"Starting import of {len(tmdb_ids)} movies...")
-    
-    for tmdb_id in tmdb_ids:
-        try:
-            print(f"Importing movie with TMDB ID: {tmdb_id}")
-            movie = await movie_service.import_movie_from_tmdb(tmdb_id)
-            if movie:
-                print(f"Successfully imported: {movie['title']}")
-            else:
-                print(f"Failed to import movie with TMDB ID: {tmdb_id}")
-        except Exception as e:
-            print(f"Error importing movie {tmdb_id}: {str(e)}")
-    
-    print("Import completed!")
+    await mongo.connect()
+    await tmdb_client.connect()
+    try:
+        movie_repository = MovieRepository(mongo.db)
+        await movie_repository.initialize()
+
+        if args.reset and args.checkpoint and os.path.exists(args.checkpoint):
+            os.remove(args.checkpoint)
+
+        # Imports use the bulk lane, so they only take spare TMDB capacity,
+        # and bypass the TMDB response caches; results only go to movies
+        service = MovieImportService(
+            TMDBService(priority=TMDBRateLimiter.BULK), movie_repository)
+        print(f"Starting import of {len(tmdb_ids)} movies...")
+        stats = await service.import_movies(
+            tmdb_ids,
+            concurrency=args.concurrency,
+            batch_size=args.batch_size,
+            checkpoint_path=args.checkpoint,
+            progress_interval=args.progress_interval
+        )
+        print(f"Processed {stats['requested']} movies in {stats['seconds']}s "
+              f"({stats['movies_per_second']} movies/s), "
+              f"skipped {stats['skipped']} already imported")
+        print(f"Imported: {stats['imported']}, not found: {stats['not_found']}, "
+              f"failed: {stats['failed']}")
+    finally:
+        await tmdb_client.close()
+        await mongo.close()
+
 
 def main():
     # Example usage: python import_movies.py 550 551 552
-    if len(sys.argv) < 2:
-        print("Usage: python import_movies.py <tmdb_id1> <tmdb_id2> ...")
+    #                python import_movies.py --file ids.txt
+    #                zcat movie_ids_05_15_2025.json.gz | python import_movies.py --stdin
+    parser = argparse.ArgumentParser(
+        description="Import movie details from TMDB into MongoDB. Failed IDs are "
+                    "retried on the next run; imported IDs are skipped.")
+    parser.add_argument("tmdb_ids", nargs="*", help="TMDB movie IDs")
+    parser.add_argument("--file", help="File with one ID (or TMDB export row) per line")
+    parser.add_argument("--stdin", action="store_true", help="Also read IDs from stdin")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="Concurrent TMDB requests (default: 8)")
+    parser.add_argument("--batch-size", type=int, default=500,
+                        help="Movies per bulk write (default: 500)")
+    parser.add_argument("--checkpoint", default="import_movies.checkpoint",
+                        help="Checkpoint file of imported IDs (default: import_movies.checkpoint)")
+    parser.add_argument("--reset", action="store_true",
+                        help="Ignore any existing checkpoint and import every ID")
+    parser.add_argument("--progress-interval", type=float, default=5.0,
+                        help="Seconds between progress reports (default: 5)")
+    args = parser.parse_args()
+
+    tmdb_ids = collect_ids(args)
+    if not tmdb_ids:
+        parser.print_usage()
         sys.exit(1)
-    
-    tmdb_ids = sys.argv[1:]
-    asyncio.run(import_movies(tmdb_ids))
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(import_movies(args, tmdb_ids))
+
 
 if __name__ == "__main__":
     main()
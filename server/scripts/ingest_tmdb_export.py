@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+# Add the project root directory to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.database.connection import mongo
+from src.database.repositories.movie import MovieRepository
+from src.services.catalog_ingest_service import CatalogIngestService
+
+
+async def ingest(args: argparse.Namespace):
+    """Stream a TMDB daily ID export file into the movies collection"""
+    await mongo.connect()
+    try:
+        movie_repository = MovieRepository(mongo.db)
+        await movie_repository.initialize()
+
+        if args.reset and os.path.exists(args.checkpoint):
+            os.remove(args.checkpoint)
+
+        service = CatalogIngestService(movie_repository)
+        stats = await service.ingest_export(
+            args.path,
+            batch_size=args.batch_size,
+            checkpoint_path=args.checkpoint,
+            progress_interval=args.progress_interval
+        )
+        print(f"Ingested {stats['rows']} rows in {stats['seconds']}s "
+              f"({stats['rows_per_second']} rows/s)")
+        print(f"Upserted: {stats['upserted']}, modified: {stats['modified']}, "
+              f"invalid lines: {stats['invalid']}, final offset: {stats['offset']}")
+    finally:
+        await mongo.close()
+
+
+def main():
+    # Example usage: python ingest_tmdb_export.py movie_ids_05_15_2025.json.gz
+    parser = argparse.ArgumentParser(
+        description="Ingest a TMDB daily ID export (.json or .json.gz) into MongoDB. "
+                    "Exports are published at http://files.tmdb.org/p/exports/")
+    parser.add_argument("path", help="Path to the export file")
+    parser.add_argument("--batch-size", type=int, default=1000,
+                        help="Rows per bulk write (default: 1000)")
+    parser.add_argument("--checkpoint", default=None,
+                        help="Checkpoint file (default: <path>.checkpoint)")
+    parser.add_argument("--reset", action="store_true",
+                        help="Ignore any existing checkpoint and start from the beginning")
+    parser.add_argument("--progress-interval", type=float, default=5.0,
+                        help="Seconds between progress reports (default: 5)")
+    args = parser.parse_args()
+    args.checkpoint = args.checkpoint or f"{args.path}.checkpoint"
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(ingest(args))
+
+
+if __name__ == "__main__":
+    main()
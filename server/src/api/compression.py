@@ -0,0 +1,155 @@
+import zlib
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip is always available
+    brotli = None
+
+# Supported encodings, preferred first
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Levels for responses compressed on every request
+LEVELS: Dict[str, int] = {
+    "br": settings.COMPRESSION_BROTLI_QUALITY,
+    "gzip": settings.COMPRESSION_GZIP_LEVEL
+}
+# Levels for cached payloads, which are compressed once
+CACHED_LEVELS: Dict[str, int] = {
+    "br": settings.COMPRESSION_CACHED_BROTLI_QUALITY,
+    "gzip": settings.COMPRESSION_CACHED_GZIP_LEVEL
+}
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/html", "text/plain")
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the supported encoding the client prefers, or None to send the body as is"""
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, *params = item.split(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    """Compress a whole body"""
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress(body) + compressor.flush()
+
+
+class StreamEncoder:
+    """Compress a body sent in chunks
+
+    Every chunk is flushed, so the client can decode each one as soon as it
+    arrives instead of waiting for the compressor's buffer to fill.
+    """
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=level)
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes, finish: bool = False) -> bytes:
+        if self.encoding == "br":
+            data = self._compressor.process(chunk)
+            return data + (self._compressor.finish() if finish else self._compressor.flush())
+        data = self._compressor.compress(chunk)
+        return data + self._compressor.flush(zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH)
+
+
+def add_vary_accept_encoding(headers: MutableHeaders):
+    vary = headers.get("vary")
+    if vary is None:
+        headers["vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["vary"] = f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """Compress responses with brotli or gzip, as negotiated by Accept-Encoding
+
+    Bodies sent in one message are compressed when they are at least
+    ``minimum_size`` bytes long. Streamed bodies, such as NDJSON listings,
+    are compressed chunk by chunk. Responses that already have a
+    Content-Encoding, like cached payloads sent pre-compressed, pass
+    through unchanged. Compressed responses get a weak ETag, since their
+    bytes differ from the ones the ETag was computed from.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = settings.COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start: Optional[Message] = None
+        encoder: Optional[StreamEncoder] = None
+
+        async def send_compressed(message: Message):
+            nonlocal start, encoder
+            if message["type"] == "http.response.start":
+                # Held back until the first body message shows the body size
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is None:
+                if encoder is not None:
+                    message["body"] = encoder.compress(body, finish=not more_body)
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            if ("content-encoding" not in headers
+                    and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)):
+                add_vary_accept_encoding(headers)
+                if encoding is not None and (more_body or len(body) >= self.minimum_size):
+                    if more_body:
+                        encoder = StreamEncoder(encoding, LEVELS[encoding])
+                        message["body"] = encoder.compress(body)
+                        del headers["content-length"]
+                    else:
+                        message["body"] = compress(body, encoding, LEVELS[encoding])
+                        headers["content-length"] = str(len(message["body"]))
+                    headers["content-encoding"] = encoding
+                    etag = headers.get("etag")
+                    if etag is not None and not etag.startswith("W/"):
+                        headers["etag"] = f"W/{etag}"
+            await send(start)
+            start = None
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
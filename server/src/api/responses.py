@@ -0,0 +1,309 @@
+import asyncio
+import hashlib
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import (Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List,
+                    Optional, Set, Tuple, Type)
+
+import orjson
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+from src.api.compression import (CACHED_LEVELS, ENCODINGS, compress,
+                                 negotiate_encoding)
+from src.config import settings
+from src.utils.cache import TTLCache
+
+# Serializers per response type, built on first use
+_adapters: Dict[Any, TypeAdapter] = {}
+
+
+def _adapter(response_type: Any) -> TypeAdapter:
+    adapter = _adapters.get(response_type)
+    if adapter is None:
+        adapter = _adapters[response_type] = TypeAdapter(response_type)
+    return adapter
+
+
+def typed_response(response_type: Any, content: Any, include: Any = None) -> Response:
+    """Serialize content that is already made of validated models
+
+    FastAPI dumps a returned value, validates it against the route's
+    ``response_model`` and only then serializes it. Routes returning typed
+    models skip the round trip with this and keep ``response_model`` for
+    the OpenAPI schema. ``include`` trims the output like pydantic's
+    ``include`` argument.
+    """
+    return Response(
+        _adapter(response_type).dump_json(content, include=include), media_type="application/json")
+
+
+def field_names(*models: Type[BaseModel]) -> List[str]:
+    """Names, or aliases, of the fields the given models send"""
+    names = {
+        field.alias or name
+        for model in models
+        for name, field in model.model_fields.items()
+        if not field.exclude
+    }
+    return sorted(names)
+
+
+def parse_fields(fields: Optional[str], allowed: List[str]) -> Optional[Set[str]]:
+    """Parse a comma-separated ``fields`` parameter, or return None for every field"""
+    if fields is None:
+        return None
+    selected = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = selected.difference(allowed)
+    if not selected or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid fields {fields!r}. Available fields: {', '.join(allowed)}"
+        )
+    return selected
+
+
+def cache_control(max_age: int, stale_while_revalidate: int) -> str:
+    """Build a Cache-Control value for a public, shareable response"""
+    return f"public, max-age={max_age}, stale-while-revalidate={stale_while_revalidate}"
+
+
+class PreparedBody:
+    """A serialized JSON body with its ready-made headers
+
+    The strong ETag is a hash of the body, so identical payloads get the
+    same ETag whenever they are rebuilt. ``last_modified`` is a Unix time,
+    sent as Last-Modified when given. ``compress`` adds a variant per
+    supported encoding, each a PreparedBody with a weak ETag.
+    """
+
+    __slots__ = ("body", "etag", "cache_control", "last_modified", "raw_headers",
+                 "validator_headers", "variants")
+
+    def __init__(
+        self,
+        body: bytes,
+        cache_control: Optional[str] = None,
+        last_modified: Optional[float] = None,
+        etag: Optional[str] = None,
+        content_encoding: Optional[str] = None
+    ):
+        self.body = body
+        self.etag = etag or f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        self.cache_control = cache_control
+        self.last_modified = last_modified
+        self.variants: Dict[str, "PreparedBody"] = {}
+        # Headers a 304 response repeats
+        self.validator_headers: List[Tuple[bytes, bytes]] = [
+            (b"etag", self.etag.encode("latin-1")),
+            (b"vary", b"Accept-Encoding")
+        ]
+        if cache_control is not None:
+            self.validator_headers.append((b"cache-control", cache_control.encode("latin-1")))
+        if last_modified is not None:
+            self.validator_headers.append(
+                (b"last-modified", formatdate(last_modified, usegmt=True).encode("latin-1")))
+        self.raw_headers: List[Tuple[bytes, bytes]] = [
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"content-type", b"application/json"),
+            *self.validator_headers
+        ]
+        if content_encoding is not None:
+            self.raw_headers.append((b"content-encoding", content_encoding.encode("latin-1")))
+
+    def compress(self):
+        """Build the compressed variants; runs in a worker thread"""
+        for encoding in ENCODINGS:
+            self.variants[encoding] = PreparedBody(
+                compress(self.body, encoding, CACHED_LEVELS[encoding]),
+                self.cache_control,
+                self.last_modified,
+                etag=f"W/{self.etag}",
+                content_encoding=encoding
+            )
+
+    @property
+    def size(self) -> int:
+        """Bytes held by the body and its variants"""
+        return len(self.body) + sum(len(variant.body) for variant in self.variants.values())
+
+    def is_fresh_for(self, request: Request) -> bool:
+        """Whether the client's conditional headers show it already has this body"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # If-None-Match takes precedence and compares weakly, ignoring W/
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag.removeprefix("W/") in tags
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have whole seconds
+        return int(self.last_modified) <= since
+
+
+class PreparedResponse(Response):
+    """Response sending a prepared body as it is, without encoding anything"""
+
+    media_type = "application/json"
+
+    def __init__(self, prepared: PreparedBody, status_code: int = 200):
+        self.status_code = status_code
+        self.background = None
+        self.body = prepared.body
+        # Copied, since middleware may add headers to this response
+        self.raw_headers = list(prepared.raw_headers)
+
+
+def _not_modified(prepared: PreparedBody) -> Response:
+    """304 Not Modified repeating the validators of a prepared body"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    response.raw_headers = list(prepared.validator_headers)
+    return response
+
+
+def _respond(request: Request, prepared: PreparedBody) -> Response:
+    """Send a prepared body, or 304 Not Modified when the client has it
+
+    The body is sent compressed when the client accepts one of its variants.
+    """
+    if prepared.variants:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+        prepared = prepared.variants.get(encoding, prepared)
+    if prepared.is_fresh_for(request):
+        return _not_modified(prepared)
+    return PreparedResponse(prepared)
+
+
+# Shared by every request in the process
+response_cache = TTLCache(settings.RESPONSE_CACHE_MAX_BYTES)
+
+
+def request_cache_key(request: Request) -> str:
+    """Key a response on the request path and its sorted query parameters"""
+    query = "&".join(sorted(f"{name}={value}" for name, value in request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+async def versioned_response(
+    request: Request,
+    response_type: Any,
+    version: Optional[Iterable[Any]],
+    produce: Callable[[], Awaitable[Any]],
+    last_modified: Optional[float] = None,
+    cache_control: Optional[str] = None,
+    include: Any = None
+) -> Response:
+    """Serve typed content with an ETag derived from cheap version data
+
+    ``version`` must change whenever the content does, e.g. a row count and
+    the latest update time. The ETag hashes it with the request path and
+    query, so a client holding the current content gets 304 Not Modified
+    before ``produce`` runs or anything is serialized. ``last_modified`` is
+    a Unix time, sent as Last-Modified when given.
+
+    A None ``version`` marks content that must not be reused, such as a
+    body built around a failed upstream call; it is sent without validators
+    and with ``Cache-Control: no-store``.
+    """
+    if version is None:
+        response = typed_response(response_type, await produce(), include)
+        response.headers["cache-control"] = "no-store"
+        return response
+    key = repr((request_cache_key(request), *version)).encode()
+    validators = PreparedBody(
+        b"", cache_control, last_modified,
+        etag=f'"{hashlib.blake2b(key, digest_size=16).hexdigest()}"')
+    if validators.is_fresh_for(request):
+        return _not_modified(validators)
+    return PreparedResponse(PreparedBody(
+        _adapter(response_type).dump_json(await produce(), include=include),
+        cache_control, last_modified, etag=validators.etag))
+
+
+async def cached_response(
+    request: Request,
+    response_type: Any,
+    ttl: int,
+    produce: Callable[[], Awaitable[Any]],
+    cache_control: Optional[str] = None,
+    include: Any = None
+) -> Response:
+    """Serve a route's JSON from the response cache, producing it on a miss
+
+    A hit sends the stored bytes and headers directly, or 304 Not Modified
+    when the client's ETag matches; ``produce``, serialization and
+    compression only run on a miss. Errors raised by ``produce`` are not
+    cached.
+    """
+    key = request_cache_key(request)
+    prepared = response_cache.get(key)
+    if prepared is None:
+        prepared = PreparedBody(
+            _adapter(response_type).dump_json(await produce(), include=include),
+            cache_control, time.time())
+        if len(prepared.body) >= settings.COMPRESSION_MIN_SIZE:
+            await asyncio.to_thread(prepared.compress)
+        response_cache.set(key, prepared, ttl, size=prepared.size)
+    return _respond(request, prepared)
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+# OpenAPI entry for routes that can also stream NDJSON
+NDJSON_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {"content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}}}
+}
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Whether the client asked for a newline-delimited JSON stream"""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def check_json_limit(request: Request, limit: int, max_limit: int):
+    """Reject limits above ``max_limit`` unless the response is streamed as NDJSON"""
+    if limit > max_limit and not wants_ndjson(request):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"limit may exceed {max_limit} only with Accept: {NDJSON_MEDIA_TYPE}"
+        )
+
+
+def _ndjson_line(document: Any) -> bytes:
+    # ObjectIds and other BSON types are sent as strings
+    return orjson.dumps(document, default=str) + b"\n"
+
+
+async def _ndjson_chunks(first: Any, documents: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    # The first document goes out on its own, the rest in chunks of
+    # NDJSON_CHUNK_BYTES. Each chunk is produced once the server has sent
+    # the previous one, so a slow client slows down the cursor.
+    yield _ndjson_line(first)
+    buffer = bytearray()
+    async for document in documents:
+        buffer += _ndjson_line(document)
+        if len(buffer) >= settings.NDJSON_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def ndjson_response(documents: AsyncIterator[Any]) -> Response:
+    """Stream documents as newline-delimited JSON, one document per line
+
+    The first document is read before the response starts, so a failing
+    query still gets a normal error response. A failure later on ends the
+    stream early.
+    """
+    try:
+        first = await documents.__anext__()
+    except StopAsyncIteration:
+        return Response(b"", media_type=NDJSON_MEDIA_TYPE)
+    return StreamingResponse(_ndjson_chunks(first, documents), media_type=NDJSON_MEDIA_TYPE)
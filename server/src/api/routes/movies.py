@@ -1,10 +1,18 @@
 from enum import Enum
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
 
-from src.models import (TMDBMovieCreditsResponse, TMDBMovieDetailResponse,
-                        TMDBMovieResponse, TMDBMovieVideosResponse, TMDBReview)
+from src.models import (MovieSuggestion, TMDBMovieBatchItem,
+                        TMDBMovieBatchRequest, TMDBMovieDetailResponse,
+                        TMDBMovieResponse)
+from src.api.responses import (cache_control, cached_response, field_names,
+                               parse_fields, typed_response)
+from src.config import settings
+from src.database.connection import mongo
+from src.database.repositories.movie import MovieRepository
+from src.services.movie_autocomplete import movie_autocomplete
+from src.services.movie_service import MovieService
 from src.services.tmdb_service import TMDBService
 from src.utils import MovieNotFoundError, RateLimitError, UnauthorizedError
 
@@ -12,8 +20,21 @@ from src.utils import MovieNotFoundError, RateLimitError, UnauthorizedError
 def get_tmdb_service():
     return TMDBService()
 
+def get_movie_service():
+    # Without a database connection MovieService reads from TMDB only
+    movie_repository = MovieRepository(mongo.db) if mongo.db is not None else None
+    return MovieService(TMDBService(), movie_repository)
+
 router = APIRouter(tags=["movies"])
 
+LISTS_CACHE_CONTROL = cache_control(settings.HTTP_CACHE_LISTS_MAX_AGE, settings.HTTP_CACHE_LISTS_SWR)
+MOVIE_CACHE_CONTROL = cache_control(settings.HTTP_CACHE_MOVIE_MAX_AGE, settings.HTTP_CACHE_MOVIE_SWR)
+GENRES_CACHE_CONTROL = cache_control(settings.HTTP_CACHE_GENRES_MAX_AGE, settings.HTTP_CACHE_GENRES_SWR)
+
+MOVIE_FIELDS = field_names(TMDBMovieResponse)
+MOVIE_DETAIL_FIELDS = field_names(TMDBMovieDetailResponse)
+FIELDS_DESCRIPTION = "Comma-separated fields to return, e.g. id,title,poster_path,vote_average"
+
 class SortBy(str, Enum):
     """Sort by options for movies"""
     POPULARITY = "popularity"
@@ -34,6 +55,7 @@ class SortBy(str, Enum):
     }
 )
 async def get_movies(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of movies to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of movies to return"),
     genre: Optional[str] = Query(None, description="Filter movies by genre"),
@@ -41,18 +63,26 @@ async def get_movies(
         None,
         description="Sort movies by the specified criteria"
     ),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     tmdb_service: TMDBService = Depends(get_tmdb_service)
 ):
     """Get a list of movies with optional filtering and sorting."""
-    try:
+    selected = parse_fields(fields, MOVIE_FIELDS)
+
+    async def load_movies() -> List[TMDBMovieResponse]:
         if genre:
-            return await tmdb_service.get_movies_by_genre(genre, limit)
+            return await tmdb_service.get_movies_by_genre(genre, skip, limit)
         elif sort_by == SortBy.VOTE_AVERAGE:
-            return await tmdb_service.get_top_rated_movies(limit)
+            return await tmdb_service.get_top_rated_movies(skip, limit)
         elif sort_by == SortBy.RELEASE_DATE:
-            return await tmdb_service.get_latest_movies(limit)
+            return await tmdb_service.get_latest_movies(skip, limit)
         else:
-            return await tmdb_service.get_popular_movies(limit)
+            return await tmdb_service.get_popular_movies(skip, limit)
+
+    try:
+        return await cached_response(
+            request, List[TMDBMovieResponse], settings.RESPONSE_CACHE_TTL_LISTS, load_movies,
+            LISTS_CACHE_CONTROL, include={"__all__": selected} if selected else None)
     except UnauthorizedError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -71,6 +101,24 @@ async def get_movies(
             detail=f"Error retrieving movies: {str(e)}"
         )
 
+@router.get(
+    "/movies/autocomplete",
+    response_model=List[MovieSuggestion],
+    summary="Autocomplete movie titles",
+    description="Suggest movies whose title, or a word in it, starts with the query. "
+                "Served from an in-memory index of the local catalog, most popular first; never calls TMDB.",
+    responses={
+        200: {"description": "Suggestions retrieved successfully"},
+        400: {"description": "Invalid parameters"}
+    }
+)
+async def autocomplete_movies(
+    q: str = Query(..., min_length=1, description="Title prefix typed so far"),
+    limit: int = Query(10, ge=1, le=20, description="Maximum number of suggestions to return")
+):
+    """Suggest movie titles as the user types."""
+    return movie_autocomplete.search(q, limit)
+
 @router.get(
     "/movies/search",
     response_model=List[TMDBMovieResponse],
@@ -85,6 +133,7 @@ async def get_movies(
     }
 )
 async def search_movies(
+    request: Request,
     q: str = Query(..., min_length=1, description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     language: str = Query("en-US", description="Language code"),
@@ -97,21 +146,28 @@ async def search_movies(
         None,
         description="Sort by field (e.g., popularity.desc, release_date.desc, vote_average.desc)"
     ),
-    tmdb_service: TMDBService = Depends(get_tmdb_service)
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    movie_service: MovieService = Depends(get_movie_service)
 ):
     """Search for movies with various filters and sorting options."""
+    selected = parse_fields(fields, MOVIE_FIELDS)
     try:
-        return await tmdb_service.search_movies(
-            query=q,
-            page=page,
-            language=language,
-            include_adult=include_adult,
-            year=year,
-            primary_release_year=primary_release_year,
-            region=region,
-            with_genres=with_genres,
-            sort_by=sort_by
-        )
+        # Repeated searches, and 304s, are answered without searching again
+        return await cached_response(
+            request, List[TMDBMovieResponse], settings.RESPONSE_CACHE_TTL_SEARCH,
+            lambda: movie_service.search_movies(
+                query=q,
+                page=page,
+                language=language,
+                include_adult=include_adult,
+                year=year,
+                primary_release_year=primary_release_year,
+                region=region,
+                with_genres=with_genres,
+                sort_by=sort_by,
+                fields=selected
+            ),
+            LISTS_CACHE_CONTROL, include={"__all__": selected} if selected else None)
     except UnauthorizedError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -132,7 +188,8 @@ async def search_movies(
     "/movies/tmdb/{tmdb_id}",
     response_model=TMDBMovieDetailResponse,
     summary="Get movie by TMDB ID",
-    description="Retrieve detailed information about a movie using its TMDB ID.",
+    description="Retrieve detailed information about a movie using its TMDB ID. "
+                "Use fields to get only part of it, e.g. for a movie card.",
     responses={
         200: {"description": "Movie found successfully"},
         404: {"description": "Movie not found"},
@@ -142,18 +199,32 @@ async def search_movies(
     }
 )
 async def get_movie_by_tmdb_id(
+    request: Request,
     tmdb_id: str = Path(..., description="TMDB ID of the movie"),
-    tmdb_service: TMDBService = Depends(get_tmdb_service)
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    movie_service: MovieService = Depends(get_movie_service)
 ):
     """Get a movie by TMDB ID."""
-    try:
-        movie = await tmdb_service.get_movie_with_details(tmdb_id)
+    selected = parse_fields(fields, MOVIE_DETAIL_FIELDS)
+
+    async def load_movie() -> TMDBMovieDetailResponse:
+        movie = await movie_service.get_movie_with_details(tmdb_id, selected)
         if not movie:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Movie not found"
             )
         return movie
+
+    try:
+        return await cached_response(
+            request, TMDBMovieDetailResponse, settings.RESPONSE_CACHE_TTL_MOVIE, load_movie,
+            MOVIE_CACHE_CONTROL, include=selected)
+    except MovieNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Movie not found"
+        )
     except UnauthorizedError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -172,6 +243,35 @@ async def get_movie_by_tmdb_id(
             detail=f"Error retrieving movie: {str(e)}"
         )
 
+@router.post(
+    "/movies/batch",
+    response_model=List[TMDBMovieBatchItem],
+    summary="Get many movies by TMDB ID",
+    description="Retrieve basic information for up to 100 movies in one request. "
+                "Results are returned in request order, with a per-movie error for IDs that could not be loaded.",
+    responses={
+        200: {"description": "Batch processed successfully"},
+        400: {"description": "Invalid parameters"},
+        500: {"description": "Internal server error"}
+    }
+)
+async def get_movies_batch(
+    batch: TMDBMovieBatchRequest,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    movie_service: MovieService = Depends(get_movie_service)
+):
+    """Get basic information for many movies at once."""
+    selected = parse_fields(fields, MOVIE_FIELDS)
+    try:
+        items = await movie_service.get_movies(batch.ids, selected)
+        include = {"__all__": {"id": True, "error": True, "movie": selected}} if selected else None
+        return typed_response(List[TMDBMovieBatchItem], items, include)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving movies: {str(e)}"
+        )
+
 @router.get(
     "/genres",
     response_model=List[str],
@@ -185,12 +285,18 @@ async def get_movie_by_tmdb_id(
     }
 )
 async def get_genres(
+    request: Request,
     tmdb_service: TMDBService = Depends(get_tmdb_service)
 ):
     """Get a list of all unique genres."""
-    try:
+    async def load_genres() -> List[str]:
         genres = await tmdb_service.get_genres()
         return [genre["name"] for genre in genres]
+
+    try:
+        return await cached_response(
+            request, List[str], settings.RESPONSE_CACHE_TTL_GENRES, load_genres,
+            GENRES_CACHE_CONTROL)
     except UnauthorizedError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
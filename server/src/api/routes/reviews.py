@@ -1,10 +1,16 @@
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
 from fastapi.security import OAuth2PasswordBearer
 
+from src.api.responses import (NDJSON_RESPONSES, cache_control,
+                               check_json_limit, field_names,
+                               ndjson_response, parse_fields,
+                               versioned_response, wants_ndjson)
+from src.config import settings
 from src.database.repositories.user import UserRepository
-from src.models import Review, ReviewCreate, ReviewUpdate, User
+from src.models import Review, ReviewCreate, ReviewUpdate, TMDBReview, User
 from src.services import AuthService, ReviewService
 from src.services.user_service import UserService
 from src.utils.exceptions import (ResourceNotFoundError, UnauthorizedError,
@@ -22,6 +28,33 @@ router = APIRouter(
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
+REVIEWS_CACHE_CONTROL = cache_control(
+    settings.HTTP_CACHE_REVIEWS_MAX_AGE, settings.HTTP_CACHE_REVIEWS_SWR)
+
+REVIEW_FIELDS = field_names(Review)
+MOVIE_REVIEW_FIELDS = field_names(Review, TMDBReview)
+FIELDS_DESCRIPTION = "Comma-separated review fields to return, e.g. rating,comment; _id is always returned"
+
+def review_validators(
+    version: Tuple[int, Optional[datetime]],
+    include_tmdb: bool = False,
+    tmdb_version: Any = None
+) -> Tuple[Optional[List[Any]], Optional[float]]:
+    """Version data and Last-Modified time for a response built from a movie's reviews
+
+    With ``include_tmdb`` the response also holds TMDB data, and
+    ``tmdb_version`` is that data itself, or None when TMDB failed and the
+    response must not be reused. TMDB data has no modification time, so no
+    Last-Modified is sent for it.
+    """
+    count, changed_at = version
+    last_modified = changed_at.timestamp() if changed_at is not None else None
+    if not include_tmdb:
+        return [count, last_modified], last_modified
+    if tmdb_version is None:
+        return None, None
+    return [count, last_modified, tmdb_version], None
+
 async def get_review_service() -> ReviewService:
     return ReviewService()
 
@@ -76,23 +109,52 @@ async def add_review(
 @router.get(
     "/{movie_id}/reviews",
     response_model=Dict[str, Any],
+    responses=NDJSON_RESPONSES,
     summary="Get movie reviews",
-    description="Get all reviews for a movie from both TMDB and our database with pagination."
+    description="Get all reviews for a movie from both TMDB and our database with pagination. "
+                "With Accept: application/x-ndjson, the reviews from our database are streamed "
+                "one per line instead, and limit may go above 50."
 )
 async def get_movie_reviews(
+    request: Request,
     movie_id: str,
     skip: int = Query(0, ge=0),
-    limit: int = Query(10, ge=1, le=50),
+    limit: int = Query(10, ge=1, le=settings.NDJSON_MAX_LIMIT),
     include_tmdb: bool = Query(True),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     review_service: ReviewService = Depends(get_review_service)
 ) -> Dict[str, Any]:
     """Get reviews for a movie from both TMDB and our database"""
+    check_json_limit(request, limit, 50)
+    selected = parse_fields(fields, MOVIE_REVIEW_FIELDS)
     try:
-        return await review_service.get_movie_reviews(
-            movie_id=movie_id,
-            skip=skip,
-            limit=limit,
-            include_tmdb=include_tmdb
+        if wants_ndjson(request):
+            return await ndjson_response(review_service.stream_movie_reviews(
+                movie_id, skip=skip, limit=limit, fields=selected))
+        # Answer 304 from the review count, latest change and the TMDB page
+        # (served from the TMDB cache) before loading our reviews
+        db_version = await review_service.get_movie_reviews_version(movie_id)
+        tmdb_reviews = tmdb_version = None
+        if include_tmdb:
+            tmdb_reviews = await review_service.get_tmdb_reviews(movie_id, skip, limit)
+            if tmdb_reviews is not None:
+                tmdb_version = (
+                    tmdb_reviews[1], [review.model_dump() for review in tmdb_reviews[0]])
+        version, last_modified = review_validators(db_version, include_tmdb, tmdb_version)
+        return await versioned_response(
+            request,
+            Dict[str, Any],
+            version,
+            lambda: review_service.get_movie_reviews(
+                movie_id=movie_id,
+                skip=skip,
+                limit=limit,
+                include_tmdb=include_tmdb,
+                fields=selected,
+                tmdb_reviews=tmdb_reviews
+            ),
+            last_modified,
+            REVIEWS_CACHE_CONTROL
         )
     except ValidationError as e:
         raise HTTPException(
@@ -112,12 +174,24 @@ async def get_movie_reviews(
     description="Get the average rating for a movie from both TMDB and our database."
 )
 async def get_movie_average_rating(
+    request: Request,
     movie_id: str,
     review_service: ReviewService = Depends(get_review_service)
 ) -> Dict[str, Any]:
     """Get average rating from both TMDB and our database"""
     try:
-        return await review_service.get_movie_average_rating(movie_id)
+        db_version = await review_service.get_movie_reviews_version(movie_id)
+        tmdb_movie = await review_service.get_tmdb_movie(movie_id)
+        version, last_modified = review_validators(
+            db_version, True, (tmdb_movie.vote_average,) if tmdb_movie is not None else None)
+        return await versioned_response(
+            request,
+            Dict[str, Any],
+            version,
+            lambda: review_service.get_movie_average_rating(movie_id, tmdb_movie),
+            last_modified,
+            REVIEWS_CACHE_CONTROL
+        )
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -205,25 +279,41 @@ async def update_review(
 
 @router.get("/users/me/reviews", 
             response_model=List[Dict[str, Any]],
+            responses=NDJSON_RESPONSES,
             summary="Get all reviews for the current user",
-            description="Get all reviews for the current user"
+            description="Get all reviews for the current user. With Accept: application/x-ndjson "
+                        "they are streamed one per line, and limit may go above 50."
 )
 async def get_my_reviews(
+    request: Request,
     skip: int = Query(0, ge=0),
-    limit: int = Query(10, ge=1, le=50),
+    limit: int = Query(10, ge=1, le=settings.NDJSON_MAX_LIMIT),
     sort_by: str = Query("created_at", regex=r"^(created_at|rating|updated_at)$"),
     sort_order: int = Query(-1, ge=-1, le=1),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     review_service: ReviewService = Depends(get_review_service),
     current_user: User = Depends(get_current_user)
 ) -> List[Dict[str, Any]]:
     """Get all reviews for the current user"""
+    check_json_limit(request, limit, 50)
+    selected = parse_fields(fields, REVIEW_FIELDS)
     try:
+        if wants_ndjson(request):
+            return await ndjson_response(review_service.stream_user_reviews(
+                user_id=str(current_user.id),
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                fields=selected
+            ))
         return await review_service.get_user_reviews(
             user_id=str(current_user.id),
             skip=skip,
             limit=limit,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            fields=selected
         )
     except Exception as e:
         raise HTTPException(
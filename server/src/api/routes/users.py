@@ -1,8 +1,9 @@
 from typing import List, Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 
+from src.api.responses import NDJSON_RESPONSES, ndjson_response, wants_ndjson
 from src.database.repositories.user import UserRepository
 from src.models.user import User, UserCreate, UserLogin, UserUpdate
 from src.services.auth_service import AuthService
@@ -76,19 +77,26 @@ async def register_admin_user(
         )
 
 # List all users (admin only)
-@router.get("/", response_model=List[User])
+@router.get("/", response_model=List[User], responses=NDJSON_RESPONSES)
 async def list_users(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(get_current_user)
 ):
-    """List all users (admin only)"""
+    """List all users (admin only)
+
+    With ``Accept: application/x-ndjson`` users are streamed one per line,
+    so exports of any size use little memory.
+    """
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to list users"
         )
     user_service = get_user_service()
+    if wants_ndjson(request):
+        return await ndjson_response(user_service.stream_users(skip=skip, limit=limit))
     return await user_service.list_users(skip=skip, limit=limit)
 
 # Get current user information
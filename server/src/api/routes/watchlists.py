@@ -1,11 +1,15 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.security import OAuth2PasswordBearer
 
+from src.api.responses import (NDJSON_RESPONSES, check_json_limit,
+                               field_names, ndjson_response, parse_fields,
+                               wants_ndjson)
+from src.config import settings
 from src.models.user import User
-from src.models.watchlist import (WatchlistCreate, WatchlistMovie,
-                                  WatchlistUpdate)
+from src.models.watchlist import (Watchlist, WatchlistCreate,
+                                  WatchlistMovie, WatchlistUpdate)
 from src.services import WatchlistService
 from src.services.auth_service import AuthService
 from src.utils.exceptions import (ResourceNotFoundError, UnauthorizedError,
@@ -13,6 +17,10 @@ from src.utils.exceptions import (ResourceNotFoundError, UnauthorizedError,
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
+# Stored watchlists are returned with their MongoDB _id rather than id
+WATCHLIST_FIELDS = sorted("_id" if name == "id" else name for name in field_names(Watchlist))
+FIELDS_DESCRIPTION = "Comma-separated watchlist fields to return, e.g. name,is_public; _id is always returned"
+
 def get_watchlist_service():
     return WatchlistService()
 
@@ -74,21 +82,35 @@ async def create_watchlist(
 @router.get(
     "",
     response_model=List[Dict[str, Any]],
+    responses=NDJSON_RESPONSES,
     summary="Get user's watchlists",
-    description="Get all watchlists for the current user with pagination."
+    description="Get all watchlists for the current user with pagination. With Accept: "
+                "application/x-ndjson they are streamed one per line, and limit may go above 50."
 )
 async def get_user_watchlists(
+    request: Request,
     skip: int = Query(0, ge=0),
-    limit: int = Query(10, ge=1, le=50),
+    limit: int = Query(10, ge=1, le=settings.NDJSON_MAX_LIMIT),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     watchlist_service: WatchlistService = Depends(get_watchlist_service),
     current_user: User = Depends(get_current_user)
 ) -> List[Dict[str, Any]]:
     """Get all watchlists for the current user"""
+    check_json_limit(request, limit, 50)
+    selected = parse_fields(fields, WATCHLIST_FIELDS)
     try:
+        if wants_ndjson(request):
+            return await ndjson_response(watchlist_service.stream_user_watchlists(
+                user_id=current_user.id,
+                skip=skip,
+                limit=limit,
+                fields=selected
+            ))
         return await watchlist_service.get_user_watchlists(
             user_id=current_user.id,
             skip=skip,
-            limit=limit
+            limit=limit,
+            fields=selected
         )
     except Exception as e:
         raise HTTPException(
@@ -99,17 +121,26 @@ async def get_user_watchlists(
 @router.get(
     "/public",
     response_model=List[Dict[str, Any]],
+    responses=NDJSON_RESPONSES,
     summary="Get public watchlists",
-    description="Get all public watchlists with pagination."
+    description="Get all public watchlists with pagination. With Accept: application/x-ndjson "
+                "they are streamed one per line, and limit may go above 50."
 )
 async def get_public_watchlists(
+    request: Request,
     skip: int = Query(0, ge=0),
-    limit: int = Query(10, ge=1, le=50),
+    limit: int = Query(10, ge=1, le=settings.NDJSON_MAX_LIMIT),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     watchlist_service: WatchlistService = Depends(get_watchlist_service)
 ) -> List[Dict[str, Any]]:
     """Get all public watchlists"""
+    check_json_limit(request, limit, 50)
+    selected = parse_fields(fields, WATCHLIST_FIELDS)
     try:
-        return await watchlist_service.get_public_watchlists(skip, limit)
+        if wants_ndjson(request):
+            return await ndjson_response(
+                watchlist_service.stream_public_watchlists(skip, limit, selected))
+        return await watchlist_service.get_public_watchlists(skip, limit, selected)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -124,14 +155,17 @@ async def get_public_watchlists(
 )
 async def get_watchlist(
     watchlist_id: str,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     watchlist_service: WatchlistService = Depends(get_watchlist_service),
     current_user: User = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """Get a specific watchlist"""
+    selected = parse_fields(fields, WATCHLIST_FIELDS)
     try:
         watchlist = await watchlist_service.get_watchlist(
             watchlist_id=watchlist_id,
-            user_id=current_user.id
+            user_id=current_user.id,
+            fields=selected
         )
         if not watchlist:
             raise ResourceNotFoundError("Watchlist not found")
@@ -28,6 +28,111 @@ class Settings(BaseSettings):
     TMDB_ACCESS_TOKEN: Optional[str] = Field(default=None)
     TMDB_API_BASE_URL: str = Field(default="https://api.themoviedb.org/3")
 
+    # TMDB HTTP client settings (shared connection pool)
+    TMDB_HTTP_TIMEOUT: float = Field(default=10.0)
+    TMDB_HTTP_CONNECT_TIMEOUT: float = Field(default=5.0)
+    TMDB_HTTP_MAX_CONNECTIONS: int = Field(default=100)
+    TMDB_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(default=20)
+    TMDB_HTTP_KEEPALIVE_EXPIRY: float = Field(default=30.0)
+    TMDB_HTTP2: bool = Field(default=True)
+
+    # TMDB rate limiting (token bucket, requests per second and burst size)
+    TMDB_RATE_LIMIT_RPS: float = Field(default=40.0)
+    TMDB_RATE_LIMIT_BURST: int = Field(default=40)
+    # Tokens the prefetch and bulk lanes must leave in the bucket for the
+    # lanes above them; each must be at most the burst size minus one
+    TMDB_PREFETCH_RESERVE: float = Field(default=10.0)
+    TMDB_BULK_RESERVE: float = Field(default=20.0)
+
+    # TMDB response cache (sizes in bytes, TTLs in seconds)
+    TMDB_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024)
+    TMDB_CACHE_MONGO_ENABLED: bool = Field(default=True)
+    # How long an entry may be served stale after its TTL while it is refreshed
+    TMDB_CACHE_MAX_STALE: int = Field(default=24 * 60 * 60)
+
+    TMDB_CACHE_TTL_GENRES: int = Field(default=24 * 60 * 60)
+    TMDB_CACHE_TTL_MOVIE: int = Field(default=6 * 60 * 60)
+    TMDB_CACHE_TTL_REVIEWS: int = Field(default=60 * 60)
+    TMDB_CACHE_TTL_LISTS: int = Field(default=10 * 60)
+    TMDB_CACHE_TTL_SEARCH: int = Field(default=15 * 60)
+
+    # TMDB retries: total attempts per call, full-jitter exponential backoff
+    # (seconds), and a process-wide retry budget as a fraction of requests
+    TMDB_RETRY_MAX_ATTEMPTS: int = Field(default=3)
+    TMDB_RETRY_BASE_DELAY: float = Field(default=0.2)
+    TMDB_RETRY_MAX_DELAY: float = Field(default=5.0)
+    TMDB_RETRY_BUDGET_RATIO: float = Field(default=0.1)
+    TMDB_RETRY_BUDGET_MIN_PER_SECOND: float = Field(default=1.0)
+    TMDB_RETRY_BUDGET_CAPACITY: float = Field(default=20.0)
+
+    # Cache warmer: pages of each home page list to keep cached, and the
+    # intervals in seconds between list and genre refreshes (the list
+    # interval should stay below TMDB_CACHE_TTL_LISTS)
+    TMDB_WARMER_PAGES: int = Field(default=3)
+    TMDB_WARMER_LIST_INTERVAL: int = Field(default=5 * 60)
+    TMDB_GENRE_REFRESH_INTERVAL: int = Field(default=6 * 60 * 60)
+
+    # TMDB request hedging: a slow call is duplicated once it has run longer
+    # than this percentile of recent latencies (and at least the min delay)
+    TMDB_HEDGE_ENABLED: bool = Field(default=False)
+    TMDB_HEDGE_PERCENTILE: float = Field(default=95.0)
+    TMDB_HEDGE_MIN_DELAY: float = Field(default=0.05)
+    TMDB_HEDGE_MIN_SAMPLES: int = Field(default=20)
+    TMDB_HEDGE_WINDOW: int = Field(default=500)
+
+    # Maximum concurrent upstream lookups for a batch movie request
+    TMDB_BATCH_CONCURRENCY: int = Field(default=8)
+
+    # Local movie catalog: documents older than this (in seconds) are
+    # refreshed from TMDB before being served
+    MOVIE_CATALOG_MAX_AGE: int = Field(default=24 * 60 * 60)
+    # Local movie search answers without TMDB only when it finds at least
+    # this many matches (capped at a full TMDB page)
+    MOVIE_SEARCH_LOCAL_MIN_RESULTS: int = Field(default=20)
+
+    # Title autocomplete: seconds between syncs with the movies collection,
+    # results per prefix and number of cached prefix rankings
+    MOVIE_AUTOCOMPLETE_SYNC_INTERVAL: int = Field(default=60)
+    MOVIE_AUTOCOMPLETE_MAX_RESULTS: int = Field(default=20)
+    MOVIE_AUTOCOMPLETE_CACHE_SIZE: int = Field(default=10000)
+    # Syncs changing more movies than this rebuild the index in a worker
+    # thread instead of updating it in place on the event loop
+    MOVIE_AUTOCOMPLETE_SYNC_BATCH: int = Field(default=200)
+
+    # Pre-serialized API responses (size in bytes, TTLs in seconds). TTLs
+    # stay short, since the data behind them has its own caches
+    RESPONSE_CACHE_MAX_BYTES: int = Field(default=32 * 1024 * 1024)
+    RESPONSE_CACHE_TTL_LISTS: int = Field(default=60)
+    RESPONSE_CACHE_TTL_SEARCH: int = Field(default=60)
+    RESPONSE_CACHE_TTL_MOVIE: int = Field(default=5 * 60)
+    RESPONSE_CACHE_TTL_GENRES: int = Field(default=60 * 60)
+
+    # HTTP caching: Cache-Control max-age and stale-while-revalidate
+    # (seconds) sent to clients and the CDN, per kind of response
+    HTTP_CACHE_LISTS_MAX_AGE: int = Field(default=60)
+    HTTP_CACHE_LISTS_SWR: int = Field(default=5 * 60)
+    HTTP_CACHE_MOVIE_MAX_AGE: int = Field(default=5 * 60)
+    HTTP_CACHE_MOVIE_SWR: int = Field(default=60 * 60)
+    HTTP_CACHE_GENRES_MAX_AGE: int = Field(default=60 * 60)
+    HTTP_CACHE_GENRES_SWR: int = Field(default=24 * 60 * 60)
+    HTTP_CACHE_REVIEWS_MAX_AGE: int = Field(default=30)
+    HTTP_CACHE_REVIEWS_SWR: int = Field(default=2 * 60)
+
+    # Response compression: minimum body size (bytes) and gzip/brotli levels
+    # for responses compressed per request and for cached payloads, which
+    # are compressed once
+    COMPRESSION_MIN_SIZE: int = Field(default=1024)
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6)
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=4)
+    COMPRESSION_CACHED_GZIP_LEVEL: int = Field(default=9)
+    COMPRESSION_CACHED_BROTLI_QUALITY: int = Field(default=9)
+
+    # NDJSON streaming (Accept: application/x-ndjson): documents per MongoDB
+    # cursor batch, bytes per chunk sent and the largest limit a stream takes
+    NDJSON_BATCH_SIZE: int = Field(default=500)
+    NDJSON_CHUNK_BYTES: int = Field(default=64 * 1024)
+    NDJSON_MAX_LIMIT: int = Field(default=100000)
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,5 +1,6 @@
 from src.database.repositories.movie import MovieRepository
 from src.database.repositories.review import ReviewRepository
+from src.database.repositories.tmdb_cache import TMDBCacheRepository
 from src.database.repositories.user import UserRepository
 from src.database.repositories.watchlist import WatchlistRepository
 __all__ = [
@@ -7,4 +8,5 @@ __all__ = [
     'MovieRepository',
     'ReviewRepository',
     'WatchlistRepository',
+    'TMDBCacheRepository',
 ]
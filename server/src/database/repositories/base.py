@@ -1,4 +1,4 @@
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
@@ -69,6 +69,16 @@ class BaseRepository(Generic[T]):
         """Count documents matching query"""
         return await self.collection.count_documents(query)
 
+    @staticmethod
+    def fields_projection(fields: Optional[Iterable[str]]) -> Optional[Dict[str, Any]]:
+        """Build an inclusion projection for the given fields, or None for whole documents
+
+        MongoDB returns ``_id`` too unless it is excluded.
+        """
+        if fields is None:
+            return None
+        return {field: 1 for field in fields}
+
     @staticmethod
     def to_object_id(id_str: str) -> ObjectId:
         """Convert a string to a MongoDB ObjectId, raise ValueError if invalid."""
@@ -1,10 +1,11 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import TEXT, ReturnDocument, UpdateOne
 
 from src.models.movie import Movie, MovieCreate, MovieUpdate
-from src.models.tmdb_movie import TMDBMovieResponse
+from src.models.tmdb_movie import TMDBMovieDetailResponse, TMDBMovieResponse
 
 from .base import BaseRepository
 
@@ -12,6 +13,12 @@ from .base import BaseRepository
 class MovieRepository(BaseRepository):
     """Movie warehouse category"""
 
+    # Stored fields a response field is built from, where they differ
+    RESPONSE_SOURCES = {
+        "id": ("tmdb_id",),
+        "genres": ("genres", "genre_ids")
+    }
+
     def __init__(self, db: AsyncIOMotorDatabase):
         super().__init__(db, "movies")
 
@@ -23,6 +30,27 @@ class MovieRepository(BaseRepository):
         await self.collection.create_index("genres")
         await self.collection.create_index("vote_average")
         await self.collection.create_index("popularity")
+        await self.collection.create_index("catalog_updated_at")
+        # Full-text search; a title hit outweighs an overview hit
+        await self.collection.create_index(
+            [("title", TEXT), ("original_title", TEXT), ("overview", TEXT)],
+            weights={"title": 10, "original_title": 5, "overview": 1},
+            name="movie_text"
+        )
+
+    @classmethod
+    def response_projection(cls, fields: Optional[Iterable[str]]) -> Optional[Dict[str, Any]]:
+        """Projection loading only what the given TMDB response fields are built from
+
+        The ID and titles are always loaded, since a movie record requires
+        them and responses fall back on the title.
+        """
+        if fields is None:
+            return None
+        stored = {"tmdb_id", "title", "original_title"}
+        for field in fields:
+            stored.update(cls.RESPONSE_SOURCES.get(field, (field,)))
+        return {"_id": 0, **cls.fields_projection(sorted(stored))}
 
     async def create_from_tmdb(self, tmdb_movie: TMDBMovieResponse) -> Movie:
         """Create movie records from TMDB data"""
@@ -34,40 +62,123 @@ class MovieRepository(BaseRepository):
         data = await self.collection.find_one({"tmdb_id": tmdb_id})
         return Movie(**data) if data else None
 
-    async def update_from_tmdb(self, tmdb_id: str, tmdb_movie: TMDBMovieResponse) -> Optional[Movie]:
-        """Update movie records from TMDB data"""
+    async def get_fresh_by_tmdb_id(
+        self,
+        tmdb_id: str,
+        fresh_since: datetime,
+        require_details: bool = False,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Movie]:
+        """Obtain the movie through TMDB ID if it was refreshed after ``fresh_since``
+
+        With ``require_details`` the details (credits, videos and reviews)
+        must have been refreshed after ``fresh_since`` instead. List and
+        search results refresh ``updated_at`` but carry no details.
+        """
+        freshness = "details_updated_at" if require_details else "updated_at"
+        query: Dict[str, Any] = {"tmdb_id": tmdb_id, freshness: {"$gte": fresh_since}}
+        data = await self.collection.find_one(query, projection)
+        return Movie(**data) if data else None
+
+    async def get_by_tmdb_ids(
+        self,
+        tmdb_ids: List[str],
+        fresh_since: datetime,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[Movie]:
+        """Obtain the movies refreshed after ``fresh_since`` for several TMDB IDs in one query"""
+        cursor = self.collection.find(
+            {"tmdb_id": {"$in": tmdb_ids}, "updated_at": {"$gte": fresh_since}}, projection)
+        return [Movie(**doc) async for doc in cursor]
+
+    @staticmethod
+    def _tmdb_update(tmdb_movie: TMDBMovieResponse) -> Dict[str, Any]:
+        """Build the upsert update for a TMDB response, keeping ``created_at`` on updates
+
+        Only a detail response refreshes ``details_updated_at``.
+        """
         movie = Movie.from_tmdb_response(tmdb_movie)
         movie.updated_at = datetime.now(timezone.utc)
+        movie.catalog_updated_at = movie.updated_at
+        if isinstance(tmdb_movie, TMDBMovieDetailResponse):
+            movie.details_updated_at = movie.updated_at
+        return {
+            # Fields missing from the response (e.g. credits on list results)
+            # are left as they are
+            "$set": movie.model_dump(exclude_none=True, exclude={"created_at"}),
+            "$setOnInsert": {"created_at": movie.created_at}
+        }
+
+    async def update_from_tmdb(self, tmdb_id: str, tmdb_movie: TMDBMovieResponse) -> Optional[Movie]:
+        """Update movie records from TMDB data, creating the record if it is missing"""
         data = await self.collection.find_one_and_update(
             {"tmdb_id": tmdb_id},
-            {"$set": movie.model_dump(exclude_none=True)},
-            return_document=True
+            self._tmdb_update(tmdb_movie),
+            upsert=True,
+            return_document=ReturnDocument.AFTER
         )
         return Movie(**data) if data else None
 
-    async def search(self, query: str, limit: int = 10) -> List[Movie]:
-        """Search movies"""
+    async def bulk_upsert_from_tmdb(self, tmdb_movies: List[TMDBMovieResponse]) -> Dict[str, int]:
+        """Upsert several TMDB responses in one unordered bulk write"""
+        if not tmdb_movies:
+            return {"upserted": 0, "modified": 0}
+        operations = [
+            UpdateOne({"tmdb_id": str(tmdb_movie.id)}, self._tmdb_update(tmdb_movie), upsert=True)
+            for tmdb_movie in tmdb_movies
+        ]
+        result = await self.collection.bulk_write(operations, ordered=False)
+        return {"upserted": result.upserted_count, "modified": result.modified_count}
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        skip: int = 0,
+        include_adult: bool = False,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[Movie]:
+        """Search movies by relevance to the text index, then popularity"""
+        filters: Dict[str, Any] = {
+            "$text": {"$search": query},
+            # Rows created from a daily ID export have no details to show yet
+            "updated_at": {"$exists": True}
+        }
+        if not include_adult:
+            filters["adult"] = {"$ne": True}
         cursor = self.collection.find(
-            {"$text": {"$search": query}},
-            {"score": {"$meta": "textScore"}}
-        ).sort([("score", {"$meta": "textScore"})]).limit(limit)
+            filters,
+            {**(projection or {}), "score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"}), ("popularity", -1)]).skip(skip).limit(limit)
 
         movies = []
         async for doc in cursor:
             movies.append(Movie(**doc))
         return movies
 
-    async def get_popular(self, limit: int = 10) -> List[Movie]:
+    @staticmethod
+    def _fresh_filter(fresh_since: Optional[datetime]) -> Dict[str, Any]:
+        """Filter on documents refreshed after ``fresh_since``, if given"""
+        return {"updated_at": {"$gte": fresh_since}} if fresh_since else {}
+
+    async def get_popular(self, limit: int = 10, fresh_since: Optional[datetime] = None) -> List[Movie]:
         """Get popular movies"""
-        cursor = self.collection.find().sort("popularity", -1).limit(limit)
+        cursor = self.collection.find(
+            self._fresh_filter(fresh_since)).sort("popularity", -1).limit(limit)
         movies = []
         async for doc in cursor:
             movies.append(Movie(**doc))
         return movies
 
-    async def get_by_genre(self, genre: str, limit: int = 10) -> List[Movie]:
-        """Get movies of a specific genre"""
-        cursor = self.collection.find({"genres": genre}).sort(
+    async def get_by_genre(
+        self,
+        genre: str,
+        limit: int = 10,
+        fresh_since: Optional[datetime] = None
+    ) -> List[Movie]:
+        """Get movies of a specific genre, given as a name or a TMDB genre ID"""
+        query = {"genre_ids": int(genre)} if genre.isdigit() else {"genres": genre}
+        cursor = self.collection.find({**query, **self._fresh_filter(fresh_since)}).sort(
             "popularity", -1).limit(limit)
         movies = []
         async for doc in cursor:
@@ -99,14 +210,69 @@ class MovieRepository(BaseRepository):
         ).sort("popularity", -1).limit(limit)
         return await cursor.to_list(length=limit)
 
-    async def get_top_rated_movies(self, limit: int = 20) -> List[Dict[str, Any]]:
+    async def get_top_rated_movies(
+        self,
+        limit: int = 20,
+        fresh_since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
         """Get top rated movies"""
         cursor = self.collection.find(
             # Only include movies with sufficient votes
-            {"vote_count": {"$gte": 100}}
+            {"vote_count": {"$gte": 100}, **self._fresh_filter(fresh_since)}
         ).sort("vote_average", -1).limit(limit)
         return await cursor.to_list(length=limit)
 
+    async def bulk_upsert_export_rows(self, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Upsert rows of a TMDB daily ID export in one unordered bulk write
+
+        Export rows only carry a few fields, so existing documents keep their
+        title and full details, and ``updated_at`` is left untouched; only
+        ``catalog_updated_at`` records the write.
+        """
+        if not rows:
+            return {"upserted": 0, "modified": 0}
+        now = datetime.now(timezone.utc)
+        operations = [
+            UpdateOne(
+                {"tmdb_id": str(row["id"])},
+                {
+                    "$set": {
+                        "original_title": row.get("original_title"),
+                        "adult": row.get("adult", False),
+                        "video": row.get("video", False),
+                        "popularity": row.get("popularity"),
+                        "catalog_updated_at": now
+                    },
+                    "$setOnInsert": {
+                        "title": row.get("original_title"),
+                        "created_at": now
+                    }
+                },
+                upsert=True
+            )
+            for row in rows
+        ]
+        result = await self.collection.bulk_write(operations, ordered=False)
+        return {"upserted": result.upserted_count, "modified": result.modified_count}
+
+    async def iter_suggestion_fields(
+        self,
+        updated_since: Optional[datetime] = None,
+        limit: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the fields used for title autocomplete, optionally only for
+        documents written at or after ``updated_since`` (see ``catalog_updated_at``)"""
+        query: Dict[str, Any] = {"title": {"$type": "string"}}
+        if updated_since is not None:
+            query["catalog_updated_at"] = {"$gte": updated_since}
+        cursor = self.collection.find(query, {
+            "_id": 0, "tmdb_id": 1, "title": 1, "original_title": 1,
+            "release_date": 1, "poster_path": 1, "popularity": 1, "adult": 1,
+            "catalog_updated_at": 1
+        }, limit=limit).batch_size(5000)
+        async for doc in cursor:
+            yield doc
+
     async def get_genres(self) -> List[str]:
         """Get a list of all unique genres"""
         pipeline = [
@@ -1,6 +1,6 @@
 import asyncio
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorCollection
@@ -85,31 +85,63 @@ class ReviewRepository(BaseRepository[Review]):
                 raise ValidationError("User has already reviewed this movie")
             raise Exception(f"Error creating review: {str(e)}")
 
+    def _sorted_cursor(
+        self,
+        query: Dict[str, Any],
+        skip: int,
+        limit: int,
+        sort_by: str,
+        sort_order: int,
+        projection: Optional[Dict[str, Any]] = None
+    ):
+        """Build a paginated cursor, validating the sort field"""
+        valid_sort_fields = ["created_at", "rating", "updated_at"]
+        if sort_by not in valid_sort_fields:
+            raise ValidationError(
+                f"Invalid sort field. Must be one of: {', '.join(valid_sort_fields)}")
+
+        return self.collection.find(
+            query,
+            projection,
+            skip=skip,
+            limit=limit,
+            sort=[(sort_by, sort_order)]
+        )
+
+    async def iter_reviews(
+        self,
+        query: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 10,
+        sort_by: str = "created_at",
+        sort_order: int = -1,
+        batch_size: int = 500,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream reviews matching a query, fetching ``batch_size`` documents at a time"""
+        await self.ensure_indexes()
+        cursor = self._sorted_cursor(
+            query, skip, limit, sort_by, sort_order, projection).batch_size(batch_size)
+        async for review in cursor:
+            review["_id"] = str(review["_id"])
+            yield review
+
     async def get_by_movie_id(
         self,
         movie_id: str,
         skip: int = 0,
         limit: int = 10,
         sort_by: str = "created_at",
-        sort_order: int = -1
+        sort_order: int = -1,
+        projection: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """Get reviews for a movie with pagination and sorting"""
         try:
             # Ensure indexes are created
             await self.ensure_indexes()
 
-            # Validate sort field
-            valid_sort_fields = ["created_at", "rating", "updated_at"]
-            if sort_by not in valid_sort_fields:
-                raise ValidationError(
-                    f"Invalid sort field. Must be one of: {', '.join(valid_sort_fields)}")
-
-            cursor = self.collection.find(
-                {"movie_id": movie_id},
-                skip=skip,
-                limit=limit,
-                sort=[(sort_by, sort_order)]
-            )
+            cursor = self._sorted_cursor(
+                {"movie_id": movie_id}, skip, limit, sort_by, sort_order, projection)
             reviews = await cursor.to_list(length=limit)
 
             # Convert ObjectId to string
@@ -126,25 +158,16 @@ class ReviewRepository(BaseRepository[Review]):
         skip: int = 0,
         limit: int = 10,
         sort_by: str = "created_at",
-        sort_order: int = -1
+        sort_order: int = -1,
+        projection: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """Get reviews by a user with pagination and sorting"""
         try:
             # Ensure indexes are created
             await self.ensure_indexes()
 
-            # Validate sort field
-            valid_sort_fields = ["created_at", "rating", "updated_at"]
-            if sort_by not in valid_sort_fields:
-                raise ValidationError(
-                    f"Invalid sort field. Must be one of: {', '.join(valid_sort_fields)}")
-
-            cursor = self.collection.find(
-                {"user_id": user_id},
-                skip=skip,
-                limit=limit,
-                sort=[(sort_by, sort_order)]
-            )
+            cursor = self._sorted_cursor(
+                {"user_id": user_id}, skip, limit, sort_by, sort_order, projection)
             reviews = await cursor.to_list(length=limit)
 
             # Convert ObjectId to string
@@ -283,6 +306,31 @@ class ReviewRepository(BaseRepository[Review]):
         except Exception as e:
             raise Exception(f"Error getting review count: {str(e)}")
 
+    async def get_movie_reviews_version(self, movie_id: str) -> Tuple[int, Optional[datetime]]:
+        """Get the review count and latest creation or update time for a movie
+
+        Adding, editing or deleting a review changes one of the two, so they
+        version a movie's reviews without loading them.
+        """
+        try:
+            # Ensure indexes are created
+            await self.ensure_indexes()
+
+            pipeline = [
+                {"$match": {"movie_id": movie_id}},
+                {"$group": {
+                    "_id": None,
+                    "count": {"$sum": 1},
+                    "changed_at": {"$max": {"$max": ["$created_at", "$updated_at"]}}
+                }}
+            ]
+            result = await self.collection.aggregate(pipeline).to_list(length=1)
+            if not result:
+                return 0, None
+            return result[0]["count"], result[0]["changed_at"]
+        except Exception as e:
+            raise Exception(f"Error getting review version: {str(e)}")
+
     async def get_recent_reviews(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get most recent reviews across all movies"""
         try:
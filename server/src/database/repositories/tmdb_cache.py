@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from src.database.connection import mongo
+from src.database.repositories.base import BaseRepository
+
+
+class TMDBCacheRepository(BaseRepository):
+    """Repository for cached TMDB responses shared between workers"""
+
+    def __init__(self):
+        super().__init__(mongo.db, "tmdb_cache")
+
+    async def ensure_indexes(self):
+        """Ensure required indexes exist"""
+        # MongoDB removes documents once expires_at has passed
+        await self.collection.create_index(
+            "expires_at",
+            expireAfterSeconds=0,
+            name="tmdb_cache_ttl"
+        )
+
+    async def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get an unexpired cache document (payload, stale_at, expires_at) by request key"""
+        return await self.collection.find_one(
+            # The TTL monitor runs periodically, so expired documents may linger
+            {"_id": key, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+            {"payload": 1, "stale_at": 1, "expires_at": 1}
+        )
+
+    async def set_payload(
+        self,
+        key: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        ttl: int,
+        max_stale: int = 0
+    ):
+        """Store a payload that is fresh for ``ttl`` seconds and kept ``max_stale`` more"""
+        now = datetime.now(timezone.utc)
+        await self.collection.update_one(
+            {"_id": key},
+            {"$set": {
+                "endpoint": endpoint,
+                "payload": payload,
+                "cached_at": now,
+                "stale_at": now + timedelta(seconds=ttl),
+                "expires_at": now + timedelta(seconds=ttl + max_stale)
+            }},
+            upsert=True
+        )
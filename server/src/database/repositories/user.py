@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import bcrypt
 
@@ -55,3 +55,28 @@ class UserRepository(BaseRepository[User]):
             return await cursor.to_list(length=limit)
         except Exception as e:
             raise Exception(f"Error finding users: {str(e)}")
+
+    async def iter_many(
+        self,
+        query: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 100,
+        batch_size: int = 500,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream users matching the query, fetching ``batch_size`` documents at a time.
+
+        Args:
+            query: MongoDB query dictionary
+            skip: Number of documents to skip
+            limit: Maximum number of documents to return
+            batch_size: Documents per cursor batch
+            projection: Fields to include or exclude
+
+        Yields:
+            User documents
+        """
+        cursor = self.collection.find(query, projection).skip(skip).limit(limit).batch_size(batch_size)
+        async for user in cursor:
+            yield user
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from src.database.connection import mongo
 from src.database.repositories.base import BaseRepository
@@ -50,23 +50,58 @@ class WatchlistRepository(BaseRepository):
         except Exception as e:
             raise Exception(f"Error creating watchlist: {str(e)}")
 
-    async def get_by_id(self, watchlist_id: str) -> Optional[Dict[str, Any]]:
+    async def get_by_id(
+        self,
+        watchlist_id: str,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """Get a watchlist by ID"""
         try:
-            watchlist = await self._collection.find_one({"_id": self.to_object_id(watchlist_id)})
+            watchlist = await self._collection.find_one(
+                {"_id": self.to_object_id(watchlist_id)}, projection)
             if watchlist:
                 watchlist["_id"] = str(watchlist["_id"])
             return watchlist
         except Exception as e:
             raise Exception(f"Error retrieving watchlist: {str(e)}")
 
-    async def get_by_user_id(self, user_id: str, skip: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
+    def _recent_cursor(
+        self,
+        query: Dict[str, Any],
+        skip: int,
+        limit: int,
+        projection: Optional[Dict[str, Any]] = None
+    ):
+        """Build a cursor over matching watchlists, newest first"""
+        return self._collection.find(query, projection) \
+            .sort("created_at", -1) \
+            .skip(skip) \
+            .limit(limit)
+
+    async def iter_watchlists(
+        self,
+        query: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 10,
+        batch_size: int = 500,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream matching watchlists, newest first, fetching ``batch_size`` documents at a time"""
+        cursor = self._recent_cursor(query, skip, limit, projection).batch_size(batch_size)
+        async for watchlist in cursor:
+            watchlist["_id"] = str(watchlist["_id"])
+            yield watchlist
+
+    async def get_by_user_id(
+        self,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 10,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """Get all watchlists for a user with pagination"""
         try:
-            cursor = self._collection.find({"user_id": user_id}) \
-                .sort("created_at", -1) \
-                .skip(skip) \
-                .limit(limit)
+            cursor = self._recent_cursor({"user_id": user_id}, skip, limit, projection)
 
             watchlists = []
             async for watchlist in cursor:
@@ -164,13 +199,15 @@ class WatchlistRepository(BaseRepository):
         except Exception as e:
             raise Exception(f"Error removing movie from watchlist: {str(e)}")
 
-    async def get_public_watchlists(self, skip: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
+    async def get_public_watchlists(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """Get public watchlists with pagination"""
         try:
-            cursor = self._collection.find({"is_public": True}) \
-                .sort("created_at", -1) \
-                .skip(skip) \
-                .limit(limit)
+            cursor = self._recent_cursor({"is_public": True}, skip, limit, projection)
 
             watchlists = []
             async for watchlist in cursor:
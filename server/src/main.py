@@ -2,13 +2,22 @@ import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.api.compression import CompressionMiddleware
 from src.api.routes import auth, movies, reviews, users, watchlists
 from src.database.connection import mongo
 from src.database.repositories.movie import MovieRepository
 from src.database.repositories.review import ReviewRepository
 from src.database.repositories.user import UserRepository
+from src.services.movie_autocomplete import movie_autocomplete
+from src.services.tmdb_cache import tmdb_response_cache
+from src.services.tmdb_client import tmdb_client
+from src.services.tmdb_genres import genre_registry
+from src.services.tmdb_rate_limiter import TMDBRateLimiter
+from src.services.tmdb_service import TMDBService
+from src.services.tmdb_warmer import tmdb_warmer
 from src.config import settings
 
 logger = logging.getLogger(__name__)
@@ -21,6 +30,23 @@ async def lifespan(app: FastAPI):
         # Initialize database connection
         await mongo.connect()
         logger.info("Database connected successfully")
+        # Initialize the shared TMDB HTTP client
+        await tmdb_client.connect()
+        # Create the TTL index for the shared TMDB response cache
+        await tmdb_response_cache.initialize()
+        # Create the local movie catalog indexes (tmdb_id lookups are unique)
+        movie_repository = MovieRepository(mongo.db)
+        await movie_repository.initialize()
+        # Build the title autocomplete index in the background
+        movie_autocomplete.start(movie_repository, settings.MOVIE_AUTOCOMPLETE_SYNC_INTERVAL)
+        # Preload the process-wide genre map, then keep the genre and home
+        # page lists cached in the background
+        warmer_service = TMDBService(priority=TMDBRateLimiter.PREFETCH)
+        try:
+            await genre_registry.refresh(warmer_service)
+        except Exception as e:
+            logger.warning(f"Genre preload failed, loading on first use: {str(e)}")
+        tmdb_warmer.start(warmer_service)
     except Exception as e:
         logger.error(f"Failed to initialize application: {str(e)}")
         raise
@@ -30,9 +56,14 @@ async def lifespan(app: FastAPI):
     # Shutdown
     try:
         logger.info("Shutting down application")
+        # Stop background tasks
+        await tmdb_warmer.stop()
+        await movie_autocomplete.stop()
         # Close database connection
         await mongo.close()
         logger.info("Database connection closed")
+        # Close the shared TMDB HTTP client
+        await tmdb_client.close()
     except Exception as e:
         logger.error(f"Error during shutdown: {str(e)}")
 
@@ -40,7 +71,9 @@ app = FastAPI(
     title="Movie API",
     description="A RESTful API for movie information and user interactions",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes responses several times faster than the json module
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -52,6 +85,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Brotli/gzip compression above a minimum size; cached payloads are sent
+# pre-compressed and pass through
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
 # Include routers
 app.include_router(auth.router, prefix="/auth")
 app.include_router(users.router, prefix="/users")
@@ -1,5 +1,7 @@
+from .movie import MovieSuggestion
 from .review import Review, ReviewCreate, ReviewUpdate
-from .tmdb_movie import (TMDBMovieCreditsResponse, TMDBMovieDetailResponse,
+from .tmdb_movie import (TMDBMovieBatchItem, TMDBMovieBatchRequest,
+                         TMDBMovieCreditsResponse, TMDBMovieDetailResponse,
                          TMDBMovieResponse, TMDBMovieVideosResponse,
                          TMDBReview)
 from .token import Token
@@ -11,6 +13,11 @@ __all__ = [
     'TMDBMovieCreditsResponse',
     'TMDBMovieVideosResponse',
     'TMDBReview',
+    'TMDBMovieBatchRequest',
+    'TMDBMovieBatchItem',
+
+    # Movie models
+    'MovieSuggestion',
     
     # Review models
     'Review',
@@ -1,9 +1,11 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from .tmdb_movie import TMDBMovieResponse, TMDBReview
+from .tmdb_movie import (TMDBMovieCreditsResponse, TMDBMovieDetailResponse,
+                         TMDBMovieResponse, TMDBMovieVideosResponse,
+                         TMDBReview)
 
 
 class MovieReview(BaseModel):
@@ -35,19 +37,31 @@ class Movie(BaseModel):
     budget: Optional[int] = None
     revenue: Optional[int] = None
     tagline: Optional[str] = None
+    status: Optional[str] = None
     adult: bool = False
     video: bool = False
     original_language: Optional[str] = None
+    production_companies: Optional[List[Dict[str, Any]]] = None
+    production_countries: Optional[List[Dict[str, Any]]] = None
+    spoken_languages: Optional[List[Dict[str, Any]]] = None
     reviews: Optional[List[MovieReview]] = None
     total_reviews: Optional[int] = Field(None, ge=0)
+    credits: Optional[Dict[str, Any]] = None
+    videos: Optional[Dict[str, Any]] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Set only when credits, videos and reviews were stored from a detail response
+    details_updated_at: Optional[datetime] = None
+    # Set on every catalog write, including TMDB export rows, which leave
+    # updated_at alone; the autocomplete index syncs on it
+    catalog_updated_at: Optional[datetime] = None
 
     @classmethod
     def from_tmdb_response(cls, tmdb_movie: TMDBMovieResponse) -> "Movie":
-        """Create a movie record from the TMDB response"""
+        """Create a movie record from the TMDB response (basic or detailed)"""
         reviews = None
-        if tmdb_movie.reviews:
+        tmdb_reviews = getattr(tmdb_movie, "reviews", None)
+        if tmdb_reviews:
             reviews = [
                 MovieReview(
                     id=review.id,
@@ -57,9 +71,12 @@ class Movie(BaseModel):
                     url=review.url,
                     author_details=review.author_details
                 )
-                for review in tmdb_movie.reviews
+                for review in tmdb_reviews
             ]
 
+        genres = tmdb_movie.genres
+        credits = getattr(tmdb_movie, "credits", None)
+        videos = getattr(tmdb_movie, "videos", None)
         return cls(
             tmdb_id=str(tmdb_movie.id),
             title=tmdb_movie.title,
@@ -68,14 +85,72 @@ class Movie(BaseModel):
             poster_path=tmdb_movie.poster_path,
             backdrop_path=tmdb_movie.backdrop_path,
             release_date=tmdb_movie.release_date,
-            genre_ids=tmdb_movie.genre_ids,
+            genres=[genre["name"] for genre in genres] if genres is not None else None,
+            genre_ids=[genre["id"] for genre in genres] if genres is not None else tmdb_movie.genre_ids,
             adult=tmdb_movie.adult,
-            video=tmdb_movie.video,
+            video=getattr(tmdb_movie, "video", False),
             vote_average=tmdb_movie.vote_average,
             vote_count=tmdb_movie.vote_count,
             popularity=tmdb_movie.popularity,
             original_language=tmdb_movie.original_language,
-            reviews=reviews
+            runtime=getattr(tmdb_movie, "runtime", None),
+            budget=getattr(tmdb_movie, "budget", None),
+            revenue=getattr(tmdb_movie, "revenue", None),
+            tagline=getattr(tmdb_movie, "tagline", None),
+            status=getattr(tmdb_movie, "status", None),
+            production_companies=getattr(tmdb_movie, "production_companies", None),
+            production_countries=getattr(tmdb_movie, "production_countries", None),
+            spoken_languages=getattr(tmdb_movie, "spoken_languages", None),
+            reviews=reviews,
+            total_reviews=getattr(tmdb_movie, "total_reviews", None),
+            credits=credits.model_dump() if credits else None,
+            videos=videos.model_dump() if videos else None
+        )
+
+    def _tmdb_genres(self) -> List[Dict[str, Any]]:
+        """Rebuild TMDB genre dictionaries from the stored ids and names"""
+        genre_ids = self.genre_ids or []
+        names = self.genres or []
+        return [
+            {"id": genre_id, "name": names[index] if index < len(names) else "Unknown"}
+            for index, genre_id in enumerate(genre_ids)
+        ]
+
+    def to_tmdb_response(self) -> TMDBMovieResponse:
+        """Convert the movie record to the TMDB basic response model"""
+        return TMDBMovieResponse(
+            id=self.tmdb_id,
+            title=self.title,
+            original_title=self.original_title or self.title,
+            overview=self.overview,
+            poster_path=self.poster_path,
+            backdrop_path=self.backdrop_path,
+            release_date=self.release_date or None,
+            genres=self._tmdb_genres(),
+            adult=self.adult,
+            vote_average=self.vote_average,
+            vote_count=self.vote_count,
+            popularity=self.popularity,
+            original_language=self.original_language
+        )
+
+    def to_tmdb_detail_response(self) -> TMDBMovieDetailResponse:
+        """Convert the movie record to the TMDB detail response model"""
+        return TMDBMovieDetailResponse(
+            **self.to_tmdb_response().model_dump(),
+            budget=self.budget,
+            revenue=self.revenue,
+            runtime=self.runtime,
+            status=self.status,
+            tagline=self.tagline,
+            production_companies=self.production_companies,
+            production_countries=self.production_countries,
+            spoken_languages=self.spoken_languages,
+            reviews=[TMDBReview(**review.model_dump(exclude={"source"}))
+                     for review in self.reviews or []],
+            total_reviews=self.total_reviews,
+            credits=TMDBMovieCreditsResponse(**self.credits) if self.credits else None,
+            videos=TMDBMovieVideosResponse(**self.videos) if self.videos else None
         )
 
     class Config:
@@ -141,4 +216,26 @@ class MovieUpdate(BaseModel):
     tagline: Optional[str] = None
     adult: Optional[bool] = None
     video: Optional[bool] = None
-    original_language: Optional[str] = None 
\ No newline at end of file
+    original_language: Optional[str] = None
+
+
+class MovieSuggestion(BaseModel):
+    """Autocomplete suggestion from the local movie catalog"""
+    id: str
+    title: str
+    original_title: Optional[str] = None
+    release_date: Optional[str] = None
+    poster_path: Optional[str] = None
+    popularity: Optional[float] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "155",
+                "title": "The Dark Knight",
+                "original_title": "The Dark Knight",
+                "release_date": "2008-07-16",
+                "poster_path": "/qJ2tW6WMUDux911r6m7haRef0WH.jpg",
+                "popularity": 123.4
+            }
+        }
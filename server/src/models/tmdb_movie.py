@@ -1,7 +1,7 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 """
 This module contains models for TMDB movie data.
@@ -84,12 +84,19 @@ class TMDBMovieResponse(BaseModel):
         """Validate the release date format"""
         if v is None:
             return v
+        # date.fromisoformat is much cheaper than strptime, but also accepts
+        # other ISO 8601 forms, hence the shape check
         try:
-            datetime.strptime(v, '%Y-%m-%d')
+            if len(v) != 10 or v[4] != '-' or v[7] != '-':
+                raise ValueError
+            date.fromisoformat(v)
             return v
         except ValueError:
             raise ValueError('Invalid date format. Expected YYYY-MM-DD')
 
+# Validates a whole TMDB result page in one call
+movie_list_adapter = TypeAdapter(List[TMDBMovieResponse])
+
 class TMDBMovieCastMember(BaseModel):
     """TMDB API Movie Cast Member Model"""
     id: int
@@ -260,4 +267,22 @@ class TMDBMovieDetailResponse(TMDBMovieResponse):
     reviews: Optional[List[TMDBReview]] = None
     total_reviews: Optional[int] = Field(None, ge=0)
     credits: Optional[TMDBMovieCreditsResponse] = None
-    videos: Optional[TMDBMovieVideosResponse] = None
\ No newline at end of file
+    videos: Optional[TMDBMovieVideosResponse] = None
+
+class TMDBMovieBatchRequest(BaseModel):
+    """Batch movie lookup request model"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "ids": ["550", "680", "13"]
+            }
+        }
+    )
+
+    ids: List[str] = Field(..., min_length=1, max_length=100)
+
+class TMDBMovieBatchItem(BaseModel):
+    """Batch movie lookup result for a single TMDB ID"""
+    id: str
+    movie: Optional[TMDBMovieResponse] = None
+    error: Optional[str] = None
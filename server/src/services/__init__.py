@@ -1,4 +1,6 @@
 from src.services.auth_service import AuthService
+from src.services.catalog_ingest_service import CatalogIngestService
+from src.services.movie_import_service import MovieImportService
 from src.services.movie_service import MovieService
 from src.services.review_service import ReviewService
 from src.services.tmdb_service import TMDBService
@@ -12,4 +14,6 @@ __all__ = [
     'MovieService',
     'ReviewService',
     'WatchlistService',
+    'CatalogIngestService',
+    'MovieImportService',
 ]
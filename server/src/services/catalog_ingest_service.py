@@ -0,0 +1,123 @@
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from src.database.repositories.movie import MovieRepository
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogIngestService:
+    """Stream TMDB daily ID export files into the local movies collection
+
+    Export files (e.g. ``movie_ids_05_15_2025.json.gz`` from
+    ``http://files.tmdb.org/p/exports/``) hold one JSON object per line.
+    Files are read line by line, never fully loaded, and rows are written in
+    batches of upserts keyed on ``tmdb_id``. After every batch the position
+    in the decompressed stream is saved to a checkpoint file so an
+    interrupted run can resume where it stopped.
+    """
+
+    def __init__(self, movie_repository: MovieRepository):
+        self.movie_repository = movie_repository
+
+    @staticmethod
+    def _open(path: str) -> BinaryIO:
+        """Open an export file, transparently decompressing gzip files"""
+        if path.endswith(".gz"):
+            return gzip.open(path, "rb")
+        return open(path, "rb")
+
+    @staticmethod
+    def load_checkpoint(checkpoint_path: Optional[str], path: str) -> int:
+        """Get the byte offset to resume ``path`` from, or 0"""
+        if not checkpoint_path or not os.path.exists(checkpoint_path):
+            return 0
+        with open(checkpoint_path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("path") != os.path.abspath(path):
+            return 0
+        return int(checkpoint.get("offset", 0))
+
+    @staticmethod
+    def save_checkpoint(checkpoint_path: str, path: str, offset: int, rows: int):
+        """Atomically record the byte offset reached in ``path``"""
+        tmp_path = f"{checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"path": os.path.abspath(path), "offset": offset, "rows": rows}, f)
+        os.replace(tmp_path, checkpoint_path)
+
+    @staticmethod
+    def _read_batch(f: BinaryIO, batch_size: int) -> Tuple[List[Dict[str, Any]], int, int]:
+        """Read up to ``batch_size`` rows; returns rows, bytes consumed and invalid lines"""
+        rows = []
+        consumed = 0
+        invalid = 0
+        while len(rows) < batch_size:
+            line = f.readline()
+            if not line:
+                break
+            consumed += len(line)
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+                if "id" not in row:
+                    raise ValueError("missing id")
+                rows.append(row)
+            except ValueError:
+                invalid += 1
+        return rows, consumed, invalid
+
+    async def ingest_export(
+        self,
+        path: str,
+        batch_size: int = 1000,
+        checkpoint_path: Optional[str] = None,
+        progress_interval: float = 5.0
+    ) -> Dict[str, Any]:
+        """Ingest an export file and return row counts and throughput"""
+        offset = self.load_checkpoint(checkpoint_path, path)
+        stats = {"rows": 0, "upserted": 0, "modified": 0, "invalid": 0,
+                 "start_offset": offset, "offset": offset}
+        started = last_report = time.monotonic()
+
+        with self._open(path) as f:
+            if offset:
+                logger.info(f"Resuming {path} from byte offset {offset}")
+                # gzip streams seek forward by decompressing, without parsing rows
+                await asyncio.to_thread(f.seek, offset)
+
+            while True:
+                # Read and decompress off the event loop
+                rows, consumed, invalid = await asyncio.to_thread(
+                    self._read_batch, f, batch_size)
+                if not rows and not consumed:
+                    break
+
+                result = await self.movie_repository.bulk_upsert_export_rows(rows)
+                stats["rows"] += len(rows)
+                stats["invalid"] += invalid
+                stats["upserted"] += result["upserted"]
+                stats["modified"] += result["modified"]
+                stats["offset"] += consumed
+                if checkpoint_path:
+                    self.save_checkpoint(
+                        checkpoint_path, path, stats["offset"], stats["rows"])
+
+                now = time.monotonic()
+                if now - last_report >= progress_interval:
+                    rate = stats["rows"] / (now - started)
+                    logger.info(
+                        f"Ingested {stats['rows']} rows ({rate:.0f} rows/s), offset {stats['offset']}")
+                    last_report = now
+
+        elapsed = time.monotonic() - started
+        stats["seconds"] = round(elapsed, 3)
+        stats["rows_per_second"] = round(stats["rows"] / elapsed, 1) if elapsed > 0 else 0.0
+        return stats
@@ -0,0 +1,320 @@
+import asyncio
+import bisect
+import heapq
+import logging
+import re
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.config import settings
+from src.database.repositories.movie import MovieRepository
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD = re.compile(r"\W+")
+# Separates the normalized text from the movie ID inside an index key
+_SEPARATOR = "\x00"
+# Word starts indexed per title, so "knight" finds "The Dark Knight"
+_MAX_WORD_STARTS = 6
+
+
+def normalize(text: str) -> str:
+    """Lowercase text, strip accents and collapse punctuation into single spaces"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_WORD.sub(" ", stripped.lower()).strip()
+
+
+class MovieAutocompleteIndex:
+    """In-memory title autocomplete over the local movie catalog
+
+    Every title, and every title suffix starting at one of its first words,
+    is kept in a sorted array of keys, so a prefix lookup is a binary search
+    followed by a scan of the matching range. Matches are ranked by whether
+    the whole title starts with the query, then by popularity.
+
+    Rankings of prefixes matching many keys are precomputed for one and two
+    characters, pinned once computed for longer prefixes, and updated in
+    place when movies change. Rankings of narrower prefixes are kept in an
+    LRU cache and simply dropped on changes, since rescanning them is cheap.
+
+    Inserting into the key array shifts every key after it, so only small
+    syncs are applied in place; larger ones rebuild the whole index in a
+    worker thread and swap it in.
+    """
+
+    # Prefixes matching at least this many keys keep a pinned ranking
+    HEAVY_RANGE = 1000
+    # Pinned rankings are precomputed at load for prefixes up to this length
+    PRECOMPUTE_LENGTH = 2
+    # Documents indexed per worker thread call while loading
+    LOAD_BATCH = 5000
+
+    def __init__(
+        self,
+        max_results: int = settings.MOVIE_AUTOCOMPLETE_MAX_RESULTS,
+        cache_size: int = settings.MOVIE_AUTOCOMPLETE_CACHE_SIZE,
+        sync_batch: int = settings.MOVIE_AUTOCOMPLETE_SYNC_BATCH
+    ):
+        self.max_results = max_results
+        self.cache_size = cache_size
+        self.sync_batch = sync_batch
+        self._keys: List[str] = []
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._item_keys: Dict[str, List[str]] = {}
+        self._titles: Dict[str, str] = {}
+        self._ranked: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._pinned: Dict[str, List[str]] = {}
+        self.loaded = False
+        self._synced_until: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _suggestion(doc: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": str(doc["tmdb_id"]),
+            "title": doc["title"],
+            "original_title": doc.get("original_title"),
+            "release_date": doc.get("release_date"),
+            "poster_path": doc.get("poster_path"),
+            "popularity": doc.get("popularity")
+        }
+
+    @staticmethod
+    def _keys_for(tmdb_id: str, titles: Iterable[Optional[str]]) -> List[str]:
+        keys = set()
+        for title in titles:
+            words = normalize(title).split() if title else []
+            for start in range(min(len(words), _MAX_WORD_STARTS)):
+                keys.add(" ".join(words[start:]) + _SEPARATOR + tmdb_id)
+        return sorted(keys)
+
+    @classmethod
+    def _index_doc(cls, doc: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], List[str], str]]:
+        """Build the suggestion, keys and normalized title for a document"""
+        if doc.get("adult") or not doc.get("title"):
+            return None
+        suggestion = cls._suggestion(doc)
+        keys = cls._keys_for(suggestion["id"], (doc["title"], doc.get("original_title")))
+        return suggestion, keys, normalize(doc["title"])
+
+    def _add(self, docs: List[Dict[str, Any]]):
+        """Index a batch of documents into an index being built; runs in a worker thread"""
+        for doc in docs:
+            indexed = self._index_doc(doc)
+            if indexed is None:
+                continue
+            suggestion, keys, title = indexed
+            self._items[suggestion["id"]] = suggestion
+            self._item_keys[suggestion["id"]] = keys
+            self._titles[suggestion["id"]] = title
+            self._keys.extend(keys)
+
+    def _finish(self):
+        """Sort the keys and pin the heavy rankings of a built index; runs in a worker thread"""
+        self._keys.sort()
+        # Keys sharing a prefix are contiguous, so one pass per length
+        # finds every heavy short prefix
+        for length in range(1, self.PRECOMPUTE_LENGTH + 1):
+            start = 0
+            while start < len(self._keys):
+                prefix = self._keys[start].split(_SEPARATOR, 1)[0][:length]
+                end = bisect.bisect_left(self._keys, prefix + "\uffff", start)
+                if len(prefix) == length and end - start >= self.HEAVY_RANGE:
+                    self._pinned[prefix] = self._top(prefix, {
+                        key.rsplit(_SEPARATOR, 1)[1] for key in self._keys[start:end]})
+                start = end
+
+    async def load(self, movie_repository: MovieRepository):
+        """Build the index from every titled movie in the catalog
+
+        Documents are indexed in batches of ``LOAD_BATCH`` as the cursor
+        yields them, so only one batch of raw documents is held at a time.
+        The new index is built in a worker thread and swapped in when done.
+        """
+        started = datetime.now(timezone.utc)
+        index = MovieAutocompleteIndex(self.max_results, self.cache_size, self.sync_batch)
+        last_write = None
+        batch: List[Dict[str, Any]] = []
+        async for doc in movie_repository.iter_suggestion_fields():
+            batch.append(doc)
+            if len(batch) >= self.LOAD_BATCH:
+                last_write = self._last_write(batch, last_write)
+                await asyncio.to_thread(index._add, batch)
+                batch = []
+        last_write = self._last_write(batch, last_write)
+        await asyncio.to_thread(index._add, batch)
+        await asyncio.to_thread(index._finish)
+
+        self._keys, self._items = index._keys, index._items
+        self._item_keys, self._titles = index._item_keys, index._titles
+        self._pinned = index._pinned
+        self._ranked.clear()
+        # Documents written before catalog_updated_at existed carry none
+        self._synced_until = last_write or started
+        self.loaded = True
+        logger.info(f"Autocomplete index loaded {len(self._items)} movies")
+
+    @staticmethod
+    def _last_write(
+        docs: List[Dict[str, Any]],
+        latest: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        """Latest ``catalog_updated_at`` of the documents, or ``latest`` if later"""
+        writes = [doc["catalog_updated_at"] for doc in docs if doc.get("catalog_updated_at")]
+        if latest is not None:
+            writes.append(latest)
+        return max(writes, default=None)
+
+    async def sync(self, movie_repository: MovieRepository):
+        """Apply catalog changes made since the last sync (e.g. by other workers or ingests)"""
+        if not self.loaded:
+            await self.load(movie_repository)
+            return
+        docs = [doc async for doc in movie_repository.iter_suggestion_fields(
+            self._synced_until, limit=self.sync_batch + 1)]
+        if len(docs) > self.sync_batch:
+            # Too many changes (e.g. after an export ingest) to apply on the event loop
+            await self.load(movie_repository)
+            return
+        for doc in docs:
+            self.upsert(doc)
+        self._synced_until = self._last_write(docs, self._synced_until)
+        if docs:
+            logger.debug(f"Autocomplete index synced {len(docs)} movies")
+
+    @staticmethod
+    def _prefixes(keys: List[str]) -> Set[str]:
+        """Every prefix of the text of the given keys"""
+        prefixes = set()
+        for key in keys:
+            text = key.split(_SEPARATOR, 1)[0]
+            prefixes.update(text[:end] for end in range(1, len(text) + 1))
+        return prefixes
+
+    def _update_pinned(self, prefix: str, tmdb_id: str):
+        """Move a changed movie within a pinned ranking"""
+        ranked = self._pinned[prefix]
+        was_full = len(ranked) >= self.max_results
+        was_ranked = tmdb_id in ranked
+        if was_ranked:
+            ranked.remove(tmdb_id)
+        matches = any(key.startswith(prefix) for key in self._item_keys.get(tmdb_id, ()))
+        if matches:
+            ranked.append(tmdb_id)
+            ranked.sort(key=self._rank_key(prefix))
+        if was_ranked and was_full and (not matches or ranked[-1] == tmdb_id):
+            # The next best movie is unknown; rescan on the next lookup
+            del self._pinned[prefix]
+            return
+        del ranked[self.max_results:]
+
+    def _apply(self, tmdb_id: str, old_keys: List[str], new_keys: List[str]):
+        """Update cached rankings after a movie was added, changed or removed"""
+        for prefix in self._prefixes(old_keys) | self._prefixes(new_keys):
+            self._ranked.pop(prefix, None)
+            if prefix in self._pinned:
+                self._update_pinned(prefix, tmdb_id)
+
+    def _remove_keys(self, tmdb_id: str) -> List[str]:
+        keys = self._item_keys.pop(tmdb_id, [])
+        for key in keys:
+            index = bisect.bisect_left(self._keys, key)
+            if index < len(self._keys) and self._keys[index] == key:
+                del self._keys[index]
+        self._items.pop(tmdb_id, None)
+        self._titles.pop(tmdb_id, None)
+        return keys
+
+    def remove(self, tmdb_id: str):
+        """Remove a movie from the index"""
+        self._apply(tmdb_id, self._remove_keys(tmdb_id), [])
+
+    def upsert(self, doc: Dict[str, Any]):
+        """Add or update one movie document"""
+        tmdb_id = str(doc["tmdb_id"])
+        indexed = self._index_doc(doc)
+        if indexed is None:
+            self._apply(tmdb_id, self._remove_keys(tmdb_id), [])
+            return
+        suggestion, keys, title = indexed
+        old_keys = self._item_keys.get(tmdb_id, [])
+        if keys != old_keys:
+            # Unchanged titles, the usual case, keep their keys in place
+            old_keys = self._remove_keys(tmdb_id)
+            for key in keys:
+                bisect.insort(self._keys, key)
+        self._items[tmdb_id] = suggestion
+        self._item_keys[tmdb_id] = keys
+        self._titles[tmdb_id] = title
+        self._apply(tmdb_id, old_keys, keys)
+
+    def _rank_key(self, prefix: str) -> Callable[[str], Tuple[bool, float]]:
+        """Sort key putting whole-title matches first, then popular movies"""
+        return lambda tmdb_id: (
+            not self._titles[tmdb_id].startswith(prefix),
+            -(self._items[tmdb_id]["popularity"] or 0.0)
+        )
+
+    def _top(self, prefix: str, tmdb_ids: Iterable[str]) -> List[str]:
+        return heapq.nsmallest(self.max_results, tmdb_ids, key=self._rank_key(prefix))
+
+    def _rank(self, prefix: str) -> Tuple[List[str], int]:
+        """Rank the movie IDs whose keys start with ``prefix``, and count those keys"""
+        start = bisect.bisect_left(self._keys, prefix)
+        end = bisect.bisect_left(self._keys, prefix + "\uffff", start)
+        matches = {key.rsplit(_SEPARATOR, 1)[1] for key in self._keys[start:end]}
+        return self._top(prefix, matches), end - start
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Suggest movies whose title, or a word in it, starts with ``query``"""
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        ranked = self._pinned.get(prefix)
+        if ranked is None:
+            ranked = self._ranked.get(prefix)
+            if ranked is not None:
+                self._ranked.move_to_end(prefix)
+        if ranked is None:
+            ranked, size = self._rank(prefix)
+            if size >= self.HEAVY_RANGE:
+                self._pinned[prefix] = ranked
+            else:
+                self._ranked[prefix] = ranked
+                if len(self._ranked) > self.cache_size:
+                    self._ranked.popitem(last=False)
+        return [self._items[tmdb_id] for tmdb_id in ranked[:limit]]
+
+    def start(self, movie_repository: MovieRepository, interval: float):
+        """Load the index in the background and sync it every ``interval`` seconds"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._sync_periodically(movie_repository, interval))
+
+    async def stop(self):
+        """Stop syncing"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _sync_periodically(self, movie_repository: MovieRepository, interval: float):
+        while True:
+            try:
+                await self.sync(movie_repository)
+            except Exception as e:
+                logger.warning(f"Error syncing autocomplete index: {str(e)}")
+            await asyncio.sleep(interval)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+# Shared by every request in the process
+movie_autocomplete = MovieAutocompleteIndex()
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.database.repositories.movie import MovieRepository
+from src.models.tmdb_movie import TMDBMovieResponse
+from src.services.tmdb_service import TMDBService
+from src.utils.exceptions import MovieNotFoundError
+
+logger = logging.getLogger(__name__)
+
+
+class MovieImportService:
+    """Import full movie details from TMDB into the local movies collection
+
+    IDs are fetched concurrently through the shared TMDB client and rate
+    limiter, and the results are written in batches of unordered upserts.
+    Each written or not found ID is appended to a checkpoint file, so a
+    rerun skips the IDs that are already done. Failed IDs are retried on
+    the next run.
+    """
+
+    def __init__(self, tmdb_service: TMDBService, movie_repository: MovieRepository):
+        self.tmdb_service = tmdb_service
+        self.movie_repository = movie_repository
+
+    @staticmethod
+    def load_checkpoint(checkpoint_path: Optional[str]) -> Set[str]:
+        """Get the IDs recorded as done in a checkpoint file"""
+        if not checkpoint_path or not os.path.exists(checkpoint_path):
+            return set()
+        with open(checkpoint_path) as f:
+            return {line.strip() for line in f if line.strip()}
+
+    @staticmethod
+    def _append_checkpoint(checkpoint_path: Optional[str], tmdb_ids: List[str]):
+        """Record IDs as done"""
+        if not checkpoint_path or not tmdb_ids:
+            return
+        with open(checkpoint_path, "a") as f:
+            f.write("".join(f"{tmdb_id}\n" for tmdb_id in tmdb_ids))
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def import_movies(
+        self,
+        tmdb_ids: Iterable[str],
+        concurrency: int = 8,
+        batch_size: int = 500,
+        checkpoint_path: Optional[str] = None,
+        progress_interval: float = 5.0
+    ) -> Dict[str, Any]:
+        """Import movies by TMDB ID and return counts and throughput"""
+        done = self.load_checkpoint(checkpoint_path)
+        requested = list(dict.fromkeys(tmdb_ids))
+        pending = [tmdb_id for tmdb_id in requested if tmdb_id not in done]
+        stats = {"requested": len(requested), "skipped": len(requested) - len(pending),
+                 "imported": 0, "not_found": 0, "failed": 0}
+        started = last_report = time.monotonic()
+
+        queue: "asyncio.Queue[str]" = asyncio.Queue()
+        for tmdb_id in pending:
+            queue.put_nowait(tmdb_id)
+        buffer: List[TMDBMovieResponse] = []
+        not_found: List[str] = []
+        flush_lock = asyncio.Lock()
+
+        async def flush():
+            async with flush_lock:
+                movies, missing = buffer[:], not_found[:]
+                buffer.clear()
+                not_found.clear()
+                if movies:
+                    try:
+                        await self.movie_repository.bulk_upsert_from_tmdb(movies)
+                    except Exception as e:
+                        logger.error(f"Failed to write {len(movies)} movies: {str(e)}")
+                        stats["failed"] += len(movies)
+                        movies = []
+                stats["imported"] += len(movies)
+                stats["not_found"] += len(missing)
+                self._append_checkpoint(
+                    checkpoint_path, [str(movie.id) for movie in movies] + missing)
+
+        async def worker():
+            nonlocal last_report
+            while True:
+                try:
+                    tmdb_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    buffer.append(await self.tmdb_service.get_movie_with_details(tmdb_id))
+                except MovieNotFoundError:
+                    # Deleted or unknown IDs are done, not failed
+                    not_found.append(tmdb_id)
+                except Exception as e:
+                    logger.warning(f"Failed to fetch movie {tmdb_id}: {str(e)}")
+                    stats["failed"] += 1
+
+                if len(buffer) + len(not_found) >= batch_size:
+                    await flush()
+
+                now = time.monotonic()
+                if now - last_report >= progress_interval:
+                    processed = len(pending) - queue.qsize()
+                    rate = processed / (now - started)
+                    logger.info(
+                        f"Processed {processed}/{len(pending)} movies ({rate:.1f}/s), "
+                        f"{stats['failed']} failed")
+                    last_report = now
+
+        await asyncio.gather(*(worker() for _ in range(max(concurrency, 1))))
+        await flush()
+
+        elapsed = time.monotonic() - started
+        stats["seconds"] = round(elapsed, 3)
+        processed = stats["imported"] + stats["not_found"] + stats["failed"]
+        stats["movies_per_second"] = round(processed / elapsed, 1) if elapsed > 0 else 0.0
+        return stats
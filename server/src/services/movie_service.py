@@ -1,27 +1,140 @@
-from typing import List, Optional
-from src.models.tmdb_movie import (TMDBMovieCreditsResponse,
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from src.config import settings
+from src.database.repositories.movie import MovieRepository
+from src.models.movie import Movie
+from src.models.tmdb_movie import (TMDBMovieBatchItem,
+                                   TMDBMovieCreditsResponse,
                                    TMDBMovieDetailResponse, TMDBMovieResponse,
                                    TMDBMovieVideosResponse)
 from src.services.tmdb_service import TMDBService
 
-# from src.database.repositories.movie import MovieRepository
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 
 class MovieService:
-    """Service for movie-related operations"""
+    """Service for movie-related operations
+
+    Reads go to the local ``movies`` collection first and fall back to TMDB
+    only when a movie is missing or was last refreshed more than ``max_age``
+    seconds ago. TMDB results are upserted into the collection, so the next
+    read is served locally. Without a repository, or when MongoDB fails,
+    reads go straight to TMDB.
+    """
 
-    # def __init__(self, tmdb_service: TMDBService, movie_repository: MovieRepository):
-    def __init__(self, tmdb_service: TMDBService):
+    def __init__(
+        self,
+        tmdb_service: TMDBService,
+        movie_repository: Optional[MovieRepository] = None,
+        max_age: int = settings.MOVIE_CATALOG_MAX_AGE
+    ):
         self.tmdb_service = tmdb_service
-        # self.movie_repository = movie_repository
+        self.movie_repository = movie_repository
+        self.max_age = max_age
+
+    def _fresh_since(self) -> datetime:
+        """Oldest ``updated_at`` a local document may have to be served"""
+        return datetime.now(timezone.utc) - timedelta(seconds=self.max_age)
+
+    async def _read_local(self, read: Callable[[MovieRepository], Awaitable[T]]) -> Optional[T]:
+        """Run a read against the local catalog, or return None if it is unavailable"""
+        if self.movie_repository is None:
+            return None
+        try:
+            return await read(self.movie_repository)
+        except Exception as e:
+            logger.warning(f"Local movie catalog read failed: {str(e)}")
+            return None
+
+    async def _store(self, tmdb_movies: List[TMDBMovieResponse]):
+        """Upsert TMDB results into the local catalog without failing the read
+
+        The autocomplete index picks the movies up on its next sync, off the
+        request path.
+        """
+        if self.movie_repository is None or not tmdb_movies:
+            return
+        try:
+            if len(tmdb_movies) == 1:
+                await self.movie_repository.update_from_tmdb(
+                    str(tmdb_movies[0].id), tmdb_movies[0])
+            else:
+                await self.movie_repository.bulk_upsert_from_tmdb(tmdb_movies)
+        except Exception as e:
+            logger.warning(f"Local movie catalog write failed: {str(e)}")
+
+    async def _get_list(
+        self,
+        read: Callable[[MovieRepository], Awaitable[List[Movie]]],
+        fetch: Callable[[], Awaitable[List[TMDBMovieResponse]]],
+        limit: int
+    ) -> List[TMDBMovieResponse]:
+        """Serve a list from the local catalog when it holds enough fresh movies"""
+        movies = await self._read_local(read)
+        if movies is not None and len(movies) >= limit:
+            return [movie.to_tmdb_response() for movie in movies]
+        tmdb_movies = await fetch()
+        await self._store(tmdb_movies)
+        return tmdb_movies[:limit]
 
     async def get_movie(self, tmdb_id: str) -> Optional[TMDBMovieResponse]:
-        """Get basic movie information from TMDB"""
-        return await self.tmdb_service.get_movie(tmdb_id)
+        """Get basic movie information"""
+        movie = await self._read_local(
+            lambda repo: repo.get_fresh_by_tmdb_id(tmdb_id, self._fresh_since()))
+        if movie is not None:
+            return movie.to_tmdb_response()
+        tmdb_movie = await self.tmdb_service.get_movie(tmdb_id)
+        await self._store([tmdb_movie])
+        return tmdb_movie
+
+    async def get_movie_with_details(
+        self,
+        tmdb_id: str,
+        fields: Optional[Iterable[str]] = None
+    ) -> Optional[TMDBMovieDetailResponse]:
+        """Get detailed movie information including reviews, credits, and videos
 
-    async def get_movie_with_details(self, tmdb_id: str) -> Optional[TMDBMovieDetailResponse]:
-        """Get detailed movie information including reviews, credits, and videos"""
-        return await self.tmdb_service.get_movie_with_details(tmdb_id)
+        With ``fields``, a local read only loads what those response fields
+        need; the others are left empty.
+        """
+        movie = await self._read_local(
+            lambda repo: repo.get_fresh_by_tmdb_id(
+                tmdb_id, self._fresh_since(), require_details=True,
+                projection=MovieRepository.response_projection(fields)))
+        if movie is not None:
+            return movie.to_tmdb_detail_response()
+        tmdb_movie = await self.tmdb_service.get_movie_with_details(tmdb_id)
+        await self._store([tmdb_movie])
+        return tmdb_movie
+
+    async def get_movies(
+        self,
+        tmdb_ids: List[str],
+        fields: Optional[Iterable[str]] = None
+    ) -> List[TMDBMovieBatchItem]:
+        """Get basic information for many movies, in request order
+
+        Fresh local movies are read with a single query, limited to
+        ``fields`` when given; only the remaining IDs are looked up on TMDB.
+        """
+        movies = await self._read_local(
+            lambda repo: repo.get_by_tmdb_ids(
+                tmdb_ids, self._fresh_since(), MovieRepository.response_projection(fields)))
+        items: Dict[str, TMDBMovieBatchItem] = {
+            movie.tmdb_id: TMDBMovieBatchItem(id=movie.tmdb_id, movie=movie.to_tmdb_response())
+            for movie in movies or []
+        }
+        missing = list(dict.fromkeys(
+            tmdb_id for tmdb_id in tmdb_ids if tmdb_id not in items))
+        if missing:
+            fetched = await self.tmdb_service.get_movies(missing)
+            await self._store([item.movie for item in fetched if item.movie is not None])
+            items.update((item.id, item) for item in fetched)
+        return [items[tmdb_id] for tmdb_id in tmdb_ids]
 
     async def get_movie_credits(self, tmdb_id: str) -> Optional[TMDBMovieCreditsResponse]:
         """Get movie credits (cast and crew)"""
@@ -31,27 +144,100 @@ class MovieService:
         """Get movie videos (trailers, etc.)"""
         return await self.tmdb_service.get_movie_videos(tmdb_id)
 
-    async def search_movies(self, query: str, limit: int = 20) -> List[TMDBMovieResponse]:
-        """Search movies by title"""
-        # Calculate page number based on limit
-        page = 1  # For now, we'll just get the first page
-        return await self.tmdb_service.search_movies(query, page)
+    @staticmethod
+    def _local_search_is_enough(movies: List[Movie]) -> bool:
+        """Whether local search results can be served without asking TMDB
+
+        Only a page holding at least MOVIE_SEARCH_LOCAL_MIN_RESULTS matches
+        is enough: a partial page may hold the one stored movie among many
+        that TMDB knows, e.g. a single "Batman" film.
+        """
+        return len(movies) >= min(settings.MOVIE_SEARCH_LOCAL_MIN_RESULTS, TMDBService.PAGE_SIZE)
+
+    async def search_movies(
+        self,
+        query: str,
+        page: int = 1,
+        language: str = "en-US",
+        include_adult: bool = False,
+        year: Optional[int] = None,
+        primary_release_year: Optional[int] = None,
+        region: Optional[str] = None,
+        with_genres: Optional[List[int]] = None,
+        sort_by: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> List[TMDBMovieResponse]:
+        """Search movies, from the local text index when it has enough matches
+
+        When the local page is short TMDB is searched instead, its results are
+        stored, and on the first page local matches missing from TMDB's
+        results fill the rest of the page. Filtered, sorted and non-English
+        searches always go to TMDB, since the local index cannot apply them.
+        Local matches only load what ``fields`` need, when given.
+        """
+        async def search_tmdb() -> List[TMDBMovieResponse]:
+            return await self.tmdb_service.search_movies(
+                query=query,
+                page=page,
+                language=language,
+                include_adult=include_adult,
+                year=year,
+                primary_release_year=primary_release_year,
+                region=region,
+                with_genres=with_genres,
+                sort_by=sort_by
+            )
+
+        filtered = any(value is not None for value in (
+            year, primary_release_year, region, with_genres, sort_by))
+        if filtered or language != "en-US":
+            return await search_tmdb()
+
+        page_size = TMDBService.PAGE_SIZE
+        movies = await self._read_local(lambda repo: repo.search(
+            query, page_size, skip=(page - 1) * page_size, include_adult=include_adult,
+            projection=MovieRepository.response_projection(fields)))
+        if movies is not None and self._local_search_is_enough(movies):
+            return [movie.to_tmdb_response() for movie in movies]
+
+        tmdb_movies = await search_tmdb()
+        await self._store(tmdb_movies)
+        if page > 1 or not movies:
+            return tmdb_movies
+        found = {str(movie.id) for movie in tmdb_movies}
+        merged = tmdb_movies + [
+            movie.to_tmdb_response() for movie in movies if movie.tmdb_id not in found]
+        return merged[:page_size]
 
     async def get_popular_movies(self, limit: int = 20) -> List[TMDBMovieResponse]:
         """Get popular movies"""
-        return await self.tmdb_service.get_popular_movies(limit)
+        return await self._get_list(
+            lambda repo: repo.get_popular(limit, self._fresh_since()),
+            lambda: self.tmdb_service.get_popular_movies(limit=limit),
+            limit
+        )
 
     async def get_top_rated_movies(self, limit: int = 20) -> List[TMDBMovieResponse]:
         """Get top rated movies"""
-        return await self.tmdb_service.get_top_rated_movies(limit)
+        async def read(repo: MovieRepository) -> List[Movie]:
+            docs = await repo.get_top_rated_movies(limit, self._fresh_since())
+            return [Movie(**doc) for doc in docs]
+
+        return await self._get_list(
+            read, lambda: self.tmdb_service.get_top_rated_movies(limit=limit), limit)
 
     async def get_movies_by_genre(self, genre: str, limit: int = 20) -> List[TMDBMovieResponse]:
         """Get movies by genre"""
-        return await self.tmdb_service.get_movies_by_genre(genre, limit)
+        return await self._get_list(
+            lambda repo: repo.get_by_genre(genre, limit, self._fresh_since()),
+            lambda: self.tmdb_service.get_movies_by_genre(genre, limit=limit),
+            limit
+        )
 
     async def get_movies_by_year(self, year: int, limit: int = 20) -> List[TMDBMovieResponse]:
-        """Get movies by release year"""
-        return await self.tmdb_service.get_movies_by_year(year, limit)
+        """Get movies by release year from the local catalog"""
+        docs = await self._read_local(lambda repo: repo.get_movies_by_year(year, limit))
+        return [Movie(**doc).to_tmdb_response() for doc in docs or []]
 
     async def get_genres(self) -> List[str]:
         """Get a list of all unique genres"""
@@ -1,9 +1,11 @@
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 from fastapi import HTTPException, status
+from src.config import settings
 from src.database.repositories.review import ReviewRepository
-from src.models import Review, ReviewCreate, ReviewUpdate
+from src.models import (Review, ReviewCreate, ReviewUpdate, TMDBMovieResponse,
+                        TMDBReview)
 from src.services.tmdb_service import TMDBService
 from src.utils.exceptions import (ResourceNotFoundError, UnauthorizedError,
                                   ValidationError)
@@ -143,9 +145,16 @@ class ReviewService:
         movie_id: str,
         skip: int = 0,
         limit: int = 10,
-        include_tmdb: bool = True
+        include_tmdb: bool = True,
+        fields: Optional[Iterable[str]] = None,
+        tmdb_reviews: Optional[Tuple[List[TMDBReview], int]] = None
     ) -> Dict[str, Any]:
-        """Get reviews for a movie from both TMDB and our database"""
+        """Get reviews for a movie from both TMDB and our database
+
+        With ``fields``, each review only has those fields (and our reviews
+        their ``_id``); ours are projected by MongoDB. ``tmdb_reviews`` is a
+        page already fetched with ``get_tmdb_reviews``.
+        """
         try:
             # Validate movie_id format
             if not movie_id.isdigit():
@@ -155,26 +164,22 @@ class ReviewService:
             user_reviews = await self.review_repository.get_by_movie_id(
                 movie_id=movie_id,
                 skip=skip,
-                limit=limit
+                limit=limit,
+                projection=ReviewRepository.fields_projection(fields)
             )
 
             # Get TMDB reviews if requested
-            tmdb_reviews = []
-            total_tmdb_reviews = 0
-            if include_tmdb:
-                try:
-                    tmdb_reviews, total_tmdb_reviews = await self.tmdb_service.get_movie_reviews(
-                        movie_id,
-                        page=skip // limit + 1,
-                        limit=limit
-                    )
-                except Exception as e:
-                    logger.error(f"Error fetching TMDB reviews: {str(e)}")
-                    # Continue without TMDB reviews if there's an error
+            if include_tmdb and tmdb_reviews is None:
+                tmdb_reviews = await self.get_tmdb_reviews(movie_id, skip, limit)
+            # Continue without TMDB reviews if there's an error
+            reviews, total_tmdb_reviews = (tmdb_reviews or ([], 0)) if include_tmdb else ([], 0)
 
             return {
                 "user_reviews": user_reviews,
-                "tmdb_reviews": [review.model_dump() for review in tmdb_reviews],
+                "tmdb_reviews": [
+                    review.model_dump(include=set(fields) if fields is not None else None)
+                    for review in reviews
+                ],
                 "total_user_reviews": len(user_reviews),
                 "total_tmdb_reviews": total_tmdb_reviews,
                 "page": skip // limit + 1,
@@ -183,20 +188,54 @@ class ReviewService:
         except Exception as e:
             raise Exception(f"Error retrieving reviews: {str(e)}")
 
+    async def get_tmdb_reviews(
+        self,
+        movie_id: str,
+        skip: int = 0,
+        limit: int = 10
+    ) -> Optional[Tuple[List[TMDBReview], int]]:
+        """Get a page of a movie's TMDB reviews and their total, or None if TMDB failed"""
+        try:
+            return await self.tmdb_service.get_movie_reviews(
+                movie_id,
+                page=skip // limit + 1,
+                limit=limit
+            )
+        except Exception as e:
+            logger.error(f"Error fetching TMDB reviews: {str(e)}")
+            return None
+
+    async def get_tmdb_movie(self, movie_id: str) -> Optional[TMDBMovieResponse]:
+        """Get a movie's TMDB information, or None if TMDB failed"""
+        try:
+            return await self.tmdb_service.get_movie(movie_id)
+        except Exception as e:
+            logger.error(f"Error fetching TMDB rating: {str(e)}")
+            return None
+
+    async def get_movie_reviews_version(self, movie_id: str) -> Tuple[int, Optional[datetime]]:
+        """Get the review count and latest change time of a movie's reviews, for HTTP validators"""
+        if not movie_id.isdigit():
+            raise ValidationError("Movie ID must be numeric")
+        return await self.review_repository.get_movie_reviews_version(movie_id)
+
     async def get_user_reviews(
             self, 
             user_id: str, 
             skip: int = 0, 
             limit: int = 10, 
             sort_by: str = "created_at", 
-            sort_order: int = -1) -> List[Dict[str, Any]]:
-        """Get reviews by a user with pagination"""
+            sort_order: int = -1,
+            fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Get reviews by a user with pagination, optionally only some of their fields"""
         try:
             # Validate pagination parameters
             if skip < 0 or limit < 1 or limit > 50:
                 raise ValidationError("Invalid pagination parameters")
 
-            return await self.review_repository.get_by_user_id(user_id, skip, limit, sort_by, sort_order)
+            return await self.review_repository.get_by_user_id(
+                user_id, skip, limit, sort_by, sort_order,
+                ReviewRepository.fields_projection(fields))
         except ValidationError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -208,6 +247,33 @@ class ReviewService:
                 detail=f"Error retrieving user reviews: {str(e)}"
             )
 
+    def stream_movie_reviews(
+            self,
+            movie_id: str,
+            skip: int = 0,
+            limit: int = 10,
+            fields: Optional[Iterable[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a movie's reviews from our database cursor (TMDB reviews are not included)"""
+        if not movie_id.isdigit():
+            raise ValidationError("Movie ID must be numeric")
+        return self.review_repository.iter_reviews(
+            {"movie_id": movie_id}, skip, limit, batch_size=settings.NDJSON_BATCH_SIZE,
+            projection=ReviewRepository.fields_projection(fields))
+
+    def stream_user_reviews(
+            self,
+            user_id: str,
+            skip: int = 0,
+            limit: int = 10,
+            sort_by: str = "created_at",
+            sort_order: int = -1,
+            fields: Optional[Iterable[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream reviews by a user from the database cursor"""
+        return self.review_repository.iter_reviews(
+            {"user_id": user_id}, skip, limit, sort_by, sort_order,
+            batch_size=settings.NDJSON_BATCH_SIZE,
+            projection=ReviewRepository.fields_projection(fields))
+
     async def get_user_review_for_movie(self, user_id: str, movie_id: str) -> Optional[Dict[str, Any]]:
         """Get a user's review for a specific movie"""
         try:
@@ -227,20 +293,24 @@ class ReviewService:
                 detail=f"Error retrieving user review: {str(e)}"
             )
 
-    async def get_movie_average_rating(self, movie_id: str) -> Dict[str, Any]:
-        """Get average rating from both TMDB and our database"""
+    async def get_movie_average_rating(
+        self,
+        movie_id: str,
+        tmdb_movie: Optional[TMDBMovieResponse] = None
+    ) -> Dict[str, Any]:
+        """Get average rating from both TMDB and our database
+
+        ``tmdb_movie`` is the movie already fetched with ``get_tmdb_movie``.
+        """
         try:
             # Validate movie_id format
             if not movie_id.isdigit():
                 raise ValidationError("Movie ID must be numeric")
 
             # Get TMDB rating first
-            try:
-                movie_details = await self.tmdb_service.get_movie(movie_id)
-                tmdb_rating = movie_details.vote_average if movie_details else None
-            except Exception as e:
-                logger.error(f"Error fetching TMDB rating: {str(e)}")
-                tmdb_rating = None
+            if tmdb_movie is None:
+                tmdb_movie = await self.get_tmdb_movie(movie_id)
+            tmdb_rating = tmdb_movie.vote_average if tmdb_movie else None
 
             # Get our database average rating
             db_rating = await self.review_repository.get_movie_average_rating(movie_id)
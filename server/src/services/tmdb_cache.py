@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import math
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
+
+from src.config import settings
+from src.database.connection import mongo
+from src.database.repositories.tmdb_cache import TMDBCacheRepository
+from src.utils.cache import CacheEntry, TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Fresh (soft) TTL in seconds per TMDB endpoint; the first matching pattern
+# wins and endpoints without a policy are never cached. Entries may be served
+# stale for TMDB_CACHE_MAX_STALE seconds after the soft TTL (the hard TTL).
+TMDB_CACHE_POLICIES: List[Tuple[Pattern, int]] = [
+    (re.compile(r"^/genre/movie/list$"), settings.TMDB_CACHE_TTL_GENRES),
+    (re.compile(r"^/movie/(popular|top_rated|now_playing|upcoming)$"),
+     settings.TMDB_CACHE_TTL_LISTS),
+    (re.compile(r"^/movie/\d+(/credits|/videos)?$"), settings.TMDB_CACHE_TTL_MOVIE),
+    (re.compile(r"^/movie/\d+/reviews$"), settings.TMDB_CACHE_TTL_REVIEWS),
+    (re.compile(r"^/(search|discover)/movie$"), settings.TMDB_CACHE_TTL_SEARCH),
+]
+
+
+class TMDBResponseCache:
+    """Two-tier cache for raw TMDB response payloads
+
+    Lookups go to the in-process memory tier first and then to the shared
+    ``tmdb_cache`` MongoDB collection, which survives deploys and is shared
+    between workers. Keys are the request keys built by TMDBService. Entries
+    are fresh until their soft TTL and can be served stale until their hard
+    TTL while TMDBService revalidates them.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = settings.TMDB_CACHE_MAX_BYTES,
+        max_stale: int = settings.TMDB_CACHE_MAX_STALE,
+        use_mongo: bool = settings.TMDB_CACHE_MONGO_ENABLED
+    ):
+        self.memory = TTLCache(max_bytes)
+        self.max_stale = max_stale
+        self.use_mongo = use_mongo
+        self._repository: Optional[TMDBCacheRepository] = None
+        self._pending_writes: Set[asyncio.Task] = set()
+        self.shared_hits = 0
+        self.shared_misses = 0
+
+    @staticmethod
+    def ttl_for(endpoint: str) -> Optional[int]:
+        """Get the cache TTL for an endpoint, or None if it is not cacheable"""
+        for pattern, ttl in TMDB_CACHE_POLICIES:
+            if pattern.match(endpoint):
+                return ttl
+        return None
+
+    def _get_repository(self) -> Optional[TMDBCacheRepository]:
+        """Get the shared tier repository, or None when MongoDB is unavailable"""
+        if not self.use_mongo or mongo.db is None:
+            return None
+        if self._repository is None:
+            self._repository = TMDBCacheRepository()
+        return self._repository
+
+    async def initialize(self):
+        """Create the shared tier indexes"""
+        repository = self._get_repository()
+        if repository is not None:
+            await repository.ensure_indexes()
+
+    def get(self, key: str, endpoint: str) -> Optional[CacheEntry]:
+        """Get a fresh or stale entry from the memory tier"""
+        if self.ttl_for(endpoint) is None:
+            return None
+        return self.memory.get_entry(key)
+
+    def contains(self, key: str) -> bool:
+        """Check whether the memory tier holds a fresh or stale entry, without counting a lookup"""
+        return key in self.memory
+
+    async def get_shared(self, key: str, endpoint: str) -> Optional[CacheEntry]:
+        """Get a fresh or stale entry from the shared tier and promote it to memory"""
+        ttl = self.ttl_for(endpoint)
+        repository = self._get_repository()
+        if ttl is None or repository is None:
+            return None
+        try:
+            doc = await repository.get_entry(key)
+        except Exception as e:
+            logger.warning(f"TMDB cache read failed for {key}: {str(e)}")
+            return None
+        if doc is None:
+            self.shared_misses += 1
+            return None
+        self.shared_hits += 1
+
+        # Keep the remaining soft and hard TTLs of the shared entry
+        fresh_for = self._seconds_until(doc.get("stale_at"))
+        expires_in = self._seconds_until(doc.get("expires_at"))
+        return self.memory.set(
+            key, doc["payload"], fresh_for, max(expires_in - fresh_for, 0.0))
+
+    @staticmethod
+    def _seconds_until(moment: Optional[datetime]) -> float:
+        """Seconds from now until a stored UTC datetime (naive values are UTC)"""
+        if moment is None:
+            return 0.0
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return max((moment - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def set(self, key: str, endpoint: str, payload: Dict[str, Any]) -> CacheEntry:
+        """Cache a fresh payload in memory and write it back to the shared tier
+
+        Returns the cache entry for the payload; payloads of endpoints without
+        a cache policy are returned as an uncached, always-fresh entry.
+        """
+        ttl = self.ttl_for(endpoint)
+        if not ttl:
+            return CacheEntry(payload, 0, math.inf, math.inf)
+        entry = self.memory.set(key, payload, ttl, self.max_stale)
+
+        repository = self._get_repository()
+        if repository is not None:
+            task = asyncio.create_task(
+                self._write_back(repository, key, endpoint, payload, ttl))
+            # Keep a reference so the task is not garbage collected mid-write
+            self._pending_writes.add(task)
+            task.add_done_callback(self._pending_writes.discard)
+        return entry
+
+    async def _write_back(
+        self,
+        repository: TMDBCacheRepository,
+        key: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        ttl: int
+    ):
+        """Persist a payload to the shared tier without failing the request"""
+        try:
+            await repository.set_payload(key, endpoint, payload, ttl, self.max_stale)
+        except Exception as e:
+            logger.warning(f"TMDB cache write failed for {key}: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and memory usage"""
+        return {
+            **self.memory.stats(),
+            "shared_hits": self.shared_hits,
+            "shared_misses": self.shared_misses,
+            "pending_writes": len(self._pending_writes)
+        }
+
+
+# Shared by every TMDBService instance in the process
+tmdb_response_cache = TMDBResponseCache()
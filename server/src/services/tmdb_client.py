@@ -0,0 +1,64 @@
+import logging
+from typing import Optional
+
+import httpx
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TMDBClient:
+    """Process-wide pooled HTTP client for the TMDB API"""
+
+    def __init__(self):
+        self.client: Optional[httpx.AsyncClient] = None
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """Create an AsyncClient with keep-alive pooling and optional HTTP/2"""
+        http2 = settings.TMDB_HTTP2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning(
+                    "h2 package not installed, using HTTP/1.1 for TMDB requests")
+                http2 = False
+
+        return httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(
+                settings.TMDB_HTTP_TIMEOUT,
+                connect=settings.TMDB_HTTP_CONNECT_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.TMDB_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.TMDB_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.TMDB_HTTP_KEEPALIVE_EXPIRY
+            )
+        )
+
+    async def connect(self):
+        """Create the shared client"""
+        if self.client is not None:
+            return
+        self.client = self._build_client()
+        logger.info("TMDB HTTP client started")
+
+    async def close(self):
+        """Close the shared client and release pooled connections"""
+        if self.client is not None:
+            try:
+                await self.client.aclose()
+                logger.info("TMDB HTTP client closed")
+            finally:
+                self.client = None
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Get the shared client, creating it on first use outside the app lifespan"""
+        if self.client is None:
+            self.client = self._build_client()
+        return self.client
+
+
+tmdb_client = TMDBClient()
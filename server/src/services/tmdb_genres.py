@@ -0,0 +1,46 @@
+import logging
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from src.services.tmdb_service import TMDBService
+
+logger = logging.getLogger(__name__)
+
+
+class GenreRegistry:
+    """Process-wide TMDB genre ID to name map
+
+    Loaded once at startup and refreshed by the cache warmer, so converting
+    the genre IDs of a result page is a plain dictionary lookup. ``version``
+    increases every time the map contents change.
+    """
+
+    def __init__(self):
+        self.genres: Dict[int, str] = {}
+        self.version = 0
+        self.refreshed_at: Optional[datetime] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the genre map has been loaded"""
+        return self.refreshed_at is not None
+
+    async def refresh(self, tmdb_service: "TMDBService"):
+        """Reload the genre map from TMDB"""
+        genres = await tmdb_service.get_genres()
+        genre_map = {genre["id"]: genre["name"] for genre in genres}
+        if genre_map != self.genres:
+            self.genres = genre_map
+            self.version += 1
+            logger.info(
+                f"Loaded {len(genre_map)} genres (version {self.version})")
+        self.refreshed_at = datetime.now(timezone.utc)
+
+    def names_for(self, genre_ids: List[int]) -> List[Dict[str, Any]]:
+        """Convert genre IDs to genre dictionaries with id and name"""
+        return [{"id": genre_id, "name": self.genres.get(genre_id, "Unknown")}
+                for genre_id in genre_ids]
+
+
+genre_registry = GenreRegistry()
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set, TypeVar
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RequestHedger:
+    """Hedge slow TMDB requests with a second identical request
+
+    Latencies of recent upstream calls are kept in a rolling window. When
+    hedging is enabled and a call has not finished after the configured
+    percentile of that window, an identical call is started if the caller
+    can spare a rate limit token for it. The first call to succeed wins and
+    the other is cancelled.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = settings.TMDB_HEDGE_ENABLED,
+        percentile: float = settings.TMDB_HEDGE_PERCENTILE,
+        min_delay: float = settings.TMDB_HEDGE_MIN_DELAY,
+        min_samples: int = settings.TMDB_HEDGE_MIN_SAMPLES,
+        window: int = settings.TMDB_HEDGE_WINDOW
+    ):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    def record(self, seconds: float):
+        """Record the latency of an upstream call"""
+        self._latencies.append(seconds)
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while there are too few samples"""
+        if len(self._latencies) < self.min_samples:
+            return None
+        latencies = sorted(self._latencies)
+        index = min(math.ceil(len(latencies) * self.percentile / 100) - 1, len(latencies) - 1)
+        return max(latencies[max(index, 0)], self.min_delay)
+
+    async def _timed(self, send: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        try:
+            result = await send()
+        except asyncio.CancelledError:
+            # Cancelled calls are the losers, i.e. the slow tail. Their
+            # elapsed time is a lower bound of their latency; leaving them
+            # out would pull the hedge delay down over time.
+            self.record(time.monotonic() - started)
+            raise
+        self.record(time.monotonic() - started)
+        return result
+
+    async def run(
+        self,
+        send: Callable[[], Awaitable[T]],
+        can_hedge: Callable[[], bool]
+    ) -> T:
+        """Run ``send``, hedging it if it is slow and ``can_hedge()`` allows it
+
+        ``can_hedge`` is only called when a hedge is due and should take the
+        rate limit token for it.
+        """
+        delay = self.delay() if self.enabled else None
+        if delay is None:
+            return await self._timed(send)
+
+        primary = asyncio.ensure_future(self._timed(send))
+        pending: Set[asyncio.Future] = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done and can_hedge():
+                self.hedges_sent += 1
+                pending.add(asyncio.ensure_future(self._timed(send)))
+
+            error: Optional[BaseException] = None
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedges_won += 1
+                        return task.result()
+                    error = error or task.exception()
+                if not pending:
+                    raise error
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # Cancel the losing request
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hedge counters and the current hedge delay, for monitoring"""
+        delay = self.delay()
+        return {
+            "enabled": self.enabled,
+            "samples": len(self._latencies),
+            "delay": round(delay, 4) if delay is not None else None,
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won
+        }
+
+
+# Shared by every TMDBService instance in the process
+tmdb_hedger = RequestHedger()
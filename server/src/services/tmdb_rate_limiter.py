@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket with a sustained refill rate and a burst capacity"""
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Token bucket rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self):
+        """Add the tokens accrued since the last update"""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    @property
+    def tokens(self) -> float:
+        """Current token level"""
+        self._refill()
+        return self._tokens
+
+    def try_consume(self, tokens: float = 1.0, reserve: float = 0.0) -> bool:
+        """Take tokens if at least ``reserve`` tokens are left afterwards"""
+        self._refill()
+        if self._tokens - tokens < reserve:
+            return False
+        self._tokens -= tokens
+        return True
+
+    def time_until(self, tokens: float) -> float:
+        """Seconds until the bucket holds ``tokens`` tokens"""
+        self._refill()
+        return max(tokens - self._tokens, 0.0) / self.rate
+
+
+class LaneStats:
+    """Wait-time counters for one priority lane"""
+
+    __slots__ = ("acquired", "queued", "total_wait", "max_wait")
+
+    def __init__(self):
+        self.acquired = 0
+        self.queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float):
+        self.acquired += 1
+        if wait > 0:
+            self.queued += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+
+class TMDBRateLimiter:
+    """TMDB API rate limiter with priority lanes
+
+    A single token bucket enforces the TMDB quota. Every call is tagged with
+    a lane: ``interactive`` for user-facing requests, ``prefetch`` for cache
+    warming and revalidation, and ``bulk`` for imports. Waiting calls are
+    granted tokens in strict lane order, so an interactive call always gets
+    the next token. Lower lanes only take tokens while the bucket holds more
+    than their reserve, which keeps a burst of headroom for the lanes above.
+    """
+
+    INTERACTIVE = "interactive"
+    PREFETCH = "prefetch"
+    BULK = "bulk"
+    # Highest priority first
+    LANES = (INTERACTIVE, PREFETCH, BULK)
+
+    def __init__(
+        self,
+        requests_per_second: float = settings.TMDB_RATE_LIMIT_RPS,
+        burst: int = settings.TMDB_RATE_LIMIT_BURST,
+        reserves: Optional[Dict[str, float]] = None
+    ):
+        self._bucket = TokenBucket(requests_per_second, burst)
+        self._reserves = reserves if reserves is not None else {
+            self.INTERACTIVE: 0.0,
+            self.PREFETCH: settings.TMDB_PREFETCH_RESERVE,
+            self.BULK: settings.TMDB_BULK_RESERVE,
+        }
+        for lane, reserve in self._reserves.items():
+            # A lane is only served once the bucket holds a token on top of
+            # its reserve, which a full bucket must be able to cover
+            if reserve < 0 or reserve + 1 > burst:
+                raise ValueError(
+                    f"Rate limit reserve for {lane} must be between 0 and burst - 1 ({burst - 1})")
+        self._queues: Dict[str, Deque[asyncio.Future]] = {
+            lane: deque() for lane in self.LANES}
+        self._stats = {lane: LaneStats() for lane in self.LANES}
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def _check_lane(self, lane: str):
+        if lane not in self._queues:
+            raise ValueError(f"Unknown rate limit lane: {lane}")
+
+    def _has_waiters(self, lane: str) -> bool:
+        """Check whether calls are queued in ``lane`` or any lane above it"""
+        for name in self.LANES:
+            if any(not waiter.done() for waiter in self._queues[name]):
+                return True
+            if name == lane:
+                return False
+        return False
+
+    def try_acquire(self, lane: str = INTERACTIVE) -> bool:
+        """Take a token without waiting; False if the call would have to queue"""
+        self._check_lane(lane)
+        if self._has_waiters(lane) or not self._bucket.try_consume(1.0, self._reserves[lane]):
+            return False
+        self._stats[lane].record(0.0)
+        return True
+
+    async def acquire(self, lane: str = INTERACTIVE):
+        """Acquire request permission, waiting behind higher priority calls"""
+        if self.try_acquire(lane):
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues[lane].append(waiter)
+        queued_at = time.monotonic()
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self._queues[lane]:
+                self._queues[lane].remove(waiter)
+            raise
+        wait = time.monotonic() - queued_at
+        self._stats[lane].record(wait)
+        logger.debug(f"Rate limiter delayed {lane} request by {wait:.3f}s")
+
+    def _dispatch(self):
+        """Grant tokens to queued calls in lane order and schedule the next run"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        for lane in self.LANES:
+            queue = self._queues[lane]
+            reserve = self._reserves[lane]
+            while queue:
+                if queue[0].done():
+                    # Cancelled while waiting
+                    queue.popleft()
+                    continue
+                if not self._bucket.try_consume(1.0, reserve):
+                    break
+                queue.popleft().set_result(None)
+            if queue:
+                # Lower lanes never overtake a lane that is still waiting
+                delay = self._bucket.time_until(1.0 + reserve)
+                self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+
+    @property
+    def tokens(self) -> float:
+        """Current token level"""
+        return self._bucket.tokens
+
+    def stats(self) -> Dict[str, Any]:
+        """Token level and per-lane queue depth and wait times, for monitoring"""
+        lanes = {}
+        for lane in self.LANES:
+            lane_stats = self._stats[lane]
+            lanes[lane] = {
+                "queue_depth": sum(1 for waiter in self._queues[lane] if not waiter.done()),
+                "acquired": lane_stats.acquired,
+                "queued": lane_stats.queued,
+                "avg_wait": round(lane_stats.total_wait / lane_stats.queued, 4)
+                if lane_stats.queued else 0.0,
+                "max_wait": round(lane_stats.max_wait, 4)
+            }
+        return {"tokens": round(self._bucket.tokens, 3), "lanes": lanes}
+
+
+# Shared by every TMDBService instance in the process
+tmdb_rate_limiter = TMDBRateLimiter()
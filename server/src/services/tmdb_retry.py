@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying; every other error status is final
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryBudget:
+    """Process-wide allowance of retries as a fraction of normal traffic
+
+    Every first attempt adds ``ratio`` tokens and every retry spends one, so
+    retries stay at about ``ratio`` of the request rate. ``min_per_second``
+    tokens accrue over time so that retries still work at low traffic.
+    During an upstream incident the budget runs dry and failures surface
+    instead of multiplying load.
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, capacity: float):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self._balance = capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._balance = min(
+            self.capacity, self._balance + (now - self._updated_at) * self.min_per_second)
+        self._updated_at = now
+
+    def deposit(self):
+        """Record a first attempt"""
+        self._refill()
+        self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take the allowance for one retry, if there is any"""
+        self._refill()
+        if self._balance < 1.0:
+            return False
+        self._balance -= 1.0
+        return True
+
+    @property
+    def balance(self) -> float:
+        self._refill()
+        return self._balance
+
+
+class TMDBRetryPolicy:
+    """Single retry engine for TMDB calls
+
+    Timeouts, transport errors and retryable statuses (429 and 5xx) are
+    retried up to ``max_attempts`` attempts in total, with full-jitter
+    exponential backoff, or the server's ``Retry-After`` when it sends one.
+    Every retry must be covered by the shared retry budget.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = settings.TMDB_RETRY_MAX_ATTEMPTS,
+        base_delay: float = settings.TMDB_RETRY_BASE_DELAY,
+        max_delay: float = settings.TMDB_RETRY_MAX_DELAY,
+        budget: Optional[RetryBudget] = None
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget if budget is not None else RetryBudget(
+            settings.TMDB_RETRY_BUDGET_RATIO,
+            settings.TMDB_RETRY_BUDGET_MIN_PER_SECOND,
+            settings.TMDB_RETRY_BUDGET_CAPACITY
+        )
+        self.retries = 0
+        self.budget_exhausted = 0
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (1-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def retry_after(response: httpx.Response) -> Optional[float]:
+        """Seconds from a ``Retry-After`` header, if it holds a number"""
+        value = response.headers.get("Retry-After")
+        try:
+            return max(float(value), 0.0) if value is not None else None
+        except ValueError:
+            return None
+
+    def _should_retry(self, attempt: int, description: str) -> bool:
+        if attempt >= self.max_attempts:
+            return False
+        if not self.budget.try_spend():
+            self.budget_exhausted += 1
+            logger.warning(f"Retry budget exhausted, not retrying {description}")
+            return False
+        self.retries += 1
+        return True
+
+    async def run(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Call ``send`` until it gives a final response
+
+        Returns the last response, which may still have a retryable error
+        status once attempts or budget run out; the last transport error is
+        raised in that case instead.
+        """
+        self.budget.deposit()
+        attempt = 1
+        while True:
+            try:
+                response = await send()
+            except httpx.TransportError as e:
+                # Timeouts are transport errors too
+                if not self._should_retry(attempt, type(e).__name__):
+                    raise
+                delay = self.backoff(attempt)
+            else:
+                if response.status_code not in RETRYABLE_STATUSES:
+                    return response
+                retry_after = self.retry_after(response)
+                if retry_after is not None and retry_after > self.max_delay:
+                    # Waiting that long would outlast the caller
+                    return response
+                if not self._should_retry(attempt, f"HTTP {response.status_code}"):
+                    return response
+                delay = retry_after if retry_after is not None else self.backoff(attempt)
+
+            logger.info(f"Retrying TMDB request in {delay:.2f}s (attempt {attempt + 1})")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Retry counters and the remaining budget, for monitoring"""
+        return {
+            "retries": self.retries,
+            "budget_exhausted": self.budget_exhausted,
+            "budget_balance": round(self.budget.balance, 3)
+        }
+
+
+# Shared by every TMDBService instance in the process
+tmdb_retry_policy = TMDBRetryPolicy()
@@ -1,53 +1,65 @@
 import asyncio
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlencode
+
 import httpx
-from pydantic import BaseModel, Field
 from src.config import settings
-from src.models.tmdb_movie import (TMDBMovieCreditsResponse,
+from src.models.tmdb_movie import (TMDBMovieBatchItem,
+                                   TMDBMovieCreditsResponse,
                                    TMDBMovieDetailResponse, TMDBMovieResponse,
-                                   TMDBMovieVideosResponse, TMDBReview)
+                                   TMDBMovieVideosResponse, TMDBReview,
+                                   movie_list_adapter)
+from src.services.tmdb_cache import tmdb_response_cache
+from src.services.tmdb_client import tmdb_client
+from src.services.tmdb_genres import genre_registry
+from src.services.tmdb_hedging import tmdb_hedger
+from src.services.tmdb_rate_limiter import TMDBRateLimiter, tmdb_rate_limiter
+from src.services.tmdb_retry import tmdb_retry_policy
+from src.utils.cache import CacheEntry
+from src.utils.exceptions import (ExternalAPIError, MovieError,
+                                  MovieNotFoundError, RateLimitError,
+                                  UnauthorizedError)
+from src.utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
-
-class TMDBRateLimiter:
-    """TMDB API rate limiter"""
-
-    def __init__(self, requests_per_second: float = 0.5):
-        self.rate = requests_per_second
-        self.last_request_time = datetime.now()
-        self._lock = None
-        self._semaphore = None
-
-    async def acquire(self):
-        """Acquire request permission"""
-        # Create semaphore if it doesn't exist
-        if self._semaphore is None:
-            self._semaphore = asyncio.Semaphore(1)
-
-        async with self._semaphore:
-            now = datetime.now()
-            time_since_last_request = (
-                now - self.last_request_time).total_seconds()
-            if time_since_last_request < 1.0 / self.rate:
-                await asyncio.sleep(1.0 / self.rate - time_since_last_request)
-            self.last_request_time = datetime.now()
+# Process-wide registry of in-flight TMDB requests, keyed on the request key
+# (endpoint + params) and the rate limiter lane
+_inflight_requests = SingleFlight()
+# Background revalidations of stale cache entries, keyed like requests
+_revalidations: Dict[str, asyncio.Task] = {}
+# Background page-ahead prefetches of list pages, keyed like requests
+_prefetches: Dict[str, asyncio.Task] = {}
 
 
 class TMDBService:
     """Service for TMDB API operations"""
 
-    def __init__(self):
-        self.base_url = "https://api.themoviedb.org/3"
+    # Sub-resources fetched together with /movie/{id} via append_to_response
+    DETAIL_APPENDS = ("reviews", "credits", "videos")
+    # TMDB list endpoints return fixed pages of 20 results, up to page 500
+    PAGE_SIZE = 20
+    MAX_PAGE = 500
+
+    def __init__(
+        self,
+        priority: str = TMDBRateLimiter.INTERACTIVE,
+        use_cache: Optional[bool] = None
+    ):
+        self.base_url = settings.TMDB_API_BASE_URL
         self.api_key = settings.TMDB_API_KEY
         self.access_token = settings.TMDB_ACCESS_TOKEN
-        self.rate_limiter = TMDBRateLimiter()
-        self.timeout = httpx.Timeout(10.0, connect=5.0)
-        self.max_retries = 3
-        self.retry_delay = 1.0  # seconds
-        self._genre_cache = None
+        self.rate_limiter = tmdb_rate_limiter
+        self.hedger = tmdb_hedger
+        # Default rate limiter lane for this service's calls
+        self.priority = priority
+        # Bulk jobs fetch payloads no user asked for, so by default they
+        # bypass the response caches instead of filling them
+        self.use_cache = use_cache if use_cache is not None else priority != TMDBRateLimiter.BULK
+        self.timeout = httpx.Timeout(
+            settings.TMDB_HTTP_TIMEOUT, connect=settings.TMDB_HTTP_CONNECT_TIMEOUT)
+        self.retry_policy = tmdb_retry_policy
 
         # Give priority to using the Bearer Token. If not available, use the API Key
         if self.access_token:
@@ -62,130 +74,323 @@ class TMDBService:
 
     async def _get_genre_map(self) -> Dict[int, str]:
         """Get genre ID to name mapping"""
-        if self._genre_cache is None:
-            genres = await self.get_genres()
-            self._genre_cache = {genre["id"]: genre["name"]
-                                 for genre in genres}
-        return self._genre_cache
+        await self._ensure_genres()
+        return genre_registry.genres
+
+    async def _ensure_genres(self):
+        """Load the process-wide genre map if startup preloading did not run"""
+        if not genre_registry.is_loaded:
+            await genre_registry.refresh(self)
 
-    async def _convert_genre_ids_to_names(self, genre_ids: List[int]) -> List[Dict[str, Any]]:
+    def _convert_genre_ids_to_names(self, genre_ids: List[int]) -> List[Dict[str, Any]]:
         """Convert genre IDs to genre dictionaries with id and name"""
-        genre_map = await self._get_genre_map()
-        return [{"id": genre_id, "name": genre_map.get(genre_id, "Unknown")} for genre_id in genre_ids]
+        return genre_registry.names_for(genre_ids)
+
+    def _resolve_genres(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Get genre dictionaries for a movie payload
+
+        List endpoints return ``genre_ids`` while ``/movie/{id}`` already
+        returns full genre objects.
+        """
+        if "genre_ids" in data:
+            return self._convert_genre_ids_to_names(data["genre_ids"] or [])
+        return data.get("genres") or []
+
+    async def _build_movie_list(self, results: List[Dict[str, Any]]) -> List[TMDBMovieResponse]:
+        """Build movie models from a TMDB result list without mutating it
+
+        The list is validated in one call, which is several times cheaper
+        than building each model on its own.
+        """
+        await self._ensure_genres()
+        # Convert ids to strings and genre_ids to genre names
+        return movie_list_adapter.validate_python([
+            {
+                **movie_data,
+                "id": str(movie_data["id"]),
+                "genres": self._resolve_genres(movie_data)
+            }
+            for movie_data in results
+        ])
+
+    async def _get_list_window(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        skip: int,
+        limit: int
+    ) -> List[TMDBMovieResponse]:
+        """Get ``limit`` movies starting at ``skip`` from a paged TMDB list
+
+        The TMDB pages spanned by the window are requested concurrently
+        (through the cache), merged and sliced, and the page after the
+        window is prefetched in the background.
+        """
+        first_page = skip // self.PAGE_SIZE + 1
+        last_page = min((skip + limit - 1) // self.PAGE_SIZE + 1, self.MAX_PAGE)
+        if first_page > last_page:
+            return []
+        payloads = await asyncio.gather(*(
+            self._make_request(endpoint, {**params, "page": page})
+            for page in range(first_page, last_page + 1)
+        ))
+
+        # Lists can shift between page fetches, so drop repeated movies
+        seen = set()
+        results = []
+        for data in payloads:
+            for movie_data in data.get("results", []):
+                if movie_data["id"] not in seen:
+                    seen.add(movie_data["id"])
+                    results.append(movie_data)
+        offset = skip - (first_page - 1) * self.PAGE_SIZE
+
+        total_pages = min(payloads[-1].get("total_pages") or 0, self.MAX_PAGE)
+        if last_page < total_pages:
+            self._schedule_prefetch(endpoint, {**params, "page": last_page + 1})
+        return await self._build_movie_list(results[offset:offset + limit])
+
+    def _schedule_prefetch(self, endpoint: str, params: Dict[str, Any]):
+        """Load a list page into the cache in the background, once per key"""
+        key = self._request_key(endpoint, params)
+        if key in _prefetches or tmdb_response_cache.contains(key):
+            return
+        task = asyncio.create_task(self._prefetch(endpoint, params))
+        _prefetches[key] = task
+        task.add_done_callback(lambda _: _prefetches.pop(key, None))
+
+    async def _prefetch(self, endpoint: str, params: Dict[str, Any]):
+        """Load a page ahead of the client on the prefetch lane"""
+        try:
+            await self._make_request(endpoint, params, priority=TMDBRateLimiter.PREFETCH)
+        except Exception as e:
+            logger.debug(f"Prefetch failed for {endpoint} {params}: {str(e)}")
+
+    @staticmethod
+    def _request_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a normalized key for an endpoint and its query parameters"""
+        normalized = sorted(
+            (name, str(value).lower() if isinstance(value, bool) else str(value))
+            for name, value in (params or {}).items()
+            if value is not None
+        )
+        return f"{endpoint}?{urlencode(normalized)}" if normalized else endpoint
+
+    @staticmethod
+    async def _share(
+        key: str,
+        priority: str,
+        fn: Callable[[], Awaitable[CacheEntry]]
+    ) -> CacheEntry:
+        """Run ``fn`` once for concurrent requests of ``key``
+
+        A call joins a flight started on its own lane or a higher one, but
+        never one on a lower lane, whose upstream call may be queued behind
+        that lane's reserve; it starts its own flight instead.
+        """
+        for lane in TMDBRateLimiter.LANES:
+            flight = (key, lane)
+            if lane == priority or _inflight_requests.is_inflight(flight):
+                return await _inflight_requests.do(flight, fn)
+        raise ValueError(f"Unknown rate limit lane: {priority}")
 
     async def _make_request(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0
+        priority: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Make a request to TMDB API"""
-        try:
-            # Wait for rate limit
-            await self.rate_limiter.acquire()
-
-            # Merge request parameters
-            request_params = {**self.params, **(params or {})}
-
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}{endpoint}",
-                    headers=self.headers,
-                    params=request_params
-                )
-
-                # Check for error responses
-                if response.status_code >= 400:
-                    error_data = response.json()
-                    error_message = error_data.get(
-                        "status_message", "Unknown error")
-
-                    # Handle specific error cases
-                    if response.status_code == 404:
-                        logger.error(f"Movie not found: {endpoint}")
-                        raise httpx.HTTPStatusError(
-                            f"HTTP 404: Movie not found - {error_message}",
-                            request=response.request,
-                            response=response
-                        )
-                    elif response.status_code == 401:
-                        logger.error(f"Unauthorized access: {endpoint}")
-                        raise httpx.HTTPStatusError(
-                            f"HTTP 401: Unauthorized access - {error_message}",
-                            request=response.request,
-                            response=response
-                        )
-                    elif response.status_code == 429:
-                        logger.warning(f"Rate limit exceeded: {endpoint}")
-                        if retry_count < self.max_retries:
-                            retry_after = int(response.headers.get(
-                                "Retry-After", self.retry_delay))
-                            await asyncio.sleep(retry_after)
-                            return await self._make_request(endpoint, params, retry_count + 1)
-                        raise httpx.HTTPStatusError(
-                            f"HTTP 429: Too Many Requests - Rate limit exceeded after {self.max_retries} retries",
-                            request=response.request,
-                            response=response
-                        )
-                    else:
-                        raise httpx.HTTPStatusError(
-                            f"HTTP {response.status_code}: {error_message}",
-                            request=response.request,
-                            response=response
-                        )
-
-                return response.json()
+        """Make a request to TMDB API
+
+        Responses are served from the shared cache when possible, and
+        identical concurrent requests share a single upstream call. Stale
+        cache entries are returned immediately while a background task
+        revalidates them. The returned payload may be shared between callers
+        and must not be mutated. ``priority`` is the rate limiter lane for
+        an upstream call and defaults to the service's lane. Without
+        ``use_cache`` every request goes straight to TMDB.
+        """
+        priority = priority or self.priority
+        if not self.use_cache:
+            return await self._fetch(endpoint, params, priority=priority)
+        key = self._request_key(endpoint, params)
+        entry = tmdb_response_cache.get(key, endpoint)
+        if entry is None:
+            entry = await self._share(
+                key, priority, lambda: self._load(key, endpoint, params, priority, accept_stale=True))
+        if entry.is_stale:
+            self._schedule_revalidation(key, endpoint, params)
+        return entry.value
+
+    async def refresh_cache(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Fetch an endpoint from TMDB and replace its cached response
 
-        except httpx.TimeoutException as e:
-            logger.error(f"Request timeout for {endpoint}: {str(e)}")
-            if retry_count < self.max_retries:
-                await asyncio.sleep(self.retry_delay * (retry_count + 1))
-                return await self._make_request(endpoint, params, retry_count + 1)
-            raise
+        Used to renew cache entries before they go stale; identical
+        concurrent requests still share the upstream call.
+        """
+        key = self._request_key(endpoint, params)
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error for {endpoint}: {str(e)}")
-            if e.response.status_code == 429 and retry_count < self.max_retries:
-                retry_after = int(e.response.headers.get(
-                    "Retry-After", self.retry_delay))
-                await asyncio.sleep(retry_after)
-                return await self._make_request(endpoint, params, retry_count + 1)
-            raise
+        async def reload() -> CacheEntry:
+            data = await self._fetch(endpoint, params, priority=self.priority)
+            return tmdb_response_cache.set(key, endpoint, data)
 
+        entry = await self._share(key, self.priority, reload)
+        return entry.value
+
+    async def _load(
+        self,
+        key: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        priority: str = TMDBRateLimiter.INTERACTIVE,
+        accept_stale: bool = False
+    ) -> CacheEntry:
+        """Get a response from the shared cache tier or TMDB, filling the caches"""
+        entry = await tmdb_response_cache.get_shared(key, endpoint)
+        if entry is not None and (accept_stale or not entry.is_stale):
+            return entry
+        data = await self._fetch(endpoint, params, priority=priority)
+        return tmdb_response_cache.set(key, endpoint, data)
+
+    def _schedule_revalidation(
+        self,
+        key: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ):
+        """Refresh a stale cache entry in the background, once per key"""
+        if key in _revalidations:
+            return
+        task = asyncio.create_task(self._revalidate(key, endpoint, params))
+        _revalidations[key] = task
+        task.add_done_callback(lambda _: _revalidations.pop(key, None))
+
+    async def _revalidate(
+        self,
+        key: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ):
+        """Refresh a cache entry, keeping the stale value if TMDB fails"""
+        try:
+            # Stale data is already being served, so this is not user-facing
+            await self._share(
+                key, TMDBRateLimiter.PREFETCH,
+                lambda: self._load(key, endpoint, params, TMDBRateLimiter.PREFETCH))
         except Exception as e:
-            logger.error(f"Unexpected error for {endpoint}: {str(e)}")
-            if retry_count < self.max_retries:
-                await asyncio.sleep(self.retry_delay * (retry_count + 1))
-                return await self._make_request(endpoint, params, retry_count + 1)
-            raise
+            logger.warning(
+                f"Revalidation failed for {key}, serving stale data: {str(e)}")
 
-    async def _make_request_with_retry(self, endpoint: str, params: Optional[Dict[str, Any]] = None, max_retries: int = 3) -> Dict[str, Any]:
-        """Make a request to TMDB API with retry mechanism"""
-        for attempt in range(max_retries):
-            try:
-                return await self._make_request(endpoint, params)
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise
-                await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        priority: str = TMDBRateLimiter.INTERACTIVE
+    ) -> Dict[str, Any]:
+        """Send a request to TMDB API, retrying transient failures"""
+        # Merge request parameters
+        request_params = {**self.params, **(params or {})}
+        # Reuse the pooled app-lifetime client
+        client = tmdb_client.get_client()
+
+        def send():
+            return client.get(
+                f"{self.base_url}{endpoint}",
+                headers=self.headers,
+                params=request_params,
+                timeout=self.timeout
+            )
+
+        async def attempt() -> httpx.Response:
+            # Every attempt, retries included, waits for the rate limit
+            await self.rate_limiter.acquire(priority)
+            # Only user-facing calls are hedged, and only with spare tokens
+            return await self.hedger.run(
+                send,
+                lambda: priority == TMDBRateLimiter.INTERACTIVE
+                and self.rate_limiter.try_acquire(TMDBRateLimiter.PREFETCH)
+            )
+
+        try:
+            response = await self.retry_policy.run(attempt)
+        except httpx.TimeoutException as e:
+            logger.error(f"Request timeout for {endpoint}: {str(e)}")
+            raise ExternalAPIError(f"TMDB request timed out: {endpoint}") from e
+        except httpx.TransportError as e:
+            logger.error(f"Transport error for {endpoint}: {str(e)}")
+            raise ExternalAPIError(f"TMDB request failed: {str(e)}") from e
+
+        if response.status_code >= 400:
+            raise self._error_for_response(endpoint, response)
+        return response.json()
+
+    @staticmethod
+    def _error_for_response(endpoint: str, response: httpx.Response) -> MovieError:
+        """Map a TMDB error response to the application exception for it"""
+        try:
+            error_message = response.json().get("status_message", "Unknown error")
+        except ValueError:
+            error_message = "Unknown error"
+
+        if response.status_code == 404:
+            logger.error(f"Movie not found: {endpoint}")
+            return MovieNotFoundError(f"HTTP 404: Movie not found - {error_message}")
+        if response.status_code == 401:
+            logger.error(f"Unauthorized access: {endpoint}")
+            return UnauthorizedError(f"HTTP 401: Unauthorized access - {error_message}")
+        if response.status_code == 429:
+            logger.warning(f"Rate limit exceeded: {endpoint}")
+            return RateLimitError(f"HTTP 429: Too Many Requests - {error_message}")
+        logger.error(f"HTTP error for {endpoint}: HTTP {response.status_code}")
+        return ExternalAPIError(f"HTTP {response.status_code}: {error_message}")
 
     async def get_movie(self, tmdb_id: str) -> TMDBMovieResponse:
         """Get basic movie information from TMDB"""
         try:
             # Get basic movie details
             data = await self._make_request(f"/movie/{tmdb_id}")
-            # Convert id to string
-            data["id"] = str(data["id"])
-
-            # Convert genre_ids to genre names
-            genre_ids = data.get("genre_ids", [])
-            data["genres"] = await self._convert_genre_ids_to_names(genre_ids)
+            # Convert id to string and resolve genre names
+            movie_data = {**data, "id": str(data["id"])}
+            movie_data["genres"] = self._resolve_genres(data)
 
-            return TMDBMovieResponse(**data)
+            return TMDBMovieResponse(**movie_data)
         except Exception as e:
             logger.error(f"Error getting movie {tmdb_id}: {str(e)}")
             raise
 
+    async def get_movies(
+        self,
+        tmdb_ids: List[str],
+        concurrency: int = settings.TMDB_BATCH_CONCURRENCY
+    ) -> List[TMDBMovieBatchItem]:
+        """Get basic information for many movies, in request order
+
+        Cached movies are served directly; misses are fetched concurrently,
+        at most ``concurrency`` at a time, under the shared rate limiter.
+        A failed lookup is reported on its own item instead of failing the
+        whole batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def lookup(tmdb_id: str) -> TMDBMovieBatchItem:
+            if not tmdb_id.isdigit():
+                return TMDBMovieBatchItem(id=tmdb_id, error="Invalid movie ID format")
+            try:
+                if tmdb_response_cache.contains(self._request_key(f"/movie/{tmdb_id}")):
+                    movie = await self.get_movie(tmdb_id)
+                else:
+                    async with semaphore:
+                        movie = await self.get_movie(tmdb_id)
+                return TMDBMovieBatchItem(id=tmdb_id, movie=movie)
+            except Exception as e:
+                return TMDBMovieBatchItem(id=tmdb_id, error=str(e))
+
+        return await asyncio.gather(*(lookup(tmdb_id) for tmdb_id in tmdb_ids))
+
     async def get_movie_reviews(self, tmdb_id: str, page: int = 1, limit: int = 3) -> tuple[List[TMDBReview], int]:
         """Get movie reviews from TMDB with pagination"""
         try:
@@ -278,16 +483,7 @@ class TMDBService:
                 logger.warning(f"No results found for query: {query}")
                 return []
 
-            movies = []
-            for movie_data in search_data.get("results", []):
-                # Convert id to string
-                movie_data["id"] = str(movie_data["id"])
-                # Convert genre_ids to genre names
-                genre_ids = movie_data.get("genre_ids", [])
-                movie_data["genres"] = await self._convert_genre_ids_to_names(genre_ids)
-
-                movies.append(TMDBMovieResponse(**movie_data))
-                logger.info(f"Added movie: {movie_data.get('title')}")
+            movies = await self._build_movie_list(search_data.get("results", []))
 
             logger.info(f"Returning {len(movies)} movies for query: {query}")
             return movies
@@ -297,74 +493,40 @@ class TMDBService:
                 f"Error searching movies with query '{query}': {str(e)}")
             raise
 
-    async def get_popular_movies(self, page: int = 1) -> List[TMDBMovieResponse]:
+    async def get_popular_movies(self, skip: int = 0, limit: int = PAGE_SIZE) -> List[TMDBMovieResponse]:
         """Get popular movies from TMDB with basic information"""
         try:
-            data = await self._make_request("/movie/popular", {"page": page})
-            movies = []
-            for movie_data in data.get("results", []):
-                # Convert id to string
-                movie_data["id"] = str(movie_data["id"])
-                # Convert genre_ids to genre names
-                genre_ids = movie_data.get("genre_ids", [])
-                movie_data["genres"] = await self._convert_genre_ids_to_names(genre_ids)
-
-                movies.append(TMDBMovieResponse(**movie_data))
-            return movies
+            return await self._get_list_window("/movie/popular", {}, skip, limit)
         except Exception as e:
             logger.error(f"Error getting popular movies: {str(e)}")
             raise
 
-    async def get_top_rated_movies(self, page: int = 1) -> List[TMDBMovieResponse]:
+    async def get_top_rated_movies(self, skip: int = 0, limit: int = PAGE_SIZE) -> List[TMDBMovieResponse]:
         """Get top rated movies from TMDB with basic information"""
         try:
-            data = await self._make_request("/movie/top_rated", {"page": page})
-            movies = []
-            for movie_data in data.get("results", []):
-                # Convert id to string
-                movie_data["id"] = str(movie_data["id"])
-                # Convert genre_ids to genre names
-                genre_ids = movie_data.get("genre_ids", [])
-                movie_data["genres"] = await self._convert_genre_ids_to_names(genre_ids)
-                movies.append(TMDBMovieResponse(**movie_data))
-            return movies
+            return await self._get_list_window("/movie/top_rated", {}, skip, limit)
         except Exception as e:
             logger.error(f"Error getting top rated movies: {str(e)}")
             raise
 
-    async def get_latest_movies(self, page: int = 1) -> List[TMDBMovieResponse]:
+    async def get_latest_movies(self, skip: int = 0, limit: int = PAGE_SIZE) -> List[TMDBMovieResponse]:
         """Get latest movies from TMDB with basic information"""
         try:
-            data = await self._make_request("/movie/now_playing", {"page": page})
-            movies = []
-            for movie_data in data.get("results", []):
-                # Convert id to string
-                movie_data["id"] = str(movie_data["id"])
-                # Convert genre_ids to genre names
-                genre_ids = movie_data.get("genre_ids", [])
-                movie_data["genres"] = await self._convert_genre_ids_to_names(genre_ids)
-                movies.append(TMDBMovieResponse(**movie_data))
-            return movies
+            return await self._get_list_window("/movie/now_playing", {}, skip, limit)
         except Exception as e:
             logger.error(f"Error getting latest movies: {str(e)}")
             raise
 
-    async def get_movies_by_genre(self, genre_id: int, page: int = 1) -> List[TMDBMovieResponse]:
+    async def get_movies_by_genre(
+        self,
+        genre_id: int,
+        skip: int = 0,
+        limit: int = PAGE_SIZE
+    ) -> List[TMDBMovieResponse]:
         """Get movies by genre from TMDB with basic information"""
         try:
-            data = await self._make_request("/discover/movie", {
-                "with_genres": genre_id,
-                "page": page
-            })
-            movies = []
-            for movie_data in data.get("results", []):
-                # Convert id to string
-                movie_data["id"] = str(movie_data["id"])
-                # Convert genre_ids to genre names
-                genre_ids = movie_data.get("genre_ids", [])
-                movie_data["genres"] = await self._convert_genre_ids_to_names(genre_ids)
-                movies.append(TMDBMovieResponse(**movie_data))
-            return movies
+            return await self._get_list_window(
+                "/discover/movie", {"with_genres": genre_id}, skip, limit)
         except Exception as e:
             logger.error(f"Error getting movies by genre {genre_id}: {str(e)}")
             raise
@@ -392,44 +554,50 @@ class TMDBService:
         """Get movie videos (trailers, teasers, etc.) from TMDB"""
         try:
             data = await self._make_request(f"/movie/{tmdb_id}/videos")
-
-            # Process each video to add youtube_url
-            for video in data.get("results", []):
-                if video.get("site") == "YouTube":
-                    video["youtube_url"] = f"https://www.youtube.com/watch?v={video['key']}"
-                else:
-                    video["youtube_url"] = ""
-
-            return TMDBMovieVideosResponse(**data)
+            return self._build_videos_response(data)
         except Exception as e:
             logger.error(f"Error getting videos for movie {tmdb_id}: {str(e)}")
             raise
 
+    @staticmethod
+    def _build_videos_response(data: Dict[str, Any]) -> TMDBMovieVideosResponse:
+        """Build a videos response, adding a youtube_url to each video"""
+        results = [
+            {
+                **video,
+                "youtube_url": f"https://www.youtube.com/watch?v={video['key']}"
+                if video.get("site") == "YouTube" else ""
+            }
+            for video in data.get("results", [])
+        ]
+        return TMDBMovieVideosResponse(**{**data, "results": results})
+
     async def get_movie_with_details(self, movie_id: str) -> TMDBMovieDetailResponse:
-        """Get movie with all details (reviews, credits, videos) from TMDB"""
+        """Get movie with all details (reviews, credits, videos) from TMDB in a single request"""
         try:
-            # Get basic movie details
-            data = await self._make_request(f"/movie/{movie_id}")
-            # Convert id to string
-            data["id"] = str(data["id"])
-
-            # Convert genre_ids to genre names
-            genre_ids = data.get("genre_ids", [])
-            data["genres"] = await self._convert_genre_ids_to_names(genre_ids)
-
-            # Create base movie object
-            movie = TMDBMovieDetailResponse(**data)
-
-            # Get additional details
-            reviews, total_reviews = await self.get_movie_reviews(movie_id)
-            credits = await self.get_movie_credits(movie_id)
-            videos = await self.get_movie_videos(movie_id)
-
-            # Merge all data
-            movie.reviews = reviews
-            movie.total_reviews = total_reviews
-            movie.credits = credits
-            movie.videos = videos
+            # Fetch details, reviews, credits and videos in one round trip
+            data = await self._make_request(f"/movie/{movie_id}", {
+                "append_to_response": ",".join(self.DETAIL_APPENDS)
+            })
+            reviews_data = data.get("reviews") or {}
+            credits_data = data.get("credits") or {}
+            videos_data = data.get("videos") or {}
+
+            # Create base movie object from the non-appended fields
+            movie_data = {key: value for key, value in data.items()
+                          if key not in self.DETAIL_APPENDS}
+            movie_data["id"] = str(data["id"])
+            movie_data["genres"] = self._resolve_genres(data)
+            movie = TMDBMovieDetailResponse(**movie_data)
+
+            # Split the appended payloads (they carry no id of their own)
+            movie.reviews = [TMDBReview(**review)
+                             for review in reviews_data.get("results", [])]
+            movie.total_reviews = reviews_data.get("total_results", 0)
+            movie.credits = TMDBMovieCreditsResponse(
+                **{"cast": [], "crew": [], **credits_data, "id": data["id"]})
+            movie.videos = self._build_videos_response(
+                {**videos_data, "id": data["id"]})
 
             return movie
         except Exception as e:
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List
+
+from src.config import settings
+from src.services.tmdb_genres import genre_registry
+from src.services.tmdb_service import TMDBService
+
+logger = logging.getLogger(__name__)
+
+
+class TMDBCacheWarmer:
+    """Keep the home page TMDB lists and the genre list cached
+
+    The first ``pages`` pages of the popular, top rated and now playing
+    lists are refetched every ``list_interval`` seconds, before their cache
+    entries go stale, so list requests are served from the cache. The genre
+    list is refetched every ``genre_interval`` seconds and reloaded into the
+    process-wide genre registry.
+    """
+
+    LIST_ENDPOINTS = ("/movie/popular", "/movie/top_rated", "/movie/now_playing")
+    GENRE_ENDPOINT = "/genre/movie/list"
+
+    def __init__(
+        self,
+        pages: int = settings.TMDB_WARMER_PAGES,
+        list_interval: float = settings.TMDB_WARMER_LIST_INTERVAL,
+        genre_interval: float = settings.TMDB_GENRE_REFRESH_INTERVAL
+    ):
+        self.pages = pages
+        self.list_interval = list_interval
+        self.genre_interval = genre_interval
+        self._tasks: List[asyncio.Task] = []
+
+    async def warm_lists(self, tmdb_service: TMDBService):
+        """Refetch the first pages of every list"""
+        requests = [
+            (endpoint, {"page": page})
+            for endpoint in self.LIST_ENDPOINTS
+            for page in range(1, self.pages + 1)
+        ]
+        results = await asyncio.gather(
+            *(tmdb_service.refresh_cache(endpoint, params) for endpoint, params in requests),
+            return_exceptions=True
+        )
+        failed = sum(1 for result in results if isinstance(result, Exception))
+        if failed:
+            logger.warning(f"Cache warmer failed to refresh {failed}/{len(requests)} list pages")
+
+    async def warm_genres(self, tmdb_service: TMDBService):
+        """Refetch the genre list and reload the genre registry from it"""
+        await tmdb_service.refresh_cache(self.GENRE_ENDPOINT)
+        await genre_registry.refresh(tmdb_service)
+
+    def start(self, tmdb_service: TMDBService):
+        """Start warming lists now and genres after the first interval"""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._run_periodically(
+                self.warm_lists, tmdb_service, self.list_interval, run_now=True)),
+            asyncio.create_task(self._run_periodically(
+                self.warm_genres, tmdb_service, self.genre_interval, run_now=False)),
+        ]
+
+    async def stop(self):
+        """Stop warming"""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    async def _run_periodically(
+        self,
+        job: Callable[[TMDBService], Awaitable[None]],
+        tmdb_service: TMDBService,
+        interval: float,
+        run_now: bool
+    ):
+        if not run_now:
+            await asyncio.sleep(interval)
+        while True:
+            try:
+                await job(tmdb_service)
+            except Exception as e:
+                logger.warning(f"Cache warmer job {job.__name__} failed: {str(e)}")
+            await asyncio.sleep(interval)
+
+
+tmdb_warmer = TMDBCacheWarmer()
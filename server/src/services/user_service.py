@@ -1,6 +1,6 @@
 import bcrypt
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from bson import ObjectId
 from fastapi import HTTPException, status, UploadFile
 from src.database.connection import mongo
@@ -338,6 +338,28 @@ class UserService:
                 detail=f"Error listing users: {str(e)}"
             )
 
+    async def stream_users(self, skip: int = 0, limit: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream users from the database cursor. Password hashes are never read.
+
+        Args:
+            skip: Number of users to skip
+            limit: Maximum number of users to return
+
+        Yields:
+            User dictionaries with the same fields as list_users
+        """
+        projection = {field: 1 for field in (
+            "email", "username", "is_active", "is_superuser", "created_at", "updated_at",
+            "last_login", "avatar_url", "bio", "watchlists", "reviews")}
+        users = self.user_repository.iter_many(
+            {}, skip=skip, limit=limit, batch_size=settings.NDJSON_BATCH_SIZE,
+            projection=projection)
+        async for user in users:
+            user["id"] = str(user.pop("_id"))
+            user.setdefault("is_superuser", False)
+            yield user
+
     async def get_all_users(self) -> List[User]:
         return await self.user_repository.get_all()
 
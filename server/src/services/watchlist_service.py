@@ -1,6 +1,7 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 from fastapi import HTTPException, status
+from src.config import settings
 from src.database.repositories.watchlist import WatchlistRepository
 from src.models.watchlist import (WatchlistCreate, WatchlistMovie,
                                   WatchlistUpdate)
@@ -33,10 +34,21 @@ class WatchlistService:
                 detail=f"Error creating watchlist: {str(e)}"
             )
 
-    async def get_watchlist(self, watchlist_id: str, user_id: str) -> Dict[str, Any]:
-        """Get a watchlist by ID"""
+    async def get_watchlist(
+        self,
+        watchlist_id: str,
+        user_id: str,
+        fields: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """Get a watchlist by ID, optionally only some of its fields (and its ``_id``)"""
         try:
-            watchlist = await self.watchlist_repository.get_by_id(watchlist_id)
+            projection = None
+            if fields is not None:
+                # The access check needs the owner and visibility
+                fields = set(fields)
+                projection = WatchlistRepository.fields_projection(
+                    fields | {"user_id", "is_public"})
+            watchlist = await self.watchlist_repository.get_by_id(watchlist_id, projection)
             if not watchlist:
                 raise ResourceNotFoundError("Watchlist not found")
 
@@ -45,6 +57,9 @@ class WatchlistService:
                 raise UnauthorizedError(
                     "Not authorized to access this watchlist")
 
+            if fields is not None:
+                return {key: value for key, value in watchlist.items()
+                        if key == "_id" or key in fields}
             return watchlist
         except (ResourceNotFoundError, UnauthorizedError) as e:
             raise HTTPException(
@@ -58,16 +73,35 @@ class WatchlistService:
                 detail=f"Error retrieving watchlist: {str(e)}"
             )
 
-    async def get_user_watchlists(self, user_id: str, skip: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get all watchlists for a user"""
+    async def get_user_watchlists(
+        self,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 10,
+        fields: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get all watchlists for a user, optionally only some of their fields"""
         try:
-            return await self.watchlist_repository.get_by_user_id(user_id, skip, limit)
+            return await self.watchlist_repository.get_by_user_id(
+                user_id, skip, limit, WatchlistRepository.fields_projection(fields))
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error retrieving user watchlists: {str(e)}"
             )
 
+    def stream_user_watchlists(
+        self,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 10,
+        fields: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a user's watchlists from the database cursor"""
+        return self.watchlist_repository.iter_watchlists(
+            {"user_id": user_id}, skip, limit, batch_size=settings.NDJSON_BATCH_SIZE,
+            projection=WatchlistRepository.fields_projection(fields))
+
     async def update_watchlist(self, watchlist_id: str, user_id: str, watchlist: WatchlistUpdate) -> Dict[str, Any]:
         """Update a watchlist"""
         try:
@@ -180,12 +214,29 @@ class WatchlistService:
                 detail=f"Error removing movie from watchlist: {str(e)}"
             )
 
-    async def get_public_watchlists(self, skip: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get public watchlists"""
+    async def get_public_watchlists(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        fields: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get public watchlists, optionally only some of their fields"""
         try:
-            return await self.watchlist_repository.get_public_watchlists(skip, limit)
+            return await self.watchlist_repository.get_public_watchlists(
+                skip, limit, WatchlistRepository.fields_projection(fields))
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error retrieving public watchlists: {str(e)}"
             )
+
+    def stream_public_watchlists(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        fields: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream public watchlists from the database cursor"""
+        return self.watchlist_repository.iter_watchlists(
+            {"is_public": True}, skip, limit, batch_size=settings.NDJSON_BATCH_SIZE,
+            projection=WatchlistRepository.fields_projection(fields))
@@ -1,6 +1,7 @@
 from .exceptions import (DatabaseError, ExternalAPIError, MovieError,
                          MovieNotFoundError, RateLimitError, UnauthorizedError,
                          ValidationError)
+from .singleflight import SingleFlight
 
 __all__ = [
     'MovieError',
@@ -9,5 +10,6 @@ __all__ = [
     'RateLimitError',
     'ValidationError',
     'DatabaseError',
-    'ExternalAPIError'
+    'ExternalAPIError',
+    'SingleFlight'
 ]
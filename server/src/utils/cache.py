@@ -0,0 +1,132 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+import orjson
+
+
+class CacheEntry:
+    """A cached value with its size and expiry times
+
+    An entry is fresh until ``stale_at`` (its soft TTL) and may still be
+    served as stale data until ``expires_at`` (its hard TTL).
+    """
+
+    __slots__ = ("value", "size", "stale_at", "expires_at")
+
+    def __init__(self, value: Any, size: int, stale_at: float, expires_at: float):
+        self.value = value
+        self.size = size
+        self.stale_at = stale_at
+        self.expires_at = expires_at
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the soft TTL has passed"""
+        return time.monotonic() >= self.stale_at
+
+
+class TTLCache:
+    """In-memory cache with per-entry TTLs, a byte budget and LRU eviction"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+    @staticmethod
+    def estimate_size(value: Any) -> int:
+        """Estimate the memory footprint of a value by its JSON length"""
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        return len(orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS))
+
+    def get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        """Get an entry, fresh or stale, or None when the key is missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        if entry.is_stale:
+            self.stale_hits += 1
+        return entry
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a fresh value, or None when the key is missing, stale or expired"""
+        entry = self.get_entry(key)
+        if entry is None or entry.is_stale:
+            return None
+        return entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: float,
+        max_stale: float = 0.0,
+        size: Optional[int] = None
+    ) -> CacheEntry:
+        """Store a value, evicting least recently used entries
+
+        The value is fresh for ``ttl`` seconds and may be served stale for
+        ``max_stale`` seconds after that.
+        """
+        size = size if size is not None else self.estimate_size(value)
+        now = time.monotonic()
+        entry = CacheEntry(value, size, now + ttl, now + ttl + max_stale)
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            return entry
+        self._entries[key] = entry
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        return entry
+
+    def delete(self, key: Hashable):
+        """Remove a key if present"""
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self):
+        """Remove every entry"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and usage for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.expires_at > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,43 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one in-flight task
+
+    The first caller for a key starts the task; later callers for the same key
+    await that task instead of starting their own. Results and exceptions are
+    shared by every caller. Each caller awaits the task through
+    ``asyncio.shield`` so a cancelled caller never cancels the shared work.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` for ``key`` unless a call for the same key is already in flight"""
+        task = self._inflight.get(key)
+        # A finished task may still be registered until its done callback runs
+        if task is None or task.done():
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        """Drop a finished task and mark its exception as retrieved"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Avoid "exception was never retrieved" warnings when every caller left
+            task.exception()
+
+    def is_inflight(self, key: Hashable) -> bool:
+        """Check whether a call for ``key`` is currently running"""
+        task = self._inflight.get(key)
+        return task is not None and not task.done()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
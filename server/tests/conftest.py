@@ -3,6 +3,9 @@ from unittest.mock import patch
 
 import pytest
 
+# Settings are read when test modules import src, before fixtures run
+os.environ.setdefault("JWT_SECRET_KEY", "test_jwt_secret_key")
+
 
 @pytest.fixture(autouse=True)
 def setup_test_env():
@@ -0,0 +1,86 @@
+import json
+import os
+from typing import Any, Dict, List
+
+import pytest
+
+from src.services.catalog_ingest_service import CatalogIngestService
+
+EXPORT_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "movie_ids_sample.json.gz")
+# Valid rows of the fixture, in file order; it also holds a truncated line,
+# a row without an ID and a blank line
+EXPORT_IDS = [3924, 6124, 8773, 25449, 2, 3, 5]
+
+
+class FakeMovieRepository:
+    """Records export rows written in bulk, optionally failing after some batches"""
+
+    def __init__(self, fail_after: int = -1):
+        self.batches: List[List[Dict[str, Any]]] = []
+        self.fail_after = fail_after
+
+    async def bulk_upsert_export_rows(self, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        if len(self.batches) == self.fail_after:
+            raise ConnectionError("database unavailable")
+        self.batches.append(rows)
+        return {"upserted": len(rows), "modified": 0}
+
+    @property
+    def ids(self) -> List[int]:
+        return [row["id"] for batch in self.batches for row in batch]
+
+
+async def test_ingest_parses_rows_and_skips_malformed_lines():
+    repository = FakeMovieRepository()
+
+    stats = await CatalogIngestService(repository).ingest_export(EXPORT_PATH)
+
+    assert repository.ids == EXPORT_IDS
+    assert stats["rows"] == len(EXPORT_IDS)
+    assert stats["upserted"] == len(EXPORT_IDS)
+    assert stats["invalid"] == 2
+    assert repository.batches[0][1] == {
+        "adult": False, "id": 6124, "original_title": "Der Mann ohne Namen",
+        "popularity": 0.9, "video": False
+    }
+
+
+async def test_ingest_writes_rows_in_batches(tmp_path):
+    repository = FakeMovieRepository()
+    checkpoint_path = str(tmp_path / "ingest.checkpoint")
+
+    stats = await CatalogIngestService(repository).ingest_export(
+        EXPORT_PATH, batch_size=3, checkpoint_path=checkpoint_path)
+
+    assert [len(batch) for batch in repository.batches] == [3, 3, 1]
+    with open(checkpoint_path) as f:
+        checkpoint = json.load(f)
+    assert checkpoint == {
+        "path": os.path.abspath(EXPORT_PATH), "offset": stats["offset"], "rows": 7}
+
+
+async def test_ingest_resumes_from_checkpoint(tmp_path):
+    checkpoint_path = str(tmp_path / "ingest.checkpoint")
+    failing = FakeMovieRepository(fail_after=2)
+
+    with pytest.raises(ConnectionError):
+        await CatalogIngestService(failing).ingest_export(
+            EXPORT_PATH, batch_size=3, checkpoint_path=checkpoint_path)
+    offset = CatalogIngestService.load_checkpoint(checkpoint_path, EXPORT_PATH)
+    assert offset > 0
+
+    repository = FakeMovieRepository()
+    stats = await CatalogIngestService(repository).ingest_export(
+        EXPORT_PATH, batch_size=3, checkpoint_path=checkpoint_path)
+
+    # Only the batch that failed is read again
+    assert failing.ids + repository.ids == EXPORT_IDS
+    assert stats["start_offset"] == offset
+    assert stats["rows"] == 1
+
+
+def test_checkpoint_of_another_file_is_ignored(tmp_path):
+    checkpoint_path = str(tmp_path / "ingest.checkpoint")
+    CatalogIngestService.save_checkpoint(checkpoint_path, str(tmp_path / "other.json.gz"), 120, 3)
+
+    assert CatalogIngestService.load_checkpoint(checkpoint_path, EXPORT_PATH) == 0
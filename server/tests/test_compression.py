@@ -0,0 +1,91 @@
+from typing import List
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+
+from src.api.compression import ENCODINGS, CompressionMiddleware, negotiate_encoding
+from src.api.responses import cached_response
+
+TITLES = [f"Movie title number {i}" for i in range(200)]
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+
+@app.get("/cached/{name}")
+async def cached(request: Request, name: str):
+    async def produce():
+        return TITLES
+
+    return await cached_response(request, List[str], 60, produce)
+
+
+@app.get("/small")
+async def small():
+    return ORJSONResponse(["tiny"])
+
+
+@app.get("/large")
+async def large():
+    return ORJSONResponse(TITLES)
+
+
+client = TestClient(app)
+
+
+def test_negotiation_follows_client_preferences():
+    assert negotiate_encoding("gzip") == "gzip"
+    assert negotiate_encoding("deflate, gzip;q=0.5") == "gzip"
+    assert negotiate_encoding("*") == ENCODINGS[0]
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("") is None
+
+
+def test_br_is_preferred_when_available():
+    pytest.importorskip("brotli")
+    assert negotiate_encoding("gzip, br") == "br"
+    assert negotiate_encoding("gzip, br;q=0.1") == "gzip"
+
+
+def test_cached_payload_is_sent_as_its_gzip_variant():
+    plain = client.get("/cached/gzip", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/cached/gzip", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in plain.headers
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    # Both variants share the body hash; the compressed one is weak
+    assert compressed.headers["etag"] == f"W/{plain.headers['etag']}"
+    # The client decodes the body
+    assert compressed.json() == TITLES
+
+
+def test_cached_payload_is_sent_as_its_br_variant():
+    pytest.importorskip("brotli")
+    response = client.get("/cached/br", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.json() == TITLES
+
+
+def test_compressed_variant_is_not_modified_for_either_etag():
+    plain = client.get("/cached/etag", headers={"Accept-Encoding": "identity"})
+
+    response = client.get("/cached/etag", headers={
+        "Accept-Encoding": "gzip", "If-None-Match": plain.headers["etag"]})
+
+    assert response.status_code == 304
+    assert response.headers["etag"].startswith("W/")
+
+
+def test_middleware_compresses_only_large_bodies():
+    small_response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    large_response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in small_response.headers
+    assert small_response.headers["vary"] == "Accept-Encoding"
+    assert large_response.headers["content-encoding"] == "gzip"
+    assert large_response.json() == TITLES
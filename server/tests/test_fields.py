@@ -0,0 +1,84 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from src.api.responses import parse_fields
+from src.api.routes import movies
+from src.database.repositories.movie import MovieRepository
+from src.main import app
+from src.models import TMDBMovieResponse
+
+ALLOWED = ["id", "overview", "poster_path", "title"]
+
+
+class FakeMovieService:
+    def __init__(self):
+        self.fields = []
+
+    async def search_movies(self, **params):
+        self.fields.append(params["fields"])
+        return [TMDBMovieResponse(
+            id="1", title="Heat", original_title="Heat", overview="A heist.", poster_path="/heat.jpg")]
+
+
+@pytest.fixture
+def movie_service():
+    service = FakeMovieService()
+    app.dependency_overrides[movies.get_movie_service] = lambda: service
+    yield service
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_fields_are_parsed_and_trimmed():
+    assert parse_fields(None, ALLOWED) is None
+    assert parse_fields("id,title", ALLOWED) == {"id", "title"}
+    assert parse_fields(" id , title,,id ", ALLOWED) == {"id", "title"}
+
+
+@pytest.mark.parametrize("fields", ["", " , ", "id,budget"])
+def test_empty_or_unknown_fields_are_rejected(fields):
+    with pytest.raises(HTTPException) as error:
+        parse_fields(fields, ALLOWED)
+
+    assert error.value.status_code == 400
+    assert "Available fields: id, overview, poster_path, title" in error.value.detail
+
+
+def test_response_projection_loads_the_stored_sources():
+    projection = MovieRepository.response_projection({"id", "genres", "poster_path"})
+
+    assert projection == {
+        "_id": 0, "genre_ids": 1, "genres": 1, "original_title": 1,
+        "poster_path": 1, "tmdb_id": 1, "title": 1
+    }
+    assert MovieRepository.response_projection(None) is None
+
+
+def test_search_sends_only_the_selected_fields(client, movie_service):
+    response = client.get("/movies/movies/search?q=heat-fields&fields=id,title")
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": "1", "title": "Heat"}]
+    assert movie_service.fields == [{"id", "title"}]
+
+
+def test_search_with_unknown_fields_is_a_bad_request(client, movie_service):
+    response = client.get("/movies/movies/search?q=heat-fields&fields=id,budget")
+
+    assert response.status_code == 400
+    assert "budget" in response.json()["detail"]
+    assert movie_service.fields == []
+
+
+def test_different_fields_are_cached_apart(client, movie_service):
+    trimmed = client.get("/movies/movies/search?q=heat-apart&fields=id")
+    full = client.get("/movies/movies/search?q=heat-apart")
+
+    assert trimmed.json() == [{"id": "1"}]
+    assert full.json()[0]["overview"] == "A heist."
+    assert trimmed.headers["etag"] != full.headers["etag"]
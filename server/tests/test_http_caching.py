@@ -0,0 +1,133 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.routes import movies, reviews
+from src.main import app
+from src.models import TMDBMovieResponse, TMDBReview
+
+
+class FakeReviewService:
+    """Review service whose data the tests change between requests"""
+
+    def __init__(self):
+        self.version = (1, datetime(2025, 1, 1, 12, 0))
+        self.tmdb_content = "A classic."
+        self.tmdb_failed = False
+        self.loads = 0
+
+    async def get_movie_reviews_version(self, movie_id):
+        return self.version
+
+    async def get_tmdb_reviews(self, movie_id, skip=0, limit=10):
+        if self.tmdb_failed:
+            return None
+        review = TMDBReview(
+            id="r1", author="critic", content=self.tmdb_content, created_at="2025-01-01T00:00:00Z")
+        return [review], 1
+
+    async def get_movie_reviews(self, movie_id, skip=0, limit=10, include_tmdb=True,
+                                fields=None, tmdb_reviews=None):
+        self.loads += 1
+        return {
+            "user_reviews": [{"_id": "u1", "rating": 8}],
+            "tmdb_reviews": [review.model_dump() for review in (tmdb_reviews or ([], 0))[0]],
+        }
+
+
+class FakeMovieService:
+    def __init__(self):
+        self.searches = 0
+
+    async def search_movies(self, **params):
+        self.searches += 1
+        return [TMDBMovieResponse(id="1", title="Heat", original_title="Heat")]
+
+
+@pytest.fixture
+def review_service():
+    service = FakeReviewService()
+    app.dependency_overrides[reviews.get_review_service] = lambda: service
+    yield service
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_unchanged_reviews_get_304_without_loading(client, review_service):
+    first = client.get("/reviews/603/reviews")
+    assert first.status_code == 200
+    assert first.headers["cache-control"].startswith("public")
+    # TMDB data has no modification time
+    assert "last-modified" not in first.headers
+
+    second = client.get("/reviews/603/reviews", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
+    assert review_service.loads == 1
+
+
+def test_refreshed_tmdb_reviews_change_the_etag(client, review_service):
+    first = client.get("/reviews/603/reviews")
+    review_service.tmdb_content = "A classic, revisited."
+
+    second = client.get("/reviews/603/reviews", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.json()["tmdb_reviews"][0]["content"] == "A classic, revisited."
+
+
+def test_changed_user_reviews_change_the_etag(client, review_service):
+    first = client.get("/reviews/603/reviews")
+    review_service.version = (2, datetime(2025, 1, 2, 12, 0))
+
+    second = client.get("/reviews/603/reviews", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+def test_reviews_without_tmdb_send_last_modified(client, review_service):
+    first = client.get("/reviews/603/reviews?include_tmdb=false")
+    assert "last-modified" in first.headers
+
+    second = client.get(
+        "/reviews/603/reviews?include_tmdb=false",
+        headers={"If-Modified-Since": first.headers["last-modified"]})
+
+    assert second.status_code == 304
+    assert review_service.loads == 1
+
+
+def test_fallback_without_tmdb_reviews_is_not_reused(client, review_service):
+    first = client.get("/reviews/603/reviews")
+    review_service.tmdb_failed = True
+
+    second = client.get("/reviews/603/reviews", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 200
+    assert second.json()["tmdb_reviews"] == []
+    assert second.headers["cache-control"] == "no-store"
+    assert "etag" not in second.headers
+
+
+def test_repeated_search_gets_304_without_searching(client):
+    service = FakeMovieService()
+    app.dependency_overrides[movies.get_movie_service] = lambda: service
+    try:
+        first = client.get("/movies/movies/search?q=heat-304")
+        second = client.get(
+            "/movies/movies/search?q=heat-304", headers={"If-None-Match": first.headers["etag"]})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == 200
+    assert first.json()[0]["title"] == "Heat"
+    assert second.status_code == 304
+    assert service.searches == 1
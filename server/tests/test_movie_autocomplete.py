@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from src.services.movie_autocomplete import MovieAutocompleteIndex, normalize
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeMovieRepository:
+    """Serves suggestion fields from in-memory documents"""
+
+    def __init__(self):
+        self.docs: Dict[str, Dict[str, Any]] = {}
+        self.full_loads = 0
+        self._clock = START
+
+    def write(self, tmdb_id: int, title: str, popularity: float, adult: bool = False):
+        self._clock += timedelta(seconds=1)
+        self.docs[str(tmdb_id)] = {
+            "tmdb_id": str(tmdb_id), "title": title, "popularity": popularity,
+            "adult": adult, "catalog_updated_at": self._clock
+        }
+
+    async def iter_suggestion_fields(
+        self,
+        updated_since: Optional[datetime] = None,
+        limit: int = 0
+    ):
+        if updated_since is None:
+            self.full_loads += 1
+        docs = [doc for doc in self.docs.values()
+                if updated_since is None or doc["catalog_updated_at"] >= updated_since]
+        for doc in docs[:limit] if limit else docs:
+            yield dict(doc)
+
+
+def ids(results: List[Dict[str, Any]]) -> List[str]:
+    return [result["id"] for result in results]
+
+
+def test_normalize_strips_accents_and_punctuation():
+    assert normalize("  Amélie: Le Fabuleux-Destin! ") == "amelie le fabuleux destin"
+
+
+async def test_whole_title_matches_rank_before_popular_word_matches():
+    repository = FakeMovieRepository()
+    repository.write(1, "The Dark Knight", 90.0)
+    repository.write(2, "Dark City", 10.0)
+    repository.write(3, "Darkman", 50.0)
+    repository.write(4, "Knight and Day", 70.0)
+    repository.write(5, "Dark Secrets", 30.0, adult=True)
+    index = MovieAutocompleteIndex(max_results=10, cache_size=10)
+    await index.load(repository)
+
+    assert ids(index.search("dark")) == ["3", "2", "1"]
+    assert ids(index.search("knight")) == ["4", "1"]
+    assert ids(index.search("dark", limit=1)) == ["3"]
+    assert index.search("  ") == []
+
+
+async def test_load_indexes_documents_in_batches():
+    repository = FakeMovieRepository()
+    for tmdb_id in range(7):
+        repository.write(tmdb_id, f"Movie {tmdb_id}", float(tmdb_id))
+    index = MovieAutocompleteIndex(max_results=10, cache_size=10)
+    index.LOAD_BATCH = 3
+
+    await index.load(repository)
+
+    assert len(index) == 7
+    assert ids(index.search("movie")) == ["6", "5", "4", "3", "2", "1", "0"]
+
+
+async def test_pinned_ranking_follows_upserts_and_removals():
+    repository = FakeMovieRepository()
+    for tmdb_id in range(5):
+        repository.write(tmdb_id, f"Star {tmdb_id}", float(tmdb_id))
+    index = MovieAutocompleteIndex(max_results=3, cache_size=10)
+    # Pin every prefix, as the busiest real prefixes are
+    index.HEAVY_RANGE = 1
+    await index.load(repository)
+    assert ids(index.search("st")) == ["4", "3", "2"]
+    assert "st" in index._pinned
+
+    index.upsert({"tmdb_id": "0", "title": "Star 0", "popularity": 100.0})
+    assert ids(index.search("st")) == ["0", "4", "3"]
+
+    index.upsert({"tmdb_id": "9", "title": "Stardust", "popularity": 50.0})
+    assert ids(index.search("st")) == ["0", "9", "4"]
+
+    index.remove("0")
+    assert ids(index.search("st")) == ["9", "4", "3"]
+
+    # A retitled movie leaves the rankings of its old title
+    index.upsert({"tmdb_id": "9", "title": "Moondust", "popularity": 50.0})
+    assert ids(index.search("st")) == ["4", "3", "2"]
+    assert ids(index.search("moon")) == ["9"]
+
+
+async def test_cached_ranking_is_dropped_after_a_change():
+    repository = FakeMovieRepository()
+    repository.write(1, "Arrival", 10.0)
+    repository.write(2, "Arrietty", 20.0)
+    index = MovieAutocompleteIndex(max_results=10, cache_size=10)
+    await index.load(repository)
+    assert ids(index.search("arr")) == ["2", "1"]
+    assert "arr" in index._ranked
+
+    index.upsert({"tmdb_id": "1", "title": "Arrival", "popularity": 30.0})
+    assert ids(index.search("arr")) == ["1", "2"]
+
+    index.upsert({"tmdb_id": "2", "title": "Arrietty", "popularity": 5.0, "adult": True})
+    assert ids(index.search("arr")) == ["1"]
+
+
+async def test_small_sync_is_applied_in_place():
+    repository = FakeMovieRepository()
+    repository.write(1, "Alien", 10.0)
+    index = MovieAutocompleteIndex(max_results=10, cache_size=10, sync_batch=5)
+    await index.sync(repository)
+
+    repository.write(2, "Aliens", 20.0)
+    await index.sync(repository)
+
+    assert ids(index.search("alien")) == ["2", "1"]
+    assert repository.full_loads == 1
+
+
+async def test_large_sync_rebuilds_the_index():
+    repository = FakeMovieRepository()
+    repository.write(1, "Alien", 10.0)
+    index = MovieAutocompleteIndex(max_results=10, cache_size=10, sync_batch=2)
+    await index.sync(repository)
+
+    for tmdb_id in range(2, 6):
+        repository.write(tmdb_id, f"Alien {tmdb_id}", float(tmdb_id))
+    await index.sync(repository)
+
+    assert len(index) == 5
+    assert repository.full_loads == 2
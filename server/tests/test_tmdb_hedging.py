@@ -0,0 +1,54 @@
+import asyncio
+
+from src.services.tmdb_hedging import RequestHedger
+
+
+async def test_no_hedge_without_enough_samples():
+    hedger = RequestHedger(enabled=True, percentile=50, min_delay=0.0, min_samples=4, window=100)
+    calls = []
+
+    async def send():
+        calls.append(1)
+        return "ok"
+
+    assert await hedger.run(send, lambda: True) == "ok"
+    assert len(calls) == 1
+    assert hedger.hedges_sent == 0
+
+
+async def test_slow_call_is_hedged_and_loser_is_recorded():
+    hedger = RequestHedger(enabled=True, percentile=50, min_delay=0.0, min_samples=4, window=100)
+    for _ in range(4):
+        hedger.record(0.01)
+    calls = []
+
+    async def send():
+        calls.append(1)
+        await asyncio.sleep(0.3 if len(calls) == 1 else 0.02)
+        return len(calls)
+
+    assert await hedger.run(send, lambda: True) == 2
+    await asyncio.sleep(0)
+
+    assert hedger.hedges_sent == 1
+    assert hedger.hedges_won == 1
+    # The winner and the cancelled primary are both recorded; the primary's
+    # elapsed time at cancellation keeps the tail in the window
+    assert hedger.stats()["samples"] == 6
+    assert max(hedger._latencies) >= 0.02
+
+
+async def test_no_hedge_when_token_is_refused():
+    hedger = RequestHedger(enabled=True, percentile=50, min_delay=0.0, min_samples=4, window=100)
+    for _ in range(4):
+        hedger.record(0.01)
+    calls = []
+
+    async def send():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "slow"
+
+    assert await hedger.run(send, lambda: False) == "slow"
+    assert len(calls) == 1
+    assert hedger.hedges_sent == 0
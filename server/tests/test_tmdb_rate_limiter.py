@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from src.services.tmdb_rate_limiter import TMDBRateLimiter
+
+INTERACTIVE, PREFETCH, BULK = TMDBRateLimiter.LANES
+NO_RESERVES = {INTERACTIVE: 0.0, PREFETCH: 0.0, BULK: 0.0}
+
+
+def test_lower_lanes_leave_their_reserve():
+    # Slow refill, so the burst is all there is during the test
+    limiter = TMDBRateLimiter(0.01, 5, {INTERACTIVE: 0.0, PREFETCH: 2.0, BULK: 4.0})
+
+    assert limiter.try_acquire(BULK)
+    assert not limiter.try_acquire(BULK)
+    assert limiter.try_acquire(PREFETCH)
+    assert limiter.try_acquire(PREFETCH)
+    assert not limiter.try_acquire(PREFETCH)
+    assert limiter.try_acquire(INTERACTIVE)
+    assert limiter.try_acquire(INTERACTIVE)
+    assert not limiter.try_acquire(INTERACTIVE)
+
+
+async def test_waiting_calls_are_granted_in_lane_order():
+    limiter = TMDBRateLimiter(50, 1, NO_RESERVES)
+    assert limiter.try_acquire(INTERACTIVE)
+    granted = []
+
+    async def call(lane):
+        await limiter.acquire(lane)
+        granted.append(lane)
+
+    tasks = []
+    # Queued lowest priority first
+    for lane in (BULK, PREFETCH, INTERACTIVE):
+        tasks.append(asyncio.create_task(call(lane)))
+        await asyncio.sleep(0)
+    # A new call may not jump ahead of queued calls in its lane or above
+    assert not limiter.try_acquire(BULK)
+
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+    assert granted == [INTERACTIVE, PREFETCH, BULK]
+    stats = limiter.stats()["lanes"]
+    assert stats[BULK]["queued"] == 1
+    assert stats[BULK]["max_wait"] >= stats[INTERACTIVE]["max_wait"]
+
+
+async def test_cancelled_waiter_does_not_hold_up_the_queue():
+    limiter = TMDBRateLimiter(50, 1, NO_RESERVES)
+    assert limiter.try_acquire(INTERACTIVE)
+
+    cancelled = asyncio.create_task(limiter.acquire(INTERACTIVE))
+    waiting = asyncio.create_task(limiter.acquire(BULK))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await asyncio.wait_for(waiting, timeout=1)
+    assert limiter.stats()["lanes"][INTERACTIVE]["queue_depth"] == 0
+
+
+def test_reserve_the_burst_cannot_cover_is_rejected():
+    with pytest.raises(ValueError):
+        TMDBRateLimiter(50, 10, {**NO_RESERVES, PREFETCH: 10.0})
+    TMDBRateLimiter(50, 10, {**NO_RESERVES, PREFETCH: 9.0})
+
+
+def test_unknown_lane_is_rejected():
+    with pytest.raises(ValueError):
+        TMDBRateLimiter(50, 1, NO_RESERVES).try_acquire("background")
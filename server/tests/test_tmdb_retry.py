@@ -0,0 +1,75 @@
+from typing import List, Union
+
+import httpx
+import pytest
+
+from src.services.tmdb_retry import RetryBudget, TMDBRetryPolicy
+
+
+def responses(*outcomes: Union[int, Exception]):
+    """A send function returning the given statuses or raising the given errors in turn"""
+    sent: List[int] = []
+
+    async def send() -> httpx.Response:
+        outcome = outcomes[len(sent)]
+        sent.append(1)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome)
+
+    send.sent = sent
+    return send
+
+
+async def test_transient_failures_are_retried():
+    policy = TMDBRetryPolicy(3, 0.001, 0.01, RetryBudget(0.0, 0.0, 10.0))
+    send = responses(503, httpx.ConnectTimeout("timed out"), 200)
+
+    response = await policy.run(send)
+
+    assert response.status_code == 200
+    assert len(send.sent) == 3
+    assert policy.retries == 2
+
+
+async def test_final_statuses_are_not_retried():
+    policy = TMDBRetryPolicy(3, 0.001, 0.01, RetryBudget(0.0, 0.0, 10.0))
+    send = responses(404)
+
+    assert (await policy.run(send)).status_code == 404
+    assert len(send.sent) == 1
+
+
+async def test_last_error_surfaces_when_attempts_run_out():
+    policy = TMDBRetryPolicy(2, 0.001, 0.01, RetryBudget(0.0, 0.0, 10.0))
+    send = responses(503, httpx.ConnectError("refused"))
+
+    with pytest.raises(httpx.ConnectError):
+        await policy.run(send)
+    assert len(send.sent) == 2
+
+
+async def test_retries_stop_when_the_budget_runs_out():
+    # No ratio or refill, so the budget only holds what it starts with
+    policy = TMDBRetryPolicy(3, 0.001, 0.01, RetryBudget(0.0, 0.0, 1.0))
+
+    first = responses(503, 503, 503)
+    assert (await policy.run(first)).status_code == 503
+    # One retry was covered, the second was refused
+    assert len(first.sent) == 2
+    assert policy.budget_exhausted == 1
+
+    second = responses(503, 200)
+    assert (await policy.run(second)).status_code == 503
+    assert len(second.sent) == 1
+    assert policy.stats()["budget_exhausted"] == 2
+
+
+async def test_long_retry_after_is_not_waited_for():
+    policy = TMDBRetryPolicy(3, 0.001, 0.01, RetryBudget(0.0, 0.0, 10.0))
+
+    async def send() -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "30"})
+
+    assert (await policy.run(send)).status_code == 429
+    assert policy.retries == 0
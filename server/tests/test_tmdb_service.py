@@ -0,0 +1,122 @@
+import asyncio
+import math
+
+from src.services.tmdb_rate_limiter import TMDBRateLimiter
+from src.services.tmdb_service import TMDBService
+from src.utils.cache import CacheEntry
+
+
+def fake_loads(service: TMDBService, release: asyncio.Event) -> list:
+    """Replace upstream loads with ones waiting for ``release``; returns the lanes loaded on"""
+    lanes = []
+
+    async def load(key, endpoint, params=None, priority=TMDBRateLimiter.INTERACTIVE,
+                   accept_stale=False):
+        lanes.append(priority)
+        await release.wait()
+        return CacheEntry({"lane": priority}, 0, math.inf, math.inf)
+
+    service._load = load
+    return lanes
+
+
+async def test_interactive_request_does_not_join_a_prefetch():
+    service = TMDBService()
+    release = asyncio.Event()
+    lanes = fake_loads(service, release)
+
+    prefetch = asyncio.create_task(service._make_request(
+        "/movie/910001", priority=TMDBRateLimiter.PREFETCH))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(service._make_request("/movie/910001"))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await interactive)["lane"] == TMDBRateLimiter.INTERACTIVE
+    assert (await prefetch)["lane"] == TMDBRateLimiter.PREFETCH
+    assert lanes == [TMDBRateLimiter.PREFETCH, TMDBRateLimiter.INTERACTIVE]
+
+
+async def test_prefetch_joins_an_interactive_request():
+    service = TMDBService()
+    release = asyncio.Event()
+    lanes = fake_loads(service, release)
+
+    interactive = asyncio.create_task(service._make_request("/movie/910002"))
+    await asyncio.sleep(0)
+    prefetch = asyncio.create_task(service._make_request(
+        "/movie/910002", priority=TMDBRateLimiter.PREFETCH))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await prefetch)["lane"] == TMDBRateLimiter.INTERACTIVE
+    assert (await interactive)["lane"] == TMDBRateLimiter.INTERACTIVE
+    assert lanes == [TMDBRateLimiter.INTERACTIVE]
+
+
+def fake_list(service: TMDBService, pages: dict, total_pages: int) -> list:
+    """Serve TMDB list pages from ``pages``; returns the pages prefetched"""
+    prefetched = []
+
+    async def make_request(endpoint, params=None, priority=None):
+        ids = pages[params["page"]]
+        return {
+            "results": [{"id": i, "title": f"Movie {i}", "original_title": f"Movie {i}"}
+                        for i in ids],
+            "total_pages": total_pages
+        }
+
+    async def ensure_genres():
+        pass
+
+    service._make_request = make_request
+    service._ensure_genres = ensure_genres
+    service._schedule_prefetch = lambda endpoint, params: prefetched.append(params["page"])
+    return prefetched
+
+
+def page_ids(page: int) -> list:
+    return [page * 100 + i for i in range(TMDBService.PAGE_SIZE)]
+
+
+async def test_list_window_spans_tmdb_pages():
+    service = TMDBService()
+    prefetched = fake_list(service, {1: page_ids(1), 2: page_ids(2)}, total_pages=5)
+
+    movies = await service.get_popular_movies(skip=15, limit=10)
+
+    assert [movie.id for movie in movies] == [
+        str(i) for i in page_ids(1)[15:] + page_ids(2)[:5]]
+    # The page after the window is loaded ahead of the client
+    assert prefetched == [3]
+
+
+async def test_list_window_on_page_boundary_uses_one_page():
+    service = TMDBService()
+    prefetched = fake_list(service, {2: page_ids(2)}, total_pages=2)
+
+    movies = await service.get_popular_movies(skip=20, limit=20)
+
+    assert [movie.id for movie in movies] == [str(i) for i in page_ids(2)]
+    # No page follows the last one
+    assert prefetched == []
+
+
+async def test_list_window_drops_movies_repeated_across_pages():
+    service = TMDBService()
+    # The list shifted between the two fetches, repeating movie 119 on page 2
+    second_page = [119] + page_ids(2)[:-1]
+    fake_list(service, {1: page_ids(1), 2: second_page}, total_pages=2)
+
+    movies = await service.get_popular_movies(skip=18, limit=4)
+
+    assert [movie.id for movie in movies] == ["118", "119", "200", "201"]
+
+
+async def test_list_window_past_the_last_tmdb_page_is_empty():
+    service = TMDBService()
+    fake_list(service, {}, total_pages=TMDBService.MAX_PAGE)
+
+    skip = TMDBService.MAX_PAGE * TMDBService.PAGE_SIZE
+
+    assert await service.get_popular_movies(skip=skip) == []